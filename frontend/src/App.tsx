@@ -1,4 +1,4 @@
-import { useEffect, useMemo, useState } from 'react';
+import { useEffect, useMemo, useRef, useState } from 'react';
 import {
   Alert,
   Box,
@@ -13,23 +13,31 @@ import RunDetail from './components/RunDetail';
 import RunList from './components/RunList';
 import {
   ConfigInfo,
+  Job,
   RunDetail as RunDetailType,
   RunSummary,
+  cancelJob,
   fetchConfigs,
+  fetchJob,
   fetchRun,
   fetchRuns,
+  isJobFinished,
   triggerRun
 } from './api';
 
+const JOB_POLL_INTERVAL_MS = 1000;
+
 const App = () => {
   const [configs, setConfigs] = useState<ConfigInfo[]>([]);
   const [runs, setRuns] = useState<RunSummary[]>([]);
   const [runsLoading, setRunsLoading] = useState(false);
+  const [runsCursor, setRunsCursor] = useState<string | null>(null);
   const [detailLoading, setDetailLoading] = useState(false);
   const [selectedRun, setSelectedRun] = useState<RunDetailType | null>(null);
   const [selectedRunId, setSelectedRunId] = useState<number | null>(null);
   const [selectedConfig, setSelectedConfig] = useState<string>('');
-  const [triggering, setTriggering] = useState(false);
+  const [activeJob, setActiveJob] = useState<Job | null>(null);
+  const pollTimer = useRef<number | null>(null);
   const [savePredictions, setSavePredictions] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [success, setSuccess] = useState<string | null>(null);
@@ -37,14 +45,15 @@ const App = () => {
   useEffect(() => {
     const initialize = async () => {
       try {
-        const [configData, runsData] = await Promise.all([fetchConfigs(), fetchRuns()]);
+        const [configData, runsPage] = await Promise.all([fetchConfigs(), fetchRuns()]);
         setConfigs(configData);
-        setRuns(runsData);
+        setRuns(runsPage.items);
+        setRunsCursor(runsPage.next_cursor);
         if (!selectedConfig && configData.length > 0) {
           setSelectedConfig(configData[0].name);
         }
-        if (runsData.length > 0) {
-          const runId = runsData[0].id;
+        if (runsPage.items.length > 0) {
+          const runId = runsPage.items[0].id;
           setSelectedRunId(runId);
           loadRunDetail(runId);
         }
@@ -53,13 +62,19 @@ const App = () => {
       }
     };
     initialize();
+    return () => {
+      if (pollTimer.current !== null) {
+        window.clearTimeout(pollTimer.current);
+      }
+    };
   }, []);
 
   const loadRuns = async () => {
     setRunsLoading(true);
     try {
-      const runData = await fetchRuns();
-      setRuns(runData);
+      const runsPage = await fetchRuns();
+      setRuns(runsPage.items);
+      setRunsCursor(runsPage.next_cursor);
     } catch (err) {
       setError('Failed to fetch evaluation runs.');
     } finally {
@@ -67,6 +82,17 @@ const App = () => {
     }
   };
 
+  const loadMoreRuns = async () => {
+    if (!runsCursor) return;
+    try {
+      const runsPage = await fetchRuns({ cursor: runsCursor });
+      setRuns((current) => [...current, ...runsPage.items]);
+      setRunsCursor(runsPage.next_cursor);
+    } catch (err) {
+      setError('Failed to fetch more evaluation runs.');
+    }
+  };
+
   const loadRunDetail = async (runId: number) => {
     setDetailLoading(true);
     try {
@@ -80,19 +106,56 @@ const App = () => {
     }
   };
 
+  const handleJobUpdate = async (job: Job) => {
+    setActiveJob(job);
+    if (!isJobFinished(job)) return;
+    setActiveJob(null);
+    if (job.status === 'succeeded' && job.run_id !== null) {
+      setSuccess(`Run for '${job.config_name}' completed successfully.`);
+      await Promise.all([loadRuns(), loadRunDetail(job.run_id)]);
+    } else if (job.status === 'cancelled') {
+      setSuccess(`Run for '${job.config_name}' was cancelled.`);
+    } else {
+      setError(`Evaluation failed: ${job.error ?? 'check server logs for more details.'}`);
+    }
+  };
+
+  // Fallback when the progress stream is unavailable.
+  const pollJob = async (jobId: string) => {
+    pollTimer.current = null;
+    try {
+      const job = await fetchJob(jobId);
+      await handleJobUpdate(job);
+      if (!isJobFinished(job)) {
+        pollTimer.current = window.setTimeout(() => pollJob(jobId), JOB_POLL_INTERVAL_MS);
+      }
+    } catch (err) {
+      setActiveJob(null);
+      setError('Lost track of the evaluation job. Check server logs for more details.');
+    }
+  };
+
+  const handleStreamError = () => {
+    if (activeJob && pollTimer.current === null) {
+      pollJob(activeJob.id);
+    }
+  };
+
   const handleTriggerRun = async () => {
-    if (!selectedConfig) return;
-    setTriggering(true);
+    if (!selectedConfig || activeJob) return;
     try {
-      const detail = await triggerRun(selectedConfig, savePredictions);
-      setSuccess(`Run '${detail.name}' completed successfully.`);
-      setSelectedRun(detail);
-      setSelectedRunId(detail.id);
-      await loadRuns();
+      await handleJobUpdate(await triggerRun(selectedConfig, savePredictions));
     } catch (err) {
-      setError('Failed to execute evaluation. Check server logs for more details.');
-    } finally {
-      setTriggering(false);
+      setError('Failed to queue evaluation. Check server logs for more details.');
+    }
+  };
+
+  const handleCancelRun = async () => {
+    if (!activeJob) return;
+    try {
+      setActiveJob(await cancelJob(activeJob.id));
+    } catch (err) {
+      setError('Failed to cancel the evaluation.');
     }
   };
 
@@ -124,7 +187,8 @@ const App = () => {
             selectedConfig={selectedConfig}
             onSelect={setSelectedConfig}
             onTrigger={handleTriggerRun}
-            triggering={triggering}
+            onCancel={handleCancelRun}
+            activeJob={activeJob}
             savePredictions={savePredictions}
             onSavePredictionsChange={setSavePredictions}
           />
@@ -137,10 +201,17 @@ const App = () => {
               selectedRunId={selectedRunId}
               onSelect={handleRunSelection}
               loading={runsLoading}
+              onLoadMore={runsCursor ? loadMoreRuns : undefined}
             />
           </Grid>
           <Grid item xs={12} md={8}>
-            <RunDetail run={selectedRun} loading={detailLoading} />
+            <RunDetail
+              run={selectedRun}
+              loading={detailLoading}
+              job={activeJob}
+              onJobUpdate={handleJobUpdate}
+              onJobStreamError={handleStreamError}
+            />
           </Grid>
         </Grid>
       </Stack>
@@ -46,7 +46,26 @@ export interface RunSummary {
 }
 
 export interface RunDetail extends RunSummary {
-  predictions: Prediction[];
+  output_path: string | null;
+  prediction_count: number;
+}
+
+export interface PredictionPage {
+  items: Prediction[];
+  next_cursor: string | null;
+}
+
+export type PredictionSortField = 'position' | 'uid' | 'gold' | 'predicted';
+
+export interface PredictionQuery {
+  limit?: number;
+  cursor?: string | null;
+  sort?: PredictionSortField;
+  order?: 'asc' | 'desc';
+  misclassified?: boolean;
+  gold?: string;
+  predicted?: string;
+  uid?: string;
 }
 
 export interface ConfigInfo {
@@ -60,8 +79,25 @@ export async function fetchConfigs(): Promise<ConfigInfo[]> {
   return data;
 }
 
-export async function fetchRuns(): Promise<RunSummary[]> {
-  const { data } = await apiClient.get<RunSummary[]>('/runs');
+export interface RunPage {
+  items: RunSummary[];
+  next_cursor: string | null;
+}
+
+export interface RunQuery {
+  limit?: number;
+  cursor?: string | null;
+  config_name?: string;
+  task?: string;
+  completed_after?: string;
+  completed_before?: string;
+}
+
+export async function fetchRuns(query: RunQuery = {}): Promise<RunPage> {
+  const params = Object.fromEntries(
+    Object.entries(query).filter(([, value]) => value !== undefined && value !== null && value !== '')
+  );
+  const { data } = await apiClient.get<RunPage>('/runs', { params });
   return data;
 }
 
@@ -70,11 +106,163 @@ export async function fetchRun(runId: number): Promise<RunDetail> {
   return data;
 }
 
-export async function triggerRun(config: string, savePredictions?: boolean): Promise<RunDetail> {
+export async function fetchPredictions(runId: number, query: PredictionQuery = {}): Promise<PredictionPage> {
+  const params = Object.fromEntries(
+    Object.entries(query).filter(([, value]) => value !== undefined && value !== null && value !== '')
+  );
+  const { data } = await apiClient.get<PredictionPage>(`/runs/${runId}/predictions`, { params });
+  return data;
+}
+
+export type DiffKind = 'changed' | 'fixed' | 'regressed';
+
+export interface DiffEntry {
+  uid: string;
+  inputs: Record<string, unknown>;
+  expected_output: unknown;
+  baseline_output: unknown;
+  predicted_output: unknown;
+  baseline_correct: boolean;
+  correct: boolean;
+}
+
+export interface RunDiff {
+  run_id: number;
+  baseline_id: number;
+  counts: Record<'shared' | DiffKind, number>;
+  items: DiffEntry[];
+  next_cursor: string | null;
+}
+
+export async function fetchRunDiff(
+  runId: number,
+  baselineId: number,
+  kind: DiffKind = 'changed',
+  cursor?: string | null
+): Promise<RunDiff> {
+  const params = { kind, ...(cursor ? { cursor } : {}) };
+  const { data } = await apiClient.get<RunDiff>(`/runs/${runId}/diff/${baselineId}`, { params });
+  return data;
+}
+
+export interface MetricPoint {
+  run_id: number;
+  completed_at: string;
+  value: number;
+  rolling_mean: number | null;
+}
+
+export interface MetricTimeSeries {
+  metric: string;
+  window: number | null;
+  series: Array<{ config_name: string; points: MetricPoint[] }>;
+}
+
+export interface MetricAggregate {
+  config_name: string;
+  count: number;
+  min: number;
+  max: number;
+  mean: number;
+  std: number;
+  latest: number;
+  percentiles: Record<string, number>;
+}
+
+export interface MetricHistoryQuery {
+  config_name?: string;
+  completed_after?: string;
+  completed_before?: string;
+}
+
+export async function fetchMetricSeries(
+  metric: string,
+  query: MetricHistoryQuery & { window?: number } = {}
+): Promise<MetricTimeSeries> {
+  const { data } = await apiClient.get<MetricTimeSeries>(`/metrics/${encodeURIComponent(metric)}/series`, {
+    params: query
+  });
+  return data;
+}
+
+export async function fetchMetricSummary(
+  metric: string,
+  query: MetricHistoryQuery & { percentiles?: number[] } = {}
+): Promise<{ metric: string; groups: MetricAggregate[] }> {
+  const { data } = await apiClient.get(`/metrics/${encodeURIComponent(metric)}/summary`, {
+    params: query,
+    paramsSerializer: { indexes: null }
+  });
+  return data;
+}
+
+export type JobStatus = 'queued' | 'running' | 'succeeded' | 'failed' | 'cancelled';
+
+export interface JobProgress {
+  processed: number;
+  failed: number;
+  total: number | null;
+  elapsed: number;
+  throughput: number;
+  eta: number | null;
+  metrics: Record<string, number>;
+  done: boolean;
+}
+
+export interface Job {
+  id: string;
+  status: JobStatus;
+  config_name: string;
+  config_path: string;
+  save_predictions?: boolean | null;
+  run_id: number | null;
+  error: string | null;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+  progress: JobProgress | null;
+}
+
+export const isJobFinished = (job: Job): boolean =>
+  job.status === 'succeeded' || job.status === 'failed' || job.status === 'cancelled';
+
+export async function triggerRun(config: string, savePredictions?: boolean): Promise<Job> {
   const payload: Record<string, unknown> = { config };
   if (typeof savePredictions === 'boolean') {
     payload.save_predictions = savePredictions;
   }
-  const { data } = await apiClient.post<RunDetail>('/runs', payload);
+  const { data } = await apiClient.post<Job>('/runs', payload);
+  return data;
+}
+
+export async function fetchJob(jobId: string): Promise<Job> {
+  const { data } = await apiClient.get<Job>(`/jobs/${jobId}`);
   return data;
 }
+
+export async function cancelJob(jobId: string): Promise<Job> {
+  const { data } = await apiClient.post<Job>(`/jobs/${jobId}/cancel`);
+  return data;
+}
+
+export function subscribeToJob(
+  jobId: string,
+  onUpdate: (job: Job) => void,
+  onError: () => void
+): () => void {
+  const source = new EventSource(`${apiClient.defaults.baseURL}/jobs/${jobId}/events`);
+  source.addEventListener('job', (event) => {
+    const job = JSON.parse((event as MessageEvent<string>).data) as Job;
+    onUpdate(job);
+    if (isJobFinished(job)) {
+      source.close();
+    }
+  });
+  source.onerror = () => {
+    // EventSource reconnects by itself unless the server rejected the stream.
+    if (source.readyState === EventSource.CLOSED) {
+      onError();
+    }
+  };
+  return () => source.close();
+}
@@ -11,14 +11,16 @@ import {
   Typography
 } from '@mui/material';
 import PlayArrowIcon from '@mui/icons-material/PlayArrow';
-import { ConfigInfo } from '../api';
+import StopIcon from '@mui/icons-material/Stop';
+import { ConfigInfo, Job } from '../api';
 
 interface ConfigSelectorProps {
   configs: ConfigInfo[];
   selectedConfig: string;
   onSelect: (config: string) => void;
   onTrigger: () => void;
-  triggering: boolean;
+  onCancel: () => void;
+  activeJob: Job | null;
   savePredictions: boolean;
   onSavePredictionsChange: (value: boolean) => void;
 }
@@ -28,7 +30,8 @@ const ConfigSelector: FC<ConfigSelectorProps> = ({
   selectedConfig,
   onSelect,
   onTrigger,
-  triggering,
+  onCancel,
+  activeJob,
   savePredictions,
   onSavePredictionsChange
 }) => {
@@ -72,10 +75,16 @@ const ConfigSelector: FC<ConfigSelectorProps> = ({
         variant="contained"
         startIcon={<PlayArrowIcon />}
         onClick={onTrigger}
-        disabled={!selectedConfig || triggering}
+        disabled={!selectedConfig || Boolean(activeJob)}
       >
-        {triggering ? 'Running…' : 'Run Evaluation'}
+        {activeJob ? (activeJob.status === 'queued' ? 'Queued…' : 'Running…') : 'Run Evaluation'}
       </Button>
+
+      {activeJob && (
+        <Button variant="outlined" color="warning" startIcon={<StopIcon />} onClick={onCancel}>
+          Cancel
+        </Button>
+      )}
     </Box>
   );
 };
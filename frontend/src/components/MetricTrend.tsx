@@ -0,0 +1,59 @@
+import { FC, useEffect, useState } from 'react';
+import { Box, Paper, Typography } from '@mui/material';
+import { CartesianGrid, Legend, Line, LineChart, ResponsiveContainer, Tooltip, XAxis, YAxis } from 'recharts';
+import { MetricPoint, fetchMetricSeries } from '../api';
+
+interface MetricTrendProps {
+  metric: string;
+  configName: string;
+  window?: number;
+}
+
+const MetricTrend: FC<MetricTrendProps> = ({ metric, configName, window = 5 }) => {
+  const [points, setPoints] = useState<MetricPoint[]>([]);
+
+  useEffect(() => {
+    let cancelled = false;
+    fetchMetricSeries(metric, { config_name: configName, window })
+      .then((data) => {
+        if (!cancelled) setPoints(data.series[0]?.points ?? []);
+      })
+      .catch(() => {
+        if (!cancelled) setPoints([]);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [metric, configName, window]);
+
+  if (points.length < 2) return null;
+
+  const data = points.map((point) => ({
+    completed: new Date(point.completed_at).toLocaleDateString(),
+    value: point.value,
+    rolling: point.rolling_mean
+  }));
+
+  return (
+    <Paper variant="outlined" sx={{ p: 3 }}>
+      <Typography variant="h6" gutterBottom>
+        {metric} over time · {configName}
+      </Typography>
+      <Box sx={{ width: '100%', height: 240 }}>
+        <ResponsiveContainer>
+          <LineChart data={data} margin={{ top: 16, right: 24, bottom: 0, left: 0 }}>
+            <CartesianGrid strokeDasharray="3 3" />
+            <XAxis dataKey="completed" />
+            <YAxis domain={['auto', 'auto']} />
+            <Tooltip />
+            <Legend />
+            <Line type="monotone" dataKey="value" stroke="#1976d2" name={metric} dot={false} />
+            <Line type="monotone" dataKey="rolling" stroke="#9c27b0" name={`${window}-run mean`} dot={false} />
+          </LineChart>
+        </ResponsiveContainer>
+      </Box>
+    </Paper>
+  );
+};
+
+export default MetricTrend;
@@ -1,8 +1,13 @@
-import { FC } from 'react';
+import { FC, useEffect, useState } from 'react';
 import {
   Box,
+  Button,
   Chip,
+  FormControlLabel,
+  MenuItem,
   Paper,
+  Switch,
+  TextField,
   Table,
   TableBody,
   TableCell,
@@ -10,26 +15,94 @@ import {
   TableRow,
   Typography
 } from '@mui/material';
-import { Prediction } from '../api';
+import { Prediction, PredictionSortField, fetchPredictions } from '../api';
 
 interface PredictionTableProps {
-  predictions: Prediction[];
-  limit?: number;
+  runId: number;
+  total: number;
+  pageSize?: number;
 }
 
-const PredictionTable: FC<PredictionTableProps> = ({ predictions, limit = 50 }) => {
+const SORT_OPTIONS: Array<{ value: PredictionSortField; label: string }> = [
+  { value: 'position', label: 'Dataset order' },
+  { value: 'uid', label: 'ID' },
+  { value: 'gold', label: 'Expected' },
+  { value: 'predicted', label: 'Predicted' }
+];
+
+const PredictionTable: FC<PredictionTableProps> = ({ runId, total, pageSize = 50 }) => {
+  const [predictions, setPredictions] = useState<Prediction[]>([]);
+  const [cursor, setCursor] = useState<string | null>(null);
+  const [loading, setLoading] = useState(false);
+  const [misclassified, setMisclassified] = useState(false);
+  const [sort, setSort] = useState<PredictionSortField>('position');
+  const [uid, setUid] = useState('');
+
+  const loadPage = async (reset: boolean) => {
+    setLoading(true);
+    try {
+      const page = await fetchPredictions(runId, {
+        limit: pageSize,
+        cursor: reset ? null : cursor,
+        sort,
+        misclassified: misclassified || undefined,
+        uid: uid.trim() || undefined
+      });
+      setPredictions((current) => (reset ? page.items : [...current, ...page.items]));
+      setCursor(page.next_cursor);
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  useEffect(() => {
+    setPredictions([]);
+    setCursor(null);
+    loadPage(true);
+  }, [runId, misclassified, sort, uid]);
+
+  const filters = (
+    <Box display="flex" alignItems="center" gap={2} flexWrap="wrap" mb={2}>
+      <FormControlLabel
+        control={
+          <Switch checked={misclassified} onChange={(event) => setMisclassified(event.target.checked)} size="small" />
+        }
+        label="Misclassified only"
+      />
+      <TextField
+        select
+        size="small"
+        label="Sort by"
+        value={sort}
+        onChange={(event) => setSort(event.target.value as PredictionSortField)}
+        sx={{ minWidth: 160 }}
+      >
+        {SORT_OPTIONS.map((option) => (
+          <MenuItem key={option.value} value={option.value}>
+            {option.label}
+          </MenuItem>
+        ))}
+      </TextField>
+      <TextField size="small" label="ID" value={uid} onChange={(event) => setUid(event.target.value)} />
+      <Typography variant="body2" color="text.secondary">
+        Showing {predictions.length} of {total}
+      </Typography>
+    </Box>
+  );
+
   if (!predictions.length) {
     return (
-      <Paper variant="outlined" sx={{ p: 3 }}>
-        <Typography variant="body2" color="text.secondary">
-          No predictions available for this run.
-        </Typography>
-      </Paper>
+      <>
+        {filters}
+        <Paper variant="outlined" sx={{ p: 3 }}>
+          <Typography variant="body2" color="text.secondary">
+            {loading ? 'Loading predictions…' : 'No predictions available for this run.'}
+          </Typography>
+        </Paper>
+      </>
     );
   }
 
-  const displayed = predictions.slice(0, limit);
-
   const renderConfidenceCell = (metadata: Record<string, unknown>) => {
     const probabilities = metadata?.probabilities as Record<string, number> | undefined;
     const confidence = typeof metadata?.confidence === 'number' ? (metadata.confidence as number) : undefined;
@@ -85,44 +158,54 @@ const PredictionTable: FC<PredictionTableProps> = ({ predictions, limit = 50 })
   };
 
   return (
-    <Paper variant="outlined" sx={{ overflowX: 'auto' }}>
-      <Table size="small">
-        <TableHead>
-          <TableRow>
-            <TableCell>ID</TableCell>
-            <TableCell>Text</TableCell>
-            <TableCell>Expected</TableCell>
-            <TableCell>Predicted</TableCell>
-            <TableCell>Confidence</TableCell>
-            <TableCell>Retrieved Contexts</TableCell>
-          </TableRow>
-        </TableHead>
-        <TableBody>
-          {displayed.map((prediction) => {
-            const text = (prediction.inputs?.text as string) ?? '';
-            const isCorrect = prediction.expected_output === prediction.predicted_output;
-            return (
-              <TableRow key={prediction.uid} hover selected={!isCorrect}>
-                <TableCell sx={{ fontWeight: 600 }}>{prediction.uid}</TableCell>
-                <TableCell sx={{ maxWidth: 320 }}>
-                  <Typography variant="body2" noWrap title={text}>
-                    {text || '—'}
-                  </Typography>
-                </TableCell>
-                <TableCell>{String(prediction.expected_output ?? '—')}</TableCell>
-                <TableCell>
-                  <Typography color={isCorrect ? 'success.main' : 'error.main'}>
-                    {String(prediction.predicted_output ?? '—')}
-                  </Typography>
-                </TableCell>
-                <TableCell>{renderConfidenceCell(prediction.metadata ?? {})}</TableCell>
-                <TableCell>{renderRetrievedContexts(prediction.metadata ?? {})}</TableCell>
-              </TableRow>
-            );
-          })}
-        </TableBody>
-      </Table>
-    </Paper>
+    <>
+      {filters}
+      <Paper variant="outlined" sx={{ overflowX: 'auto' }}>
+        <Table size="small">
+          <TableHead>
+            <TableRow>
+              <TableCell>ID</TableCell>
+              <TableCell>Text</TableCell>
+              <TableCell>Expected</TableCell>
+              <TableCell>Predicted</TableCell>
+              <TableCell>Confidence</TableCell>
+              <TableCell>Retrieved Contexts</TableCell>
+            </TableRow>
+          </TableHead>
+          <TableBody>
+            {predictions.map((prediction) => {
+              const text = (prediction.inputs?.text as string) ?? '';
+              const isCorrect = prediction.expected_output === prediction.predicted_output;
+              return (
+                <TableRow key={prediction.uid} hover selected={!isCorrect}>
+                  <TableCell sx={{ fontWeight: 600 }}>{prediction.uid}</TableCell>
+                  <TableCell sx={{ maxWidth: 320 }}>
+                    <Typography variant="body2" noWrap title={text}>
+                      {text || '—'}
+                    </Typography>
+                  </TableCell>
+                  <TableCell>{String(prediction.expected_output ?? '—')}</TableCell>
+                  <TableCell>
+                    <Typography color={isCorrect ? 'success.main' : 'error.main'}>
+                      {String(prediction.predicted_output ?? '—')}
+                    </Typography>
+                  </TableCell>
+                  <TableCell>{renderConfidenceCell(prediction.metadata ?? {})}</TableCell>
+                  <TableCell>{renderRetrievedContexts(prediction.metadata ?? {})}</TableCell>
+                </TableRow>
+              );
+            })}
+          </TableBody>
+        </Table>
+        {cursor && (
+          <Box display="flex" justifyContent="center" p={1}>
+            <Button onClick={() => loadPage(false)} disabled={loading}>
+              {loading ? 'Loading…' : 'Load more'}
+            </Button>
+          </Box>
+        )}
+      </Paper>
+    </>
   );
 };
 
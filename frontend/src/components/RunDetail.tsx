@@ -1,7 +1,8 @@
-import { FC, useMemo } from 'react';
+import { FC, useEffect, useMemo, useRef } from 'react';
 import {
   Box,
   CircularProgress,
+  LinearProgress,
   Paper,
   Table,
   TableBody,
@@ -20,19 +21,76 @@ import {
   XAxis,
   YAxis
 } from 'recharts';
-import { Metric, RunDetail as RunDetailType } from '../api';
+import { Job, Metric, RunDetail as RunDetailType, subscribeToJob } from '../api';
 import MetricsCards from './MetricsCards';
+import MetricTrend from './MetricTrend';
 import PredictionTable from './PredictionTable';
 
 interface RunDetailProps {
   run: RunDetailType | null;
   loading: boolean;
+  job?: Job | null;
+  onJobUpdate?: (job: Job) => void;
+  onJobStreamError?: () => void;
 }
 
+const formatSeconds = (seconds: number) => {
+  if (seconds < 60) return `${seconds.toFixed(0)}s`;
+  const minutes = Math.floor(seconds / 60);
+  return minutes < 60 ? `${minutes}m ${Math.round(seconds % 60)}s` : `${Math.floor(minutes / 60)}h ${minutes % 60}m`;
+};
+
+const JobProgressPanel: FC<{ job: Job }> = ({ job }) => {
+  const progress = job.progress;
+  const percent = progress?.total ? (100 * progress.processed) / progress.total : null;
+  return (
+    <Paper variant="outlined" sx={{ p: 3 }}>
+      <Typography variant="h6" gutterBottom>
+        {job.status === 'queued' ? 'Queued' : 'Running'}: {job.config_name}
+      </Typography>
+      <LinearProgress
+        variant={percent === null ? 'indeterminate' : 'determinate'}
+        value={percent ?? undefined}
+        sx={{ mb: 1 }}
+      />
+      {progress && (
+        <>
+          <Typography variant="body2" color="text.secondary">
+            {progress.processed}
+            {progress.total !== null ? ` / ${progress.total}` : ''} examples · {progress.throughput.toFixed(1)}/s
+            {progress.eta !== null ? ` · ETA ${formatSeconds(progress.eta)}` : ''}
+            {progress.failed > 0 ? ` · ${progress.failed} failed` : ''}
+          </Typography>
+          {Object.keys(progress.metrics).length > 0 && (
+            <Typography variant="body2" color="text.secondary">
+              {Object.entries(progress.metrics)
+                .map(([name, value]) => `${name}: ${value.toFixed(3)}`)
+                .join(' · ')}
+            </Typography>
+          )}
+        </>
+      )}
+    </Paper>
+  );
+};
+
 const getMetricByName = (metrics: Metric[], name: string) =>
   metrics.find((metric) => metric.name.toLowerCase() === name.toLowerCase());
 
-const RunDetail: FC<RunDetailProps> = ({ run, loading }) => {
+const RunDetail: FC<RunDetailProps> = ({ run, loading, job, onJobUpdate, onJobStreamError }) => {
+  const handlers = useRef({ onJobUpdate, onJobStreamError });
+  handlers.current = { onJobUpdate, onJobStreamError };
+  const jobId = job?.id;
+
+  useEffect(() => {
+    if (!jobId) return undefined;
+    return subscribeToJob(
+      jobId,
+      (update) => handlers.current.onJobUpdate?.(update),
+      () => handlers.current.onJobStreamError?.()
+    );
+  }, [jobId]);
+
   const labelDistribution = useMemo(() => {
     if (!run) return null;
     const metric = getMetricByName(run.metrics, 'label_distribution');
@@ -65,7 +123,10 @@ const RunDetail: FC<RunDetailProps> = ({ run, loading }) => {
     );
   }
 
+  const progressPanel = job ? <JobProgressPanel job={job} /> : null;
+
   if (!run) {
+    if (progressPanel) return progressPanel;
     return (
       <Paper variant="outlined" sx={{ p: 4, textAlign: 'center' }}>
         <Typography variant="body1" color="text.secondary">
@@ -77,6 +138,7 @@ const RunDetail: FC<RunDetailProps> = ({ run, loading }) => {
 
   return (
     <Box display="flex" flexDirection="column" gap={3}>
+      {progressPanel}
       <Paper variant="outlined" sx={{ p: 3 }}>
         <Typography variant="h5" fontWeight={600} gutterBottom>
           {run.name}
@@ -92,6 +154,8 @@ const RunDetail: FC<RunDetailProps> = ({ run, loading }) => {
 
       <MetricsCards metrics={run.metrics} />
 
+      {run.metrics.length > 0 && <MetricTrend metric={run.metrics[0].name} configName={run.config_name} />}
+
       {labelDistribution && labelDistribution.length > 0 && (
         <Paper variant="outlined" sx={{ p: 3 }}>
           <Typography variant="h6" gutterBottom>
@@ -147,7 +211,7 @@ const RunDetail: FC<RunDetailProps> = ({ run, loading }) => {
         <Typography variant="h6" gutterBottom>
           Predictions
         </Typography>
-        <PredictionTable predictions={run.predictions} />
+        <PredictionTable runId={run.id} total={run.prediction_count} />
       </Box>
     </Box>
   );
@@ -1,6 +1,7 @@
 import { FC } from 'react';
 import {
   Box,
+  Button,
   Chip,
   CircularProgress,
   List,
@@ -17,9 +18,10 @@ interface RunListProps {
   selectedRunId: number | null;
   onSelect: (runId: number) => void;
   loading?: boolean;
+  onLoadMore?: () => void;
 }
 
-const RunList: FC<RunListProps> = ({ runs, selectedRunId, onSelect, loading = false }) => {
+const RunList: FC<RunListProps> = ({ runs, selectedRunId, onSelect, loading = false, onLoadMore }) => {
   if (loading) {
     return (
       <Box display="flex" justifyContent="center" alignItems="center" height="100%">
@@ -80,6 +82,13 @@ const RunList: FC<RunListProps> = ({ runs, selectedRunId, onSelect, loading = fa
           );
         })}
       </List>
+      {onLoadMore && (
+        <Box display="flex" justifyContent="center" p={1}>
+          <Button size="small" onClick={onLoadMore}>
+            Load older runs
+          </Button>
+        </Box>
+      )}
     </Paper>
   );
 };
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from eval_agent.config import EvaluationConfig, load_config
-from eval_agent.runner import EvaluationAgent, EvaluationResult
+from eval_agent.runner import EvaluationAgent, EvaluationResult, RunCancelled
 
 # Import modules for registry side-effects.
 from eval_agent.datasets import jsonl as _datasets_jsonl  # noqa: F401
@@ -19,6 +19,7 @@ from eval_agent.tasks import retrieval as _tasks_retrieval  # noqa: F401
 __all__ = [
     "EvaluationAgent",
     "EvaluationResult",
+    "RunCancelled",
     "EvaluationConfig",
     "load_config",
 ]
@@ -3,30 +3,54 @@
 from __future__ import annotations
 
 import json
+import time
+from datetime import datetime
+from itertools import groupby
 from pathlib import Path
-from typing import List
+from typing import AsyncIterator, List, Literal, Optional
 
-from fastapi import FastAPI, HTTPException
+import anyio
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
 from fastapi.middleware.cors import CORSMiddleware
 
 from eval_agent import EvaluationAgent, load_config
+from eval_agent.api.jobs import Job, JobQueue
 from eval_agent.api.schemas import (
     ConfigInfoSchema,
+    DiffEntrySchema,
+    JobSchema,
+    JobStatus,
+    MetricAggregateSchema,
+    MetricPointSchema,
     MetricSchema,
+    MetricSeriesSchema,
+    MetricSummarySchema,
+    MetricTimeSeriesSchema,
+    PredictionPageSchema,
     PredictionSchema,
+    ProgressSchema,
     RunCreateRequest,
     RunDetailSchema,
+    RunDiffSchema,
+    RunPageSchema,
     RunSummarySchema,
 )
 from eval_agent.api.storage import RunStore
-from eval_agent.runner import EvaluationResult
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 FRONTEND_DIST = BASE_DIR / "frontend" / "dist"
 RUNS_DIR = BASE_DIR / "runs"
 DEFAULT_DB_PATH = RUNS_DIR / "evaluations.db"
+# Minimum seconds between progress events published by a running job.
+PROGRESS_INTERVAL = 1.0
+# Seconds between keep-alive comments on idle event streams.
+EVENT_HEARTBEAT = 15.0
+# Longest a stream waits for a job update before checking whether its client is gone.
+EVENT_POLL_INTERVAL = 1.0
 
 PRESET_CONFIGS = {
     "sentiment-keyword": BASE_DIR / "configs" / "sentiment_keyword.json",
@@ -45,26 +69,39 @@ app.add_middleware(
 store = RunStore(DEFAULT_DB_PATH)
 
 
-if FRONTEND_DIST.exists():
-    app.mount("/", StaticFiles(directory=FRONTEND_DIST, html=True), name="frontend")
-else:
+def _execute_job(job: Job) -> int:
+    config = load_config(job.config_path)
+    if job.save_predictions is not None:
+        config.output.save_predictions = job.save_predictions
+    agent = EvaluationAgent(
+        config,
+        cancel_event=job.cancel_event,
+        progress=job.publish_progress,
+        progress_interval=PROGRESS_INTERVAL,
+    )
+    result = agent.run()
+    return store.record_run(
+        config_name=job.config_name,
+        config_path=job.config_path,
+        result=result,
+        save_predictions=config.output.save_predictions,
+    )
 
-    @app.get("/", include_in_schema=False)
-    def serve_index() -> None:
-        raise HTTPException(status_code=404, detail="Frontend bundle not found")
 
+jobs = JobQueue(_execute_job)
 
-    @app.get("/{full_path:path}", include_in_schema=False)
-    def serve_frontend(full_path: str) -> None:
-        if full_path.startswith("api/"):
-            raise HTTPException(status_code=404, detail="API route not found")
-        raise HTTPException(status_code=404, detail="Frontend bundle not found")
 
 @app.on_event("startup")
 def _startup() -> None:
     store.initialize()
 
 
+@app.on_event("shutdown")
+def _shutdown() -> None:
+    jobs.shutdown(wait=False)
+    store.close()
+
+
 def _resolve_config(config_identifier: str) -> tuple[str, Path]:
     if config_identifier in PRESET_CONFIGS:
         return config_identifier, PRESET_CONFIGS[config_identifier]
@@ -79,30 +116,42 @@ def _resolve_config(config_identifier: str) -> tuple[str, Path]:
     return config_identifier, candidate
 
 
-def _result_to_schema(
-    *,
-    run_id: int,
-    config_name: str,
-    config_path: Path,
-    result: EvaluationResult,
-) -> RunDetailSchema:
-    metrics = [MetricSchema(**metric.to_dict()) for metric in result.metrics]
-    predictions = [PredictionSchema(**prediction.to_dict()) for prediction in result.predictions]
-    duration = (result.completed_at - result.started_at).total_seconds()
-    return RunDetailSchema(
-        id=run_id,
-        name=result.name,
-        task=result.task,
-        config_name=config_name,
-        config_path=str(config_path),
-        started_at=result.started_at,
-        completed_at=result.completed_at,
-        duration=duration,
-        metrics=metrics,
-        predictions=predictions,
+def _job_to_schema(job: Job) -> JobSchema:
+    return JobSchema(
+        id=job.id,
+        status=job.status,
+        config_name=job.config_name,
+        config_path=str(job.config_path),
+        save_predictions=job.save_predictions,
+        run_id=job.run_id,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        progress=ProgressSchema(**job.progress.to_dict()) if job.progress else None,
     )
 
 
+async def _job_events(job: Job, request: Request) -> AsyncIterator[str]:
+    version = -1
+    last_sent = time.monotonic()
+    while not await request.is_disconnected():
+        # Short blocking waits keep the threadpool free and notice closed connections promptly.
+        current = await anyio.to_thread.run_sync(job.wait_for_update, version, EVENT_POLL_INTERVAL)
+        if current == version:
+            if time.monotonic() - last_sent >= EVENT_HEARTBEAT:
+                last_sent = time.monotonic()
+                yield ": keep-alive\n\n"
+            continue
+        version = current
+        # Read ``finished`` before serialising so the final state is always sent.
+        finished = job.finished
+        last_sent = time.monotonic()
+        yield f"event: job\nid: {version}\ndata: {json.dumps(jsonable_encoder(_job_to_schema(job)))}\n\n"
+        if finished:
+            return
+
+
 def _record_to_summary(record) -> RunSummarySchema:
     metrics = [MetricSchema(**metric) for metric in record.metrics]
     return RunSummarySchema(
@@ -119,9 +168,7 @@ def _record_to_summary(record) -> RunSummarySchema:
 
 
 def _record_to_detail(record) -> RunDetailSchema:
-    predictions_payload = _load_predictions(record.predictions_path)
     metrics = [MetricSchema(**metric) for metric in record.metrics]
-    predictions = [PredictionSchema(**item) for item in predictions_payload]
     return RunDetailSchema(
         id=record.id,
         name=record.name,
@@ -132,26 +179,11 @@ def _record_to_detail(record) -> RunDetailSchema:
         completed_at=record.completed_at,
         duration=record.duration,
         metrics=metrics,
-        predictions=predictions,
+        output_path=record.predictions_path,
+        prediction_count=store.count_predictions(record.id),
     )
 
 
-def _load_predictions(path: str | None) -> List[dict]:
-    if not path:
-        return []
-    candidate = Path(path)
-    if not candidate.exists():
-        return []
-    try:
-        payload = json.loads(candidate.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return []
-    predictions = payload.get("predictions")
-    if isinstance(predictions, list):
-        return predictions
-    return []
-
-
 @app.get("/api/health")
 def healthcheck() -> dict:
     return {"status": "ok"}
@@ -165,10 +197,30 @@ def list_configs() -> List[ConfigInfoSchema]:
     ]
 
 
-@app.get("/api/runs", response_model=List[RunSummarySchema])
-def list_runs() -> List[RunSummarySchema]:
-    records = store.list_runs()
-    return [_record_to_summary(record) for record in records]
+@app.get("/api/runs", response_model=RunPageSchema)
+def list_runs(
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    config_name: Optional[str] = None,
+    task: Optional[str] = None,
+    completed_after: Optional[datetime] = None,
+    completed_before: Optional[datetime] = None,
+) -> RunPageSchema:
+    try:
+        page = store.list_runs(
+            limit=limit,
+            cursor=cursor,
+            config_name=config_name,
+            task=task,
+            completed_after=completed_after,
+            completed_before=completed_before,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return RunPageSchema(
+        items=[_record_to_summary(record) for record in page.items],
+        next_cursor=page.next_cursor,
+    )
 
 
 @app.get("/api/runs/{run_id}", response_model=RunDetailSchema)
@@ -179,15 +231,179 @@ def get_run(run_id: int) -> RunDetailSchema:
     return _record_to_detail(record)
 
 
-@app.post("/api/runs", response_model=RunDetailSchema)
-def create_run(request: RunCreateRequest) -> RunDetailSchema:
+@app.get("/api/runs/{run_id}/predictions", response_model=PredictionPageSchema)
+def list_run_predictions(
+    run_id: int,
+    limit: int = Query(50, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    sort: str = "position",
+    order: Literal["asc", "desc"] = "asc",
+    misclassified: bool = False,
+    gold: Optional[str] = None,
+    predicted: Optional[str] = None,
+    uid: Optional[str] = None,
+) -> PredictionPageSchema:
+    if store.get_run(run_id) is None:
+        raise HTTPException(status_code=404, detail=f"Run with id {run_id} not found")
+    try:
+        page = store.list_predictions(
+            run_id,
+            limit=limit,
+            cursor=cursor,
+            sort=sort,
+            descending=order == "desc",
+            misclassified=misclassified,
+            gold=gold,
+            predicted=predicted,
+            uid=uid,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return PredictionPageSchema(
+        items=[PredictionSchema(**item) for item in page.items],
+        next_cursor=page.next_cursor,
+    )
+
+
+@app.get("/api/runs/{run_id}/diff/{baseline_id}", response_model=RunDiffSchema)
+def diff_runs(
+    run_id: int,
+    baseline_id: int,
+    kind: Literal["changed", "fixed", "regressed"] = "changed",
+    limit: int = Query(50, ge=1, le=1000),
+    cursor: Optional[str] = None,
+) -> RunDiffSchema:
+    for identifier in (run_id, baseline_id):
+        if store.get_run(identifier) is None:
+            raise HTTPException(status_code=404, detail=f"Run with id {identifier} not found")
+    try:
+        diff = store.diff_runs(run_id, baseline_id, kind=kind, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return RunDiffSchema(
+        run_id=run_id,
+        baseline_id=baseline_id,
+        counts=diff.counts,
+        items=[DiffEntrySchema(**item) for item in diff.items],
+        next_cursor=diff.next_cursor,
+    )
+
+
+@app.get("/api/metrics/{name}/series", response_model=MetricTimeSeriesSchema)
+def metric_time_series(
+    name: str,
+    config_name: Optional[str] = None,
+    completed_after: Optional[datetime] = None,
+    completed_before: Optional[datetime] = None,
+    window: Optional[int] = Query(None, ge=1, le=1000, description="Runs in the rolling mean"),
+) -> MetricTimeSeriesSchema:
+    points = store.metric_series(
+        name,
+        config_name=config_name,
+        completed_after=completed_after,
+        completed_before=completed_before,
+        window=window,
+    )
+    series = [
+        MetricSeriesSchema(
+            config_name=config,
+            points=[
+                MetricPointSchema(
+                    run_id=point.run_id,
+                    completed_at=point.completed_at,
+                    value=point.value,
+                    rolling_mean=point.rolling_mean,
+                )
+                for point in group
+            ],
+        )
+        for config, group in groupby(points, key=lambda point: point.config_name)
+    ]
+    return MetricTimeSeriesSchema(metric=name, window=window, series=series)
+
+
+@app.get("/api/metrics/{name}/summary", response_model=MetricSummarySchema)
+def metric_summary(
+    name: str,
+    config_name: Optional[str] = None,
+    completed_after: Optional[datetime] = None,
+    completed_before: Optional[datetime] = None,
+    percentiles: List[float] = Query([50.0, 90.0, 99.0]),
+) -> MetricSummarySchema:
+    try:
+        aggregates = store.metric_summary(
+            name,
+            config_name=config_name,
+            completed_after=completed_after,
+            completed_before=completed_before,
+            percentiles=percentiles,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return MetricSummarySchema(
+        metric=name,
+        groups=[MetricAggregateSchema(**vars(aggregate)) for aggregate in aggregates],
+    )
+
+
+@app.post("/api/runs", response_model=JobSchema, status_code=202)
+def create_run(request: RunCreateRequest) -> JobSchema:
     config_name, config_path = _resolve_config(request.config)
-    config = load_config(config_path)
-    if request.save_predictions is not None:
-        config.output.save_predictions = request.save_predictions
+    job = jobs.submit(
+        config_name=config_name,
+        config_path=config_path,
+        save_predictions=request.save_predictions,
+    )
+    return _job_to_schema(job)
 
-    agent = EvaluationAgent(config)
-    result = agent.run()
 
-    run_id = store.record_run(config_name=config_name, config_path=config_path, result=result)
-    return _result_to_schema(run_id=run_id, config_name=config_name, config_path=config_path, result=result)
+@app.get("/api/jobs", response_model=List[JobSchema])
+def list_jobs(status: Optional[JobStatus] = None) -> List[JobSchema]:
+    return [_job_to_schema(job) for job in jobs.list(status)]
+
+
+@app.get("/api/jobs/{job_id}", response_model=JobSchema)
+def get_job(job_id: str) -> JobSchema:
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job with id {job_id} not found")
+    return _job_to_schema(job)
+
+
+@app.get("/api/jobs/{job_id}/events")
+def stream_job_events(job_id: str, request: Request) -> StreamingResponse:
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job with id {job_id} not found")
+    return StreamingResponse(
+        _job_events(job, request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/jobs/{job_id}/cancel", response_model=JobSchema)
+def cancel_job(job_id: str) -> JobSchema:
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job with id {job_id} not found")
+    if job.finished:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} already {job.status}")
+    return _job_to_schema(jobs.cancel(job_id))
+
+
+# Registered last so the frontend catch-all does not shadow the API routes.
+if FRONTEND_DIST.exists():
+    app.mount("/", StaticFiles(directory=FRONTEND_DIST, html=True), name="frontend")
+else:
+
+    @app.get("/", include_in_schema=False)
+    def serve_index() -> None:
+        raise HTTPException(status_code=404, detail="Frontend bundle not found")
+
+
+    @app.get("/{full_path:path}", include_in_schema=False)
+    def serve_frontend(full_path: str) -> None:
+        if full_path.startswith("api/"):
+            raise HTTPException(status_code=404, detail="API route not found")
+        raise HTTPException(status_code=404, detail="Frontend bundle not found")
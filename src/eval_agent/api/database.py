@@ -0,0 +1,122 @@
+"""Pooled SQLite connections for the API's run store."""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List
+
+
+class ConnectionPool:
+    """Thread-safe pool of long-lived SQLite connections.
+
+    Connections are opened lazily, up to ``size``, in WAL mode so readers never
+    block the writer (or each other). ``synchronous=NORMAL`` is durable under WAL
+    except for the last transactions on power loss. Keeping connections open also
+    keeps SQLite's per-connection prepared statement cache (``cached_statements``)
+    warm, so repeated queries skip parsing and planning.
+
+    Connections run in autocommit mode: use :meth:`transaction` for writes, which
+    takes the write lock up front with ``BEGIN IMMEDIATE`` so concurrent writers
+    wait on ``busy_timeout`` instead of failing with "database is locked".
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        size: int = 8,
+        timeout: float = 30.0,
+        cache_size_kb: int = 16384,
+        mmap_size: int = 256 * 1024 * 1024,
+        cached_statements: int = 256,
+    ) -> None:
+        self.path = path
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.cache_size_kb = cache_size_kb
+        self.mmap_size = mmap_size
+        self.cached_statements = cached_statements
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._opened: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA cache_size=-{int(self.cache_size_kb)}")
+        connection.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        connection.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
+        return connection
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._opened) < self.size:
+                connection = self._open()
+                self._opened.append(connection)
+                return connection
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No SQLite connection to {self.path} became available") from None
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for reads (or statements managing their own transaction)."""
+
+        connection = self._acquire()
+        try:
+            yield connection
+        finally:
+            if connection.in_transaction:
+                connection.rollback()
+            self._release(connection)
+
+    def _release(self, connection: sqlite3.Connection) -> None:
+        with self._lock:
+            owned = any(candidate is connection for candidate in self._opened)
+        if owned:
+            self._idle.put(connection)
+        else:
+            # The pool was closed while this connection was borrowed.
+            connection.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection inside a write transaction committed on success."""
+
+        with self.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.rollback()
+                raise
+            connection.commit()
+
+    def close(self) -> None:
+        """Close idle connections; borrowed ones are closed when they are returned."""
+
+        with self._lock:
+            self._opened = []
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
@@ -0,0 +1,220 @@
+"""In-process job queue that executes evaluation runs off the request path."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Deque, Dict, List
+
+from eval_agent.progress import ProgressEvent
+from eval_agent.runner import RunCancelled
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = frozenset({SUCCEEDED, FAILED, CANCELLED})
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning("Ignoring non-integer %s=%r", name, value)
+        return default
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class Job:
+    """A queued evaluation run, its lifecycle timestamps and latest progress.
+
+    Every status or progress change bumps ``version`` so observers can wait for
+    the next update with :meth:`wait_for_update` instead of polling.
+    """
+
+    id: str
+    config_name: str
+    config_path: Path
+    save_predictions: bool | None = None
+    status: str = QUEUED
+    run_id: int | None = None
+    error: str | None = None
+    created_at: datetime = field(default_factory=_now)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    progress: ProgressEvent | None = None
+    version: int = 0
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    _future: Future | None = field(default=None, repr=False)
+    _changed: threading.Condition = field(default_factory=threading.Condition, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def publish_progress(self, event: ProgressEvent) -> None:
+        self.progress = event
+        self.notify()
+
+    def notify(self) -> None:
+        with self._changed:
+            self.version += 1
+            self._changed.notify_all()
+
+    def wait_for_update(self, version: int, timeout: float) -> int:
+        """Block until ``version`` is outdated or ``timeout`` elapses; return the current version."""
+
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout=timeout)
+            return self.version
+
+
+class JobQueue:
+    """Run jobs on a bounded thread pool with a per-configuration concurrency limit.
+
+    Jobs beyond ``per_config_limit`` for the same configuration wait in a FIFO
+    queue without occupying a pool thread, so one busy configuration cannot
+    starve the others. Queued jobs are cancelled immediately; running jobs get
+    their ``cancel_event`` set and stop at the next example. Only the most recent
+    ``history`` finished jobs are kept in memory.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[Job], int],
+        *,
+        workers: int | None = None,
+        per_config_limit: int | None = None,
+        history: int = 1000,
+    ) -> None:
+        self.workers = workers or _env_int("EVAL_AGENT_WORKERS", 2)
+        self.per_config_limit = per_config_limit or _env_int("EVAL_AGENT_MAX_RUNS_PER_CONFIG", 1)
+        self.history = history
+        self._execute = execute
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="eval-job")
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._waiting: Dict[str, Deque[Job]] = {}
+        self._active: Dict[str, int] = {}
+        self._closed = False
+
+    def submit(self, *, config_name: str, config_path: Path, save_predictions: bool | None = None) -> Job:
+        job = Job(
+            id=uuid.uuid4().hex,
+            config_name=config_name,
+            config_path=config_path,
+            save_predictions=save_predictions,
+        )
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The job queue has been shut down")
+            self._jobs[job.id] = job
+            if self._active.get(config_name, 0) < self.per_config_limit:
+                self._dispatch(job)
+            else:
+                self._waiting.setdefault(config_name, deque()).append(job)
+            self._prune()
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self, status: str | None = None) -> List[Job]:
+        """Return jobs newest first, optionally filtered by ``status``."""
+
+        with self._lock:
+            jobs = list(reversed(self._jobs.values()))
+        return [job for job in jobs if status is None or job.status == status]
+
+    def cancel(self, job_id: str) -> Job | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished:
+                return job
+            job.cancel_event.set()
+            waiting = self._waiting.get(job.config_name)
+            if waiting is not None and job in waiting:
+                waiting.remove(job)
+                self._finish(job, CANCELLED)
+            elif job._future is not None and job._future.cancel():
+                self._finish(job, CANCELLED)
+                self._release(job.config_name)
+        return job
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Cancel outstanding jobs and stop the worker pool."""
+
+        with self._lock:
+            self._closed = True
+            jobs = [job for job in self._jobs.values() if not job.finished]
+        for job in jobs:
+            self.cancel(job.id)
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _dispatch(self, job: Job) -> None:
+        self._active[job.config_name] = self._active.get(job.config_name, 0) + 1
+        job._future = self._pool.submit(self._run, job)
+
+    def _release(self, config_name: str) -> None:
+        self._active[config_name] -= 1
+        waiting = self._waiting.get(config_name)
+        if waiting and not self._closed:
+            self._dispatch(waiting.popleft())
+        if not self._active[config_name]:
+            del self._active[config_name]
+        if waiting is not None and not waiting:
+            del self._waiting[config_name]
+
+    def _finish(self, job: Job, status: str, *, error: str | None = None) -> None:
+        job.status = status
+        job.error = error
+        job.finished_at = _now()
+        job.notify()
+
+    def _run(self, job: Job) -> None:
+        with self._lock:
+            if job.finished:
+                return
+            if job.cancel_event.is_set():
+                self._finish(job, CANCELLED)
+                self._release(job.config_name)
+                return
+            job.status = RUNNING
+            job.started_at = _now()
+        job.notify()
+        status, error, run_id = SUCCEEDED, None, None
+        try:
+            run_id = self._execute(job)
+        except RunCancelled:
+            status = CANCELLED
+        except Exception as exc:  # noqa: BLE001 - surfaced through the job status
+            logger.exception("Evaluation job %s for '%s' failed", job.id, job.config_name)
+            status, error = FAILED, f"{type(exc).__name__}: {exc}"
+        with self._lock:
+            job.run_id = run_id
+            self._finish(job, status, error=error)
+            self._release(job.config_name)
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
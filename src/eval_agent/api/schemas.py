@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -34,8 +34,71 @@ class RunSummarySchema(BaseModel):
     metrics: List[MetricSchema]
 
 
+class RunPageSchema(BaseModel):
+    items: List[RunSummarySchema]
+    next_cursor: Optional[str] = Field(None, description="Pass as 'cursor' to fetch the next page")
+
+
 class RunDetailSchema(RunSummarySchema):
-    predictions: List[PredictionSchema]
+    output_path: Optional[str] = None
+    prediction_count: int = Field(..., description="Number of stored predictions; list them via /predictions")
+
+
+class PredictionPageSchema(BaseModel):
+    items: List[PredictionSchema]
+    next_cursor: Optional[str] = Field(None, description="Pass as 'cursor' to fetch the next page")
+
+
+class DiffEntrySchema(BaseModel):
+    uid: str
+    inputs: Dict[str, Any]
+    expected_output: Any
+    baseline_output: Any
+    predicted_output: Any
+    baseline_correct: bool
+    correct: bool
+
+
+class RunDiffSchema(BaseModel):
+    run_id: int
+    baseline_id: int
+    counts: Dict[str, int] = Field(..., description="Shared examples and how many changed, were fixed or regressed")
+    items: List[DiffEntrySchema]
+    next_cursor: Optional[str] = None
+
+
+class MetricPointSchema(BaseModel):
+    run_id: int
+    completed_at: datetime
+    value: float
+    rolling_mean: Optional[float] = None
+
+
+class MetricSeriesSchema(BaseModel):
+    config_name: str
+    points: List[MetricPointSchema]
+
+
+class MetricTimeSeriesSchema(BaseModel):
+    metric: str
+    window: Optional[int] = None
+    series: List[MetricSeriesSchema]
+
+
+class MetricAggregateSchema(BaseModel):
+    config_name: str
+    count: int
+    min: float
+    max: float
+    mean: float
+    std: float
+    latest: float = Field(..., description="Value of the most recently completed run")
+    percentiles: Dict[str, float]
+
+
+class MetricSummarySchema(BaseModel):
+    metric: str
+    groups: List[MetricAggregateSchema]
 
 
 class RunCreateRequest(BaseModel):
@@ -50,3 +113,31 @@ class ConfigInfoSchema(BaseModel):
     name: str
     path: str
     description: Optional[str] = None
+
+
+class ProgressSchema(BaseModel):
+    processed: int
+    failed: int
+    total: Optional[int] = None
+    elapsed: float = Field(..., description="Seconds since the evaluation loop started")
+    throughput: float = Field(..., description="Examples processed per second")
+    eta: Optional[float] = Field(None, description="Estimated seconds remaining, when the dataset size is known")
+    metrics: Dict[str, float] = Field(default_factory=dict, description="Metric values over the examples seen so far")
+    done: bool = False
+
+
+JobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+
+class JobSchema(BaseModel):
+    id: str
+    status: JobStatus
+    config_name: str
+    config_path: str
+    save_predictions: Optional[bool] = None
+    run_id: Optional[int] = Field(None, description="Identifier of the stored run once the job succeeded")
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    progress: Optional[ProgressSchema] = None
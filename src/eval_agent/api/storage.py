@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 import json
+import math
 import sqlite3
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import cached_property
+from itertools import groupby
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 
+import numpy as np
+
+from eval_agent.api.database import ConnectionPool
 from eval_agent.runner import EvaluationResult
+from eval_agent.writers import iter_saved_predictions
+
+# Bumped whenever ``initialize`` has to migrate existing data.
+_SCHEMA_VERSION = 2
+
+# Columns the predictions listing can be ordered by; ``position`` breaks ties.
+PREDICTION_SORT_FIELDS = ("position", "uid", "gold", "predicted")
 
 
 @dataclass
@@ -22,19 +37,132 @@ class RunRecord:
     started_at: datetime
     completed_at: datetime
     duration: float
-    metrics: list[dict]
+    metrics_json: str = field(repr=False)
     predictions_path: str | None
 
+    @cached_property
+    def metrics(self) -> list[dict]:
+        """Metric payloads, decoded on first access."""
+
+        return json.loads(self.metrics_json) if self.metrics_json else []
+
+
+@dataclass
+class RunPage:
+    items: List[RunRecord]
+    next_cursor: str | None
+
+
+@dataclass
+class PredictionPage:
+    items: List[dict]
+    next_cursor: str | None
+
+
+@dataclass
+class MetricPoint:
+    run_id: int
+    config_name: str
+    completed_at: datetime
+    value: float
+    rolling_mean: float | None = None
+
+
+@dataclass
+class MetricAggregate:
+    config_name: str
+    count: int
+    min: float
+    max: float
+    mean: float
+    std: float
+    latest: float
+    percentiles: Dict[str, float]
+
+
+@dataclass
+class RunDiff:
+    counts: Dict[str, int]
+    items: List[dict]
+    next_cursor: str | None
+
+
+# Conditions on the candidate (c) and baseline (b) rows of a shared uid.
+DIFF_KINDS = {
+    "changed": "c.predicted <> b.predicted",
+    "fixed": "b.correct = 0 AND c.correct = 1",
+    "regressed": "b.correct = 1 AND c.correct = 0",
+}
+
+
+def _label(value: Any) -> str:
+    # Matches how the classification metrics stringify labels.
+    return str(value)
+
+
+def _prediction_row(run_id: int, position: int, prediction: Dict[str, Any]) -> tuple:
+    expected = prediction.get("expected_output")
+    predicted = prediction.get("predicted_output")
+    return (
+        run_id,
+        position,
+        str(prediction["uid"]),
+        _label(expected),
+        _label(predicted),
+        int(expected == predicted),
+        json.dumps(prediction.get("inputs", {})),
+        json.dumps(expected),
+        json.dumps(predicted),
+        json.dumps(prediction.get("metadata", {})),
+    )
+
+
+def _encode_cursor(sort_value: Any, position: int) -> str:
+    raw = json.dumps([sort_value, position], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[Any, int]:
+    try:
+        sort_value, position = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return sort_value, int(position)
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid cursor '{cursor}'") from exc
+
+
+def _timestamp(value: datetime) -> str:
+    # Stored timestamps are UTC ISO strings, which sort chronologically as text.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+@dataclass
+class RunEntry:
+    """A completed run to record with :meth:`RunStore.record_runs`."""
+
+    config_name: str
+    config_path: Path
+    result: EvaluationResult
+    save_predictions: bool = True
+
 
 class RunStore:
-    """Lightweight SQLite-backed store for evaluation runs."""
+    """Lightweight SQLite-backed store for evaluation runs.
+
+    All access goes through a :class:`ConnectionPool`, so the store can be shared
+    by the request handlers and the job workers.
+    """
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, *, pool_size: int = 8) -> None:
         self.path = path
+        self._pool = ConnectionPool(path, size=pool_size)
+
+    def close(self) -> None:
+        self._pool.close()
 
     def initialize(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.path) as connection:
+        with self._pool.transaction() as connection:
             connection.execute(
                 """
                 CREATE TABLE IF NOT EXISTS runs (
@@ -51,7 +179,72 @@ class RunStore:
                 );
                 """
             )
-            connection.commit()
+            # The run listing pages by (completed_at, id), optionally per config or task.
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_runs_completed_at ON runs (completed_at)")
+            for column in ("config_name", "task"):
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_runs_{column} ON runs ({column}, completed_at)"
+                )
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS predictions (
+                    run_id INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
+                    uid TEXT NOT NULL,
+                    gold TEXT NOT NULL,
+                    predicted TEXT NOT NULL,
+                    correct INTEGER NOT NULL,
+                    inputs_json TEXT NOT NULL,
+                    expected_json TEXT NOT NULL,
+                    predicted_json TEXT NOT NULL,
+                    metadata_json TEXT NOT NULL,
+                    PRIMARY KEY (run_id, position)
+                );
+                """
+            )
+            # Every listing filters by run and orders by a column plus ``position``.
+            for column in ("uid", "gold", "predicted", "correct"):
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_predictions_{column} "
+                    f"ON predictions (run_id, {column}, position)"
+                )
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS run_metrics (
+                    run_id INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    value REAL NOT NULL,
+                    PRIMARY KEY (run_id, name)
+                ) WITHOUT ROWID;
+                """
+            )
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version < 1:
+                self._import_legacy_predictions(connection)
+            if version < 2:
+                self._extract_legacy_metrics(connection)
+            if version < _SCHEMA_VERSION:
+                connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def _extract_legacy_metrics(self, connection: sqlite3.Connection) -> None:
+        """Fill ``run_metrics`` for runs recorded before metric values were extracted."""
+
+        rows = connection.execute("SELECT id, metrics_json FROM runs").fetchall()
+        for run_id, metrics_json in rows:
+            self._insert_metrics(connection, int(run_id), json.loads(metrics_json) if metrics_json else [])
+
+    def _import_legacy_predictions(self, connection: sqlite3.Connection) -> None:
+        """Load predictions of runs recorded before they were stored in the database."""
+
+        rows = connection.execute(
+            """
+            SELECT id, predictions_path FROM runs
+            WHERE predictions_path IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM predictions WHERE predictions.run_id = runs.id)
+            """
+        ).fetchall()
+        for run_id, predictions_path in rows:
+            self._insert_predictions(connection, int(run_id), iter_saved_predictions(predictions_path))
 
     def record_run(
         self,
@@ -59,54 +252,396 @@ class RunStore:
         config_name: str,
         config_path: Path,
         result: EvaluationResult,
+        save_predictions: bool = True,
     ) -> int:
-        metrics_json = json.dumps([metric.to_dict() for metric in result.metrics])
+        """Store a completed run and, unless disabled, its predictions.
+
+        Predictions come from the in-memory result or, for streaming runs, from
+        the output file.
+        """
+
+        (run_id,) = self.record_runs([RunEntry(config_name, config_path, result, save_predictions)])
+        return run_id
+
+    def record_runs(self, entries: Iterable[RunEntry]) -> List[int]:
+        """Store several runs and their predictions in a single transaction."""
+
+        with self._pool.transaction() as connection:
+            return [self._insert_run(connection, entry) for entry in entries]
+
+    def _insert_run(self, connection: sqlite3.Connection, entry: RunEntry) -> int:
+        result = entry.result
+        metrics = [metric.to_dict() for metric in result.metrics]
+        metrics_json = json.dumps(metrics)
         predictions_path = str(result.output_path) if result.output_path else None
         duration = (result.completed_at - result.started_at).total_seconds()
-        with sqlite3.connect(self.path) as connection:
-            cursor = connection.execute(
-                """
-                INSERT INTO runs (
-                    name,
-                    task,
-                    config_name,
-                    config_path,
-                    started_at,
-                    completed_at,
-                    duration,
-                    metrics_json,
-                    predictions_path
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        cursor = connection.execute(
+            """
+            INSERT INTO runs (
+                name,
+                task,
+                config_name,
+                config_path,
+                started_at,
+                completed_at,
+                duration,
+                metrics_json,
+                predictions_path
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                result.name,
+                result.task,
+                entry.config_name,
+                str(entry.config_path),
+                result.started_at.isoformat(),
+                result.completed_at.isoformat(),
+                duration,
+                metrics_json,
+                predictions_path,
+            ),
+        )
+        run_id = int(cursor.lastrowid)
+        if entry.save_predictions:
+            if result.predictions:
+                predictions = (prediction.to_dict() for prediction in result.predictions)
+            else:
+                predictions = iter_saved_predictions(predictions_path)
+            self._insert_predictions(connection, run_id, predictions)
+        self._insert_metrics(connection, run_id, metrics)
+        return run_id
+
+    def _insert_metrics(self, connection: sqlite3.Connection, run_id: int, metrics: List[dict]) -> None:
+        rows = []
+        for metric in metrics:
+            value = metric.get("value")
+            if isinstance(value, (int, float)) and math.isfinite(value):
+                rows.append((run_id, str(metric["name"]), float(value)))
+        connection.executemany("INSERT OR REPLACE INTO run_metrics (run_id, name, value) VALUES (?, ?, ?)", rows)
+
+    def _insert_predictions(self, connection: sqlite3.Connection, run_id: int, predictions: Iterator[dict]) -> None:
+        connection.executemany(
+            """
+            INSERT INTO predictions (
+                run_id, position, uid, gold, predicted, correct,
+                inputs_json, expected_json, predicted_json, metadata_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (_prediction_row(run_id, position, prediction) for position, prediction in enumerate(predictions)),
+        )
+
+    def count_predictions(self, run_id: int) -> int:
+        with self._pool.connection() as connection:
+            (count,) = connection.execute("SELECT COUNT(*) FROM predictions WHERE run_id = ?", (run_id,)).fetchone()
+        return int(count)
+
+    def list_predictions(
+        self,
+        run_id: int,
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+        sort: str = "position",
+        descending: bool = False,
+        misclassified: bool = False,
+        gold: str | None = None,
+        predicted: str | None = None,
+        uid: str | None = None,
+    ) -> PredictionPage:
+        """Return one keyset-paginated page of a run's predictions.
+
+        ``cursor`` is the opaque ``next_cursor`` of the previous page. Raises
+        ``ValueError`` for an unknown sort field or a malformed cursor.
+        """
+
+        if sort not in PREDICTION_SORT_FIELDS:
+            raise ValueError(f"Unsupported sort field '{sort}'. Use one of: {', '.join(PREDICTION_SORT_FIELDS)}")
+
+        clauses = ["run_id = ?"]
+        parameters: List[Any] = [run_id]
+        if misclassified:
+            clauses.append("correct = 0")
+        for column, value in (("gold", gold), ("predicted", predicted), ("uid", uid)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                parameters.append(value)
+        comparison = "<" if descending else ">"
+        if cursor is not None:
+            sort_value, position = _decode_cursor(cursor)
+            if sort == "position":
+                clauses.append(f"position {comparison} ?")
+                parameters.append(position)
+            else:
+                clauses.append(f"({sort}, position) {comparison} (?, ?)")
+                parameters.extend([sort_value, position])
+        direction = "DESC" if descending else "ASC"
+        order = "position" if sort == "position" else f"{sort} {direction}, position"
+
+        with self._pool.connection() as connection:
+            rows = connection.execute(
+                f"""
+                SELECT position, uid, gold, predicted, inputs_json, expected_json, predicted_json, metadata_json
+                FROM predictions
+                WHERE {" AND ".join(clauses)}
+                ORDER BY {order} {direction}
+                LIMIT ?
+                """,
+                (*parameters, limit + 1),
+            ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            sort_value = {"position": last[0], "uid": last[1], "gold": last[2], "predicted": last[3]}[sort]
+            next_cursor = _encode_cursor(sort_value, last[0])
+        items = [
+            {
+                "uid": uid_value,
+                "inputs": json.loads(inputs_json),
+                "expected_output": json.loads(expected_json),
+                "predicted_output": json.loads(predicted_json),
+                "metadata": json.loads(metadata_json),
+            }
+            for _, uid_value, _, _, inputs_json, expected_json, predicted_json, metadata_json in rows
+        ]
+        return PredictionPage(items=items, next_cursor=next_cursor)
+
+    def diff_runs(
+        self,
+        run_id: int,
+        baseline_id: int,
+        *,
+        kind: str = "changed",
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> RunDiff:
+        """Compare the predictions of ``run_id`` with ``baseline_id`` example by example.
+
+        Examples are matched by uid through the ``(run_id, uid)`` index. ``counts``
+        covers every shared example; ``items`` lists one page of those matching
+        ``kind`` in the candidate run's dataset order.
+        """
+
+        if kind not in DIFF_KINDS:
+            raise ValueError(f"Unsupported diff kind '{kind}'. Use one of: {', '.join(DIFF_KINDS)}")
+        join = "FROM predictions AS c JOIN predictions AS b ON b.run_id = ? AND b.uid = c.uid WHERE c.run_id = ?"
+        clauses = [DIFF_KINDS[kind]]
+        parameters: List[Any] = [baseline_id, run_id]
+        if cursor is not None:
+            _, position = _decode_cursor(cursor)
+            clauses.append("c.position > ?")
+            parameters.append(position)
+
+        with self._pool.connection() as connection:
+            shared, changed, fixed, regressed = connection.execute(
+                f"""
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM({DIFF_KINDS["changed"]}), 0),
+                    COALESCE(SUM({DIFF_KINDS["fixed"]}), 0),
+                    COALESCE(SUM({DIFF_KINDS["regressed"]}), 0)
+                {join}
+                """,
+                (baseline_id, run_id),
+            ).fetchone()
+            rows = connection.execute(
+                f"""
+                SELECT c.position, c.uid, c.inputs_json, c.expected_json,
+                       b.predicted_json, c.predicted_json, b.correct, c.correct
+                {join} AND {" AND ".join(clauses)}
+                ORDER BY c.position
+                LIMIT ?
                 """,
-                (
-                    result.name,
-                    result.task,
-                    config_name,
-                    str(config_path),
-                    result.started_at.isoformat(),
-                    result.completed_at.isoformat(),
-                    duration,
-                    metrics_json,
-                    predictions_path,
-                ),
+                (*parameters, limit + 1),
+            ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(None, rows[-1][0])
+        items = [
+            {
+                "uid": uid,
+                "inputs": json.loads(inputs_json),
+                "expected_output": json.loads(expected_json),
+                "baseline_output": json.loads(baseline_json),
+                "predicted_output": json.loads(predicted_json),
+                "baseline_correct": bool(baseline_correct),
+                "correct": bool(correct),
+            }
+            for _, uid, inputs_json, expected_json, baseline_json, predicted_json, baseline_correct, correct in rows
+        ]
+        counts = {"shared": shared, "changed": changed, "fixed": fixed, "regressed": regressed}
+        return RunDiff(counts=counts, items=items, next_cursor=next_cursor)
+
+    def _metric_rows(
+        self,
+        name: str,
+        *,
+        columns: str,
+        config_name: str | None,
+        completed_after: datetime | None,
+        completed_before: datetime | None,
+    ) -> List[tuple]:
+        # Runs are range-scanned on (config_name, completed_at) or completed_at and
+        # each metric value is a primary-key lookup on (run_id, name).
+        clauses = ["m.name = ?"]
+        parameters: List[Any] = [name]
+        if config_name is not None:
+            clauses.append("r.config_name = ?")
+            parameters.append(config_name)
+        if completed_after is not None:
+            clauses.append("r.completed_at >= ?")
+            parameters.append(_timestamp(completed_after))
+        if completed_before is not None:
+            clauses.append("r.completed_at < ?")
+            parameters.append(_timestamp(completed_before))
+        with self._pool.connection() as connection:
+            return connection.execute(
+                f"""
+                SELECT {columns}
+                FROM runs AS r JOIN run_metrics AS m ON m.run_id = r.id
+                WHERE {" AND ".join(clauses)}
+                ORDER BY r.config_name, r.completed_at, r.id
+                """,
+                parameters,
+            ).fetchall()
+
+    def metric_series(
+        self,
+        name: str,
+        *,
+        config_name: str | None = None,
+        completed_after: datetime | None = None,
+        completed_before: datetime | None = None,
+        window: int | None = None,
+    ) -> List[MetricPoint]:
+        """Return the values of metric ``name`` per run, by config then completion time.
+
+        With ``window``, each point also carries the mean of the last ``window``
+        values of its configuration (computed by SQLite in the same query).
+        """
+
+        rolling = "NULL"
+        if window is not None:
+            if window < 1:
+                raise ValueError("window must be a positive number of runs")
+            rolling = (
+                "AVG(m.value) OVER (PARTITION BY r.config_name ORDER BY r.completed_at, r.id "
+                f"ROWS BETWEEN {int(window) - 1} PRECEDING AND CURRENT ROW)"
             )
-            connection.commit()
-            return int(cursor.lastrowid)
+        rows = self._metric_rows(
+            name,
+            columns=f"r.id, r.config_name, r.completed_at, m.value, {rolling}",
+            config_name=config_name,
+            completed_after=completed_after,
+            completed_before=completed_before,
+        )
+        return [
+            MetricPoint(
+                run_id=int(run_id),
+                config_name=str(config),
+                completed_at=datetime.fromisoformat(str(completed_at)),
+                value=float(value),
+                rolling_mean=None if rolling_mean is None else float(rolling_mean),
+            )
+            for run_id, config, completed_at, value, rolling_mean in rows
+        ]
 
-    def list_runs(self) -> List[RunRecord]:
-        with sqlite3.connect(self.path) as connection:
-            cursor = connection.execute(
-                """
+    def metric_summary(
+        self,
+        name: str,
+        *,
+        config_name: str | None = None,
+        completed_after: datetime | None = None,
+        completed_before: datetime | None = None,
+        percentiles: Sequence[float] = (50.0, 90.0, 99.0),
+    ) -> List[MetricAggregate]:
+        """Aggregate metric ``name`` per configuration over the selected runs."""
+
+        if any(not 0.0 <= percentile <= 100.0 for percentile in percentiles):
+            raise ValueError("percentiles must be between 0 and 100")
+        rows = self._metric_rows(
+            name,
+            columns="r.config_name, m.value",
+            config_name=config_name,
+            completed_after=completed_after,
+            completed_before=completed_before,
+        )
+        aggregates: List[MetricAggregate] = []
+        for config, group in groupby(rows, key=lambda row: row[0]):
+            values = np.fromiter((value for _, value in group), dtype=np.float64)
+            aggregates.append(
+                MetricAggregate(
+                    config_name=str(config),
+                    count=int(values.size),
+                    min=float(values.min()),
+                    max=float(values.max()),
+                    mean=float(values.mean()),
+                    std=float(values.std()),
+                    latest=float(values[-1]),
+                    percentiles={
+                        f"p{percentile:g}": float(np.percentile(values, percentile)) for percentile in percentiles
+                    },
+                )
+            )
+        return aggregates
+
+    def list_runs(
+        self,
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+        config_name: str | None = None,
+        task: str | None = None,
+        completed_after: datetime | None = None,
+        completed_before: datetime | None = None,
+    ) -> RunPage:
+        """Return one page of runs, most recently completed first.
+
+        Pages are keyed on ``(completed_at, id)`` so every page is a single index
+        range scan however long the history is. Metrics are decoded lazily.
+        """
+
+        clauses: List[str] = []
+        parameters: List[Any] = []
+        for column, value in (("config_name", config_name), ("task", task)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                parameters.append(value)
+        if completed_after is not None:
+            clauses.append("completed_at >= ?")
+            parameters.append(_timestamp(completed_after))
+        if completed_before is not None:
+            clauses.append("completed_at < ?")
+            parameters.append(_timestamp(completed_before))
+        if cursor is not None:
+            completed_at, run_id = _decode_cursor(cursor)
+            clauses.append("(completed_at, id) < (?, ?)")
+            parameters.extend([completed_at, run_id])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._pool.connection() as connection:
+            rows = connection.execute(
+                f"""
                 SELECT id, name, task, config_name, config_path, started_at, completed_at, duration, metrics_json, predictions_path
                 FROM runs
-                ORDER BY completed_at DESC
-                """
-            )
-            rows = cursor.fetchall()
-        return [self._row_to_record(row) for row in rows]
+                {where}
+                ORDER BY completed_at DESC, id DESC
+                LIMIT ?
+                """,
+                (*parameters, limit + 1),
+            ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(rows[-1][6], rows[-1][0])
+        return RunPage(items=[self._row_to_record(row) for row in rows], next_cursor=next_cursor)
 
     def get_run(self, run_id: int) -> Optional[RunRecord]:
-        with sqlite3.connect(self.path) as connection:
+        with self._pool.connection() as connection:
             cursor = connection.execute(
                 """
                 SELECT id, name, task, config_name, config_path, started_at, completed_at, duration, metrics_json, predictions_path
@@ -131,7 +666,6 @@ class RunStore:
             metrics_json,
             predictions_path,
         ) = row
-        metrics = json.loads(metrics_json) if metrics_json else []
         return RunRecord(
             id=int(run_id),
             name=str(name),
@@ -141,6 +675,6 @@ class RunStore:
             started_at=datetime.fromisoformat(str(started_at)),
             completed_at=datetime.fromisoformat(str(completed_at)),
             duration=float(duration),
-            metrics=metrics,
+            metrics_json=str(metrics_json or ""),
             predictions_path=str(predictions_path) if predictions_path else None,
         )
@@ -0,0 +1,190 @@
+"""Content-addressed on-disk cache of model predictions shared across runs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Sequence
+
+from eval_agent.types import Example, ModelResponse
+
+# Stay well below SQLite's limit on host parameters per statement.
+_LOOKUP_BATCH = 500
+
+# Adapter parameters that tune how predictions are dispatched (batching, concurrency,
+# retries, local index caching) but never what they are.
+_EXECUTION_PARAMETERS = frozenset(
+    {
+        "batch_size",
+        "max_concurrency",
+        "max_sessions",
+        "rate_limit",
+        "rate_burst",
+        "retry",
+        "circuit_breaker",
+        "on_error",
+        "http_timeout",
+        "sse_read_timeout",
+        "request_timeout",
+        "warmup_examples",
+        "index_cache",
+        "index_cache_dir",
+    }
+)
+
+
+def content_digest(payload: Any) -> str:
+    """Return a stable SHA-256 digest of a JSON-serialisable payload."""
+
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def model_namespace(model_type: str, parameters: Mapping[str, Any], fingerprint: str | None) -> str:
+    """Return the cache namespace for a model configuration.
+
+    The namespace covers the registered model type, its configuration parameters
+    and the adapter's own fingerprint (e.g. the hash of a serialized artifact), so
+    changing any of them starts from an empty cache. Parameters that only affect
+    execution (batch sizes, concurrency, retries) are left out.
+    """
+
+    relevant = {key: value for key, value in parameters.items() if key not in _EXECUTION_PARAMETERS}
+    return content_digest({"model": model_type, "parameters": relevant, "fingerprint": fingerprint})
+
+
+class PredictionCache:
+    """SQLite-backed prediction cache with size-based LRU eviction.
+
+    Entries are keyed by the model namespace and the part of each example the
+    response depends on, as returned by ``key_fields`` (the adapter's
+    :meth:`~eval_agent.models.base.ModelAdapter.cache_key_fields`; the inputs by
+    default, so identical inputs are shared between datasets). Lookups and
+    writes are batched per chunk, and once the stored payloads exceed
+    ``max_bytes`` the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        namespace: str,
+        max_bytes: int,
+        key_fields: Callable[[Example], Any] | None = None,
+    ) -> None:
+        self.path = path
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self._key_fields = key_fields or (lambda example: example.inputs)
+        self.hits = 0
+        self.misses = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30.0)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS predictions (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            );
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_predictions_last_access ON predictions (last_access)"
+        )
+        self._connection.commit()
+        (total,) = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM predictions").fetchone()
+        self._total_bytes = int(total)
+
+    def key(self, example: Example) -> str:
+        return content_digest({"namespace": self.namespace, "inputs": self._key_fields(example)})
+
+    def get_many(self, examples: Sequence[Example]) -> List[ModelResponse | None]:
+        """Return cached responses aligned with ``examples`` (``None`` for misses)."""
+
+        keys = [self.key(example) for example in examples]
+        found: Dict[str, str] = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), _LOOKUP_BATCH):
+            batch = unique[start : start + _LOOKUP_BATCH]
+            placeholders = ",".join("?" for _ in batch)
+            rows = self._connection.execute(
+                f"SELECT key, payload FROM predictions WHERE key IN ({placeholders})",
+                batch,
+            )
+            found.update(rows.fetchall())
+
+        responses: List[ModelResponse | None] = []
+        for example, key in zip(examples, keys):
+            payload = found.get(key)
+            if payload is None:
+                self.misses += 1
+                responses.append(None)
+                continue
+            self.hits += 1
+            data = json.loads(payload)
+            responses.append(ModelResponse(uid=example.uid, output=data["output"], metadata=data["metadata"]))
+
+        if found:
+            now = time.time()
+            with self._connection:
+                self._connection.executemany(
+                    "UPDATE predictions SET last_access = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+        return responses
+
+    def put_many(self, examples: Sequence[Example], responses: Sequence[ModelResponse]) -> None:
+        """Store successful responses; responses flagged with an ``error`` are skipped."""
+
+        now = time.time()
+        rows = []
+        for example, response in zip(examples, responses):
+            if "error" in response.metadata:
+                continue
+            try:
+                payload = json.dumps({"output": response.output, "metadata": response.metadata})
+            except (TypeError, ValueError):
+                continue
+            rows.append((self.key(example), payload, len(payload), now))
+        if not rows:
+            return
+
+        with self._connection:
+            for key, payload, size, last_access in rows:
+                previous = self._connection.execute(
+                    "SELECT size FROM predictions WHERE key = ?", (key,)
+                ).fetchone()
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO predictions (key, payload, size, last_access) VALUES (?, ?, ?, ?)",
+                    (key, payload, size, last_access),
+                )
+                self._total_bytes += size - (previous[0] if previous else 0)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        # Trim to 90% of the limit so eviction does not run on every write.
+        target = int(self.max_bytes * 0.9)
+        with self._connection:
+            cursor = self._connection.execute("SELECT key, size FROM predictions ORDER BY last_access ASC")
+            stale: List[str] = []
+            for key, size in cursor:
+                if self._total_bytes <= target:
+                    break
+                stale.append(key)
+                self._total_bytes -= size
+            cursor.close()
+            self._connection.executemany("DELETE FROM predictions WHERE key = ?", [(key,) for key in stale])
+
+    def statistics(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        self._connection.close()
@@ -21,7 +21,7 @@ def _run_command(args: argparse.Namespace) -> None:
     if args.no_predictions:
         config.output.save_predictions = False
 
-    agent = EvaluationAgent(config)
+    agent = EvaluationAgent(config, resume=args.resume)
     result = agent.run()
 
     summary = {
@@ -29,6 +29,7 @@ def _run_command(args: argparse.Namespace) -> None:
         "task": result.task,
         "metrics": [metric.to_dict() for metric in result.metrics],
         "output_path": str(result.output_path) if result.output_path else None,
+        "statistics": result.statistics,
     }
     print(json.dumps(summary, indent=2))
 
@@ -65,6 +66,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Do not print individual predictions to stdout.",
     )
+    run_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from its checkpoint, skipping completed examples.",
+    )
     run_parser.add_argument(
         "--log-level",
         default="INFO",
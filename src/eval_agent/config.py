@@ -31,6 +31,22 @@ class MetricConfig:
 class OutputConfig:
     directory: Path
     save_predictions: bool = True
+    checkpoint_every: int = 0
+    format: str = "json"
+
+
+@dataclass
+class ConcurrencyConfig:
+    mode: str = "serial"
+    workers: int | None = None
+    chunk_size: int = 1
+
+
+@dataclass
+class CacheConfig:
+    enabled: bool = False
+    path: Path | None = None
+    max_size_mb: float = 1024.0
 
 
 @dataclass
@@ -41,6 +57,9 @@ class EvaluationConfig:
     model: ModelConfig
     metrics: List[MetricConfig]
     output: OutputConfig
+    concurrency: ConcurrencyConfig = field(default_factory=ConcurrencyConfig)
+    streaming: bool = False
+    cache: CacheConfig = field(default_factory=CacheConfig)
 
 
 def _resolve_path(value: str | Path, *, base_dir: Path) -> Path:
@@ -93,6 +112,23 @@ def load_config(path: str | Path) -> EvaluationConfig:
     output_config = OutputConfig(
         directory=_resolve_path(output_dir, base_dir=base_dir),
         save_predictions=output_raw.get("save_predictions", True),
+        checkpoint_every=output_raw.get("checkpoint_every", 0),
+        format=output_raw.get("format", "json"),
+    )
+
+    concurrency_raw = raw.get("concurrency", {})
+    concurrency = ConcurrencyConfig(
+        mode=concurrency_raw.get("mode", "serial"),
+        workers=concurrency_raw.get("workers"),
+        chunk_size=concurrency_raw.get("chunk_size", 1),
+    )
+
+    cache_raw = raw.get("cache", {})
+    cache_path = cache_raw.get("path")
+    cache = CacheConfig(
+        enabled=bool(cache_raw.get("enabled", bool(cache_raw))),
+        path=_resolve_path(cache_path, base_dir=base_dir) if cache_path else None,
+        max_size_mb=cache_raw.get("max_size_mb", 1024.0),
     )
 
     return EvaluationConfig(
@@ -102,4 +138,7 @@ def load_config(path: str | Path) -> EvaluationConfig:
         model=model,
         metrics=metrics,
         output=output_config,
+        concurrency=concurrency,
+        streaming=bool(raw.get("streaming", False)),
+        cache=cache,
     )
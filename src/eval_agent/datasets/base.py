@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
 from eval_agent.types import Example
 
@@ -26,6 +26,13 @@ class Dataset(ABC):
             self._cache = list(self._load())
         return self._cache
 
+    def iter_examples(self) -> Iterator[Example]:
+        """Stream examples without materializing the dataset in memory."""
+
+        if self._cache is not None:
+            return iter(self._cache)
+        return iter(self._load())
+
     @abstractmethod
     def _load(self) -> Iterable[Example]:
         """Load the dataset examples."""
@@ -0,0 +1,159 @@
+"""Executors that control how model calls are dispatched during a run."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import os
+import pickle
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Iterable, Iterator, TypeVar
+
+from eval_agent.registry import EXECUTOR_REGISTRY
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Executor(ABC):
+    """Base class for executors.
+
+    Executors apply a callable to a stream of work items and yield the results in
+    the order the items were received, regardless of the order in which they
+    complete. Items are pulled lazily so at most a bounded window of work is in
+    flight at any time.
+    """
+
+    def __init__(self, *, workers: int | None = None, chunk_size: int = 1) -> None:
+        self.workers = max(1, int(workers)) if workers else (os.cpu_count() or 1)
+        self.chunk_size = max(1, int(chunk_size))
+
+    @abstractmethod
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        """Apply ``fn`` to every item and yield results in input order."""
+
+
+@EXECUTOR_REGISTRY.register("serial")
+class SerialExecutor(Executor):
+    """Run every item on the calling thread."""
+
+    def __init__(self, *, chunk_size: int = 1, **_: Any) -> None:
+        super().__init__(workers=1, chunk_size=chunk_size)
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        for item in items:
+            yield fn(item)
+
+
+def _drain_in_order(
+    submit: Callable[[T], Future],
+    items: Iterable[T],
+    *,
+    window: int,
+) -> Iterator[Any]:
+    pending: Deque[Future] = deque()
+    try:
+        for item in items:
+            pending.append(submit(item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+@EXECUTOR_REGISTRY.register("thread")
+class ThreadExecutor(Executor):
+    """Dispatch items to a pool of threads; suited to I/O-bound adapters."""
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            yield from _drain_in_order(
+                lambda item: pool.submit(fn, item),
+                items,
+                window=self.workers * 2,
+            )
+
+
+_WORKER_CALLABLE: Callable[[Any], Any] | None = None
+
+
+def _install_worker_callable(fn: Callable[[Any], Any]) -> None:
+    global _WORKER_CALLABLE
+    _WORKER_CALLABLE = fn
+
+
+def _call_worker_callable(item: Any) -> Any:
+    if _WORKER_CALLABLE is None:  # pragma: no cover - defensive
+        raise RuntimeError("Process worker was not initialised with a callable")
+    return _WORKER_CALLABLE(item)
+
+
+@EXECUTOR_REGISTRY.register("process")
+class ProcessExecutor(Executor):
+    """Dispatch items to a pool of processes; suited to CPU-bound adapters.
+
+    The callable (and therefore the model it is bound to) is pickled once per
+    worker process rather than once per item, so it must be picklable; this is
+    checked before the pool starts.
+    """
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        try:
+            pickle.dumps(fn)
+        except Exception as exc:  # noqa: BLE001 - pickling raises many exception types
+            owner = type(getattr(fn, "model", fn)).__name__
+            raise ValueError(
+                f"{owner} cannot be sent to worker processes ({exc}); "
+                "use the 'thread' or 'asyncio' concurrency mode instead"
+            ) from exc
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_install_worker_callable,
+            initargs=(fn,),
+        ) as pool:
+            yield from _drain_in_order(
+                lambda item: pool.submit(_call_worker_callable, item),
+                items,
+                window=self.workers * 2,
+            )
+
+
+@EXECUTOR_REGISTRY.register("asyncio")
+class AsyncioExecutor(Executor):
+    """Drive items concurrently from an event loop.
+
+    Coroutine functions are awaited directly; regular callables are offloaded to
+    the loop's default thread pool. ``workers`` bounds the number of items in
+    flight.
+    """
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        loop = asyncio.new_event_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=self.workers))
+        is_coroutine = inspect.iscoroutinefunction(fn)
+
+        async def _invoke(item: T) -> R:
+            if is_coroutine:
+                return await fn(item)  # type: ignore[misc]
+            return await loop.run_in_executor(None, fn, item)
+
+        pending: Deque[asyncio.Task] = deque()
+        try:
+            for item in items:
+                pending.append(loop.create_task(_invoke(item)))
+                if len(pending) >= self.workers:
+                    yield loop.run_until_complete(pending.popleft())
+            while pending:
+                yield loop.run_until_complete(pending.popleft())
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
@@ -3,18 +3,74 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import Callable, Dict, Hashable, List, Mapping, Sequence
 
 from eval_agent.types import Example, MetricResult, ModelResponse
 
 
+class SharedState(ABC):
+    """Run-scoped statistics that several metrics derive their values from.
+
+    A :class:`MetricSuite` creates one instance per distinct key requested by its
+    metrics and updates it once per example/response pair, before any metric is
+    updated, so the cost of the shared work does not grow with the number of
+    metrics that read from it.
+    """
+
+    @abstractmethod
+    def update(self, example: Example, response: ModelResponse) -> None:
+        """Accumulate a single example/response pair."""
+
+
 class Metric(ABC):
-    """Base metric interface."""
+    """Base metric interface.
+
+    Metrics are incremental: ``update`` is called once per example/response pair
+    as predictions are produced and ``finalize`` summarises everything seen since
+    the last ``reset``. ``finalize`` must not clear the accumulated state so it can
+    be called repeatedly, e.g. to report partial values.
+
+    ``streaming`` is set by the owning :class:`MetricSuite` for streaming runs;
+    metrics must then keep memory bounded, i.e. retain no per-example state
+    unless explicitly configured to.
+    """
+
+    streaming: bool = False
 
     def __init__(self, *, name: str | None = None) -> None:
         self.name = name or self.__class__.__name__.lower()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear any accumulated state."""
+
+    def shared_states(self) -> Dict[Hashable, Callable[[], SharedState]]:
+        """Return factories for the shared state this metric reads, keyed for deduplication."""
+
+        return {}
+
+    def bind(self, states: Mapping[Hashable, SharedState]) -> None:
+        """Receive the shared state instances requested via :meth:`shared_states`."""
+
+        _ = states
 
     @abstractmethod
+    def update(self, example: Example, response: ModelResponse) -> None:
+        """Accumulate a single example/response pair."""
+
+    @abstractmethod
+    def finalize(self) -> MetricResult:
+        """Return the metric over every pair seen since the last reset."""
+
+    def current_value(self) -> float:
+        """Return the metric value so far, for progress reports.
+
+        Defaults to ``finalize().value``; metrics whose details grow with the
+        number of examples override it to read their running aggregates only.
+        """
+
+        return self.finalize().value
+
     def compute(
         self,
         *,
@@ -22,3 +78,38 @@ class Metric(ABC):
         responses: Sequence[ModelResponse],
     ) -> MetricResult:
         """Compute the metric for the provided examples and responses."""
+
+        suite = MetricSuite([self])
+        for example, response in zip(examples, responses):
+            suite.update(example, response)
+        return suite.finalize()[0]
+
+
+class MetricSuite:
+    """Evaluate several metrics together, computing shared state only once per pair."""
+
+    def __init__(self, metrics: Sequence[Metric], *, streaming: bool = False) -> None:
+        self.metrics = list(metrics)
+        self._states: Dict[Hashable, SharedState] = {}
+        for metric in self.metrics:
+            metric.streaming = streaming
+            requested = metric.shared_states()
+            for key, factory in requested.items():
+                if key not in self._states:
+                    self._states[key] = factory()
+            metric.reset()
+            metric.bind({key: self._states[key] for key in requested})
+
+    def update(self, example: Example, response: ModelResponse) -> None:
+        for state in self._states.values():
+            state.update(example, response)
+        for metric in self.metrics:
+            metric.update(example, response)
+
+    def finalize(self) -> List[MetricResult]:
+        return [metric.finalize() for metric in self.metrics]
+
+    def current_values(self) -> Dict[str, float]:
+        """Return each metric's value so far without building its details."""
+
+        return {metric.name: metric.current_value() for metric in self.metrics}
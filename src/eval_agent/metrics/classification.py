@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from typing import Dict, Sequence
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Mapping
 
-from eval_agent.metrics.base import Metric
+import numpy as np
+
+from eval_agent.metrics.base import Metric, SharedState
 from eval_agent.registry import METRIC_REGISTRY
 from eval_agent.types import Example, MetricResult, ModelResponse
 
@@ -14,37 +16,95 @@ def _safe_div(numerator: float, denominator: float) -> float:
     return numerator / denominator if denominator else 0.0
 
 
-def _gather_classification_stats(
-    examples: Sequence[Example],
-    responses: Sequence[ModelResponse],
-):
-    labels_set: set[str] = set()
-    tp = defaultdict(int)
-    fp = defaultdict(int)
-    fn = defaultdict(int)
-    support = defaultdict(int)
-    confusion = defaultdict(lambda: defaultdict(int))
-
-    for example, response in zip(examples, responses):
-        gold = str(example.expected_output)
-        pred = str(response.output)
-        labels_set.add(gold)
-        labels_set.add(pred)
-        support[gold] += 1
-        confusion[gold][pred] += 1
-        if gold == pred:
-            tp[gold] += 1
-        else:
-            fn[gold] += 1
-            fp[pred] += 1
-
-    labels = sorted(labels_set)
-    totals = {
-        "tp": sum(tp.values()),
-        "fp": sum(fp.values()),
-        "fn": sum(fn.values()),
-    }
-    return labels, tp, fp, fn, support, confusion, totals
+@dataclass(frozen=True)
+class ClassificationSummary:
+    """Per-label counts derived from a confusion matrix with labels in sorted order."""
+
+    labels: List[str]
+    matrix: np.ndarray
+    tp: Dict[str, int]
+    fp: Dict[str, int]
+    fn: Dict[str, int]
+    support: Dict[str, int]
+    predicted: Dict[str, int]
+    totals: Dict[str, int]
+
+
+class ConfusionCounts(SharedState):
+    """Confusion counts over interned label ids, shared by all classification metrics.
+
+    Labels are stringified and interned once per example. Pairs of label ids are
+    buffered and folded into an integer matrix in bulk, and the derived per-label
+    counts are cached until the next update.
+    """
+
+    _FLUSH_SIZE = 4096
+
+    def __init__(self) -> None:
+        self._label_ids: Dict[str, int] = {}
+        self._labels: List[str] = []
+        self._matrix = np.zeros((0, 0), dtype=np.int64)
+        self._gold_ids: List[int] = []
+        self._pred_ids: List[int] = []
+        self._summary: ClassificationSummary | None = None
+
+    def _intern(self, label: str) -> int:
+        label_id = self._label_ids.get(label)
+        if label_id is None:
+            label_id = len(self._labels)
+            self._label_ids[label] = label_id
+            self._labels.append(label)
+        return label_id
+
+    def update(self, example: Example, response: ModelResponse) -> None:
+        self._gold_ids.append(self._intern(str(example.expected_output)))
+        self._pred_ids.append(self._intern(str(response.output)))
+        self._summary = None
+        if len(self._gold_ids) >= self._FLUSH_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        size = len(self._labels)
+        if self._matrix.shape[0] < size:
+            grown = np.zeros((size, size), dtype=np.int64)
+            previous = self._matrix.shape[0]
+            grown[:previous, :previous] = self._matrix
+            self._matrix = grown
+        if self._gold_ids:
+            flat = np.asarray(self._gold_ids, dtype=np.int64) * size + np.asarray(self._pred_ids, dtype=np.int64)
+            self._matrix += np.bincount(flat, minlength=size * size).reshape(size, size)
+            self._gold_ids.clear()
+            self._pred_ids.clear()
+
+    def summary(self) -> ClassificationSummary:
+        if self._summary is not None:
+            return self._summary
+        self._flush()
+        order = sorted(range(len(self._labels)), key=self._labels.__getitem__)
+        labels = [self._labels[index] for index in order]
+        matrix = self._matrix[np.ix_(order, order)] if order else self._matrix
+
+        diagonal = np.diag(matrix)
+        row_sums = matrix.sum(axis=1)
+        column_sums = matrix.sum(axis=0)
+        tp = dict(zip(labels, diagonal.tolist()))
+        support = dict(zip(labels, row_sums.tolist()))
+        predicted = dict(zip(labels, column_sums.tolist()))
+        fp = dict(zip(labels, (column_sums - diagonal).tolist()))
+        fn = dict(zip(labels, (row_sums - diagonal).tolist()))
+        correct = int(diagonal.sum())
+        errors = int(matrix.sum()) - correct
+        self._summary = ClassificationSummary(
+            labels=labels,
+            matrix=matrix,
+            tp=tp,
+            fp=fp,
+            fn=fn,
+            support=support,
+            predicted=predicted,
+            totals={"tp": correct, "fp": errors, "fn": errors},
+        )
+        return self._summary
 
 
 def _aggregate_scores(
@@ -84,149 +144,136 @@ def _aggregate_scores(
     raise ValueError(f"Unsupported average '{average}'. Use 'macro', 'weighted', or 'micro'.")
 
 
+class _ConfusionMetric(Metric):
+    """Base for metrics derived from the shared :class:`ConfusionCounts`."""
+
+    def reset(self) -> None:
+        self._counts = ConfusionCounts()
+
+    def shared_states(self) -> Dict[Hashable, Callable[[], SharedState]]:
+        return {ConfusionCounts: ConfusionCounts}
+
+    def bind(self, states: Mapping[Hashable, SharedState]) -> None:
+        self._counts = states[ConfusionCounts]  # type: ignore[assignment]
+
+    def update(self, example: Example, response: ModelResponse) -> None:
+        # The owning MetricSuite updates the shared counts once per pair.
+        _ = (example, response)
+
+
 @METRIC_REGISTRY.register("accuracy")
 class AccuracyMetric(Metric):
     """Compute simple accuracy."""
 
-    def compute(
-        self,
-        *,
-        examples: Sequence[Example],
-        responses: Sequence[ModelResponse],
-    ) -> MetricResult:
-        correct = 0
-        total = len(responses)
-        for example, response in zip(examples, responses):
-            if example.expected_output == response.output:
-                correct += 1
+    def reset(self) -> None:
+        self._correct = 0
+        self._total = 0
+
+    def update(self, example: Example, response: ModelResponse) -> None:
+        self._total += 1
+        if example.expected_output == response.output:
+            self._correct += 1
+
+    def finalize(self) -> MetricResult:
+        correct = self._correct
+        total = self._total
         value = (correct / total) if total else 0.0
         details = {"correct": correct, "total": total}
         return MetricResult(name=self.name, value=value, details=details)
 
 
 @METRIC_REGISTRY.register("precision")
-class PrecisionMetric(Metric):
+class PrecisionMetric(_ConfusionMetric):
     """Compute precision for classification tasks."""
 
     def __init__(self, *, average: str = "macro", name: str | None = None) -> None:
         super().__init__(name=name)
         self.average = average
 
-    def compute(
-        self,
-        *,
-        examples: Sequence[Example],
-        responses: Sequence[ModelResponse],
-    ) -> MetricResult:
-        labels, tp, fp, fn, support, _confusion, totals = _gather_classification_stats(examples, responses)
-        per_label = {label: _safe_div(tp[label], tp[label] + fp[label]) for label in labels}
-        value = _aggregate_scores(per_label, support, self.average, totals=totals, score="precision")
+    def finalize(self) -> MetricResult:
+        stats = self._counts.summary()
+        per_label = {
+            label: _safe_div(stats.tp[label], stats.tp[label] + stats.fp[label]) for label in stats.labels
+        }
+        value = _aggregate_scores(per_label, stats.support, self.average, totals=stats.totals, score="precision")
         details = {
             "average": self.average,
             "per_label": per_label,
-            "support": {label: int(support[label]) for label in labels},
+            "support": dict(stats.support),
         }
         return MetricResult(name=self.name, value=value, details=details)
 
 
 @METRIC_REGISTRY.register("recall")
-class RecallMetric(Metric):
+class RecallMetric(_ConfusionMetric):
     """Compute recall for classification tasks."""
 
     def __init__(self, *, average: str = "macro", name: str | None = None) -> None:
         super().__init__(name=name)
         self.average = average
 
-    def compute(
-        self,
-        *,
-        examples: Sequence[Example],
-        responses: Sequence[ModelResponse],
-    ) -> MetricResult:
-        labels, tp, fp, fn, support, _confusion, totals = _gather_classification_stats(examples, responses)
-        per_label = {label: _safe_div(tp[label], tp[label] + fn[label]) for label in labels}
-        value = _aggregate_scores(per_label, support, self.average, totals=totals, score="recall")
+    def finalize(self) -> MetricResult:
+        stats = self._counts.summary()
+        per_label = {
+            label: _safe_div(stats.tp[label], stats.tp[label] + stats.fn[label]) for label in stats.labels
+        }
+        value = _aggregate_scores(per_label, stats.support, self.average, totals=stats.totals, score="recall")
         details = {
             "average": self.average,
             "per_label": per_label,
-            "support": {label: int(support[label]) for label in labels},
+            "support": dict(stats.support),
         }
         return MetricResult(name=self.name, value=value, details=details)
 
 
 @METRIC_REGISTRY.register("f1")
-class F1ScoreMetric(Metric):
+class F1ScoreMetric(_ConfusionMetric):
     """Compute the F1-score for classification tasks."""
 
     def __init__(self, *, average: str = "macro", name: str | None = None) -> None:
         super().__init__(name=name)
         self.average = average
 
-    def compute(
-        self,
-        *,
-        examples: Sequence[Example],
-        responses: Sequence[ModelResponse],
-    ) -> MetricResult:
-        labels, tp, fp, fn, support, _confusion, totals = _gather_classification_stats(examples, responses)
-        per_label_precision = {label: _safe_div(tp[label], tp[label] + fp[label]) for label in labels}
-        per_label_recall = {label: _safe_div(tp[label], tp[label] + fn[label]) for label in labels}
+    def finalize(self) -> MetricResult:
+        stats = self._counts.summary()
         per_label = {}
-        for label in labels:
-            precision = per_label_precision[label]
-            recall = per_label_recall[label]
+        for label in stats.labels:
+            precision = _safe_div(stats.tp[label], stats.tp[label] + stats.fp[label])
+            recall = _safe_div(stats.tp[label], stats.tp[label] + stats.fn[label])
             if precision + recall == 0:
                 per_label[label] = 0.0
             else:
                 per_label[label] = 2 * precision * recall / (precision + recall)
-        value = _aggregate_scores(per_label, support, self.average, totals=totals, score="f1")
+        value = _aggregate_scores(per_label, stats.support, self.average, totals=stats.totals, score="f1")
         details = {
             "average": self.average,
             "per_label": per_label,
-            "support": {label: int(support[label]) for label in labels},
+            "support": dict(stats.support),
         }
         return MetricResult(name=self.name, value=value, details=details)
 
 
 @METRIC_REGISTRY.register("confusion-matrix")
-class ConfusionMatrixMetric(Metric):
+class ConfusionMatrixMetric(_ConfusionMetric):
     """Compute a confusion matrix."""
 
-    def compute(
-        self,
-        *,
-        examples: Sequence[Example],
-        responses: Sequence[ModelResponse],
-    ) -> MetricResult:
-        labels, _tp, _fp, _fn, _support, confusion, _totals = _gather_classification_stats(examples, responses)
-        matrix = [
-            [int(confusion[gold].get(pred, 0)) for pred in labels]
-            for gold in labels
-        ]
+    def finalize(self) -> MetricResult:
+        stats = self._counts.summary()
         details = {
-            "labels": labels,
-            "matrix": matrix,
+            "labels": list(stats.labels),
+            "matrix": stats.matrix.tolist(),
         }
         return MetricResult(name=self.name, value=1.0, details=details)
 
 
 @METRIC_REGISTRY.register("label-distribution")
-class LabelDistributionMetric(Metric):
+class LabelDistributionMetric(_ConfusionMetric):
     """Summarize the distribution of predicted and reference labels."""
 
-    def compute(
-        self,
-        *,
-        examples: Sequence[Example],
-        responses: Sequence[ModelResponse],
-    ) -> MetricResult:
-        gold_counter: Counter[str] = Counter()
-        pred_counter: Counter[str] = Counter()
-        for example, response in zip(examples, responses):
-            gold_counter[str(example.expected_output)] += 1
-            pred_counter[str(response.output)] += 1
+    def finalize(self) -> MetricResult:
+        stats = self._counts.summary()
         details: Dict[str, Dict[str, int]] = {
-            "gold": dict(sorted(gold_counter.items())),
-            "predicted": dict(sorted(pred_counter.items())),
+            "gold": {label: count for label, count in stats.support.items() if count},
+            "predicted": {label: count for label, count in stats.predicted.items() if count},
         }
         return MetricResult(name=self.name, value=1.0, details=details)
@@ -3,74 +3,211 @@
 from __future__ import annotations
 
 import math
-from collections import Counter
-from typing import Dict, Sequence
+from typing import Callable, Dict, Hashable, Iterable, List, Mapping, Sequence, Tuple
 
-from eval_agent.metrics.base import Metric
+from eval_agent.metrics.base import Metric, SharedState
+from eval_agent.metrics.tokenization import (
+    TokenCache,
+    TokenizedPair,
+    TokenizerSpec,
+    token_state_factory,
+    token_state_key,
+)
 from eval_agent.registry import METRIC_REGISTRY
 from eval_agent.types import Example, MetricResult, ModelResponse
 
 
-def _tokenize(text: str) -> list[str]:
-    return [token for token in text.lower().split() if token]
+class _TokenizedMetric(Metric):
+    """Base for metrics reading interned tokens from the shared :class:`TokenCache`.
 
+    ``tokenizer`` names a registered tokenizer, or is a mapping with a ``type``
+    and its parameters; metrics configured with the same tokenizer share one cache.
+    Scores are averaged from a running sum. Per-example scores are kept for the
+    details when ``per_example`` is set, and by default unless the run streams.
+    """
 
-def _lcs_length(reference: Sequence[str], hypothesis: Sequence[str]) -> int:
-    if not reference or not hypothesis:
+    def __init__(
+        self,
+        *,
+        tokenizer: TokenizerSpec = "whitespace",
+        per_example: bool | None = None,
+        name: str | None = None,
+    ) -> None:
+        self.tokenizer = tokenizer
+        self.per_example = per_example
+        self._state_key = token_state_key(tokenizer)
+        self._tokens: TokenCache | None = None
+        super().__init__(name=name)
+
+    def shared_states(self) -> Dict[Hashable, Callable[[], SharedState]]:
+        return {self._state_key: token_state_factory(self.tokenizer)}
+
+    def bind(self, states: Mapping[Hashable, SharedState]) -> None:
+        self._tokens = states[self._state_key]  # type: ignore[assignment]
+
+    def _pair(self) -> TokenizedPair:
+        if self._tokens is None or self._tokens.current is None:
+            raise RuntimeError(f"Metric '{self.name}' must be updated through a MetricSuite")
+        return self._tokens.current
+
+    def _keeps_per_example(self) -> bool:
+        return self.per_example if self.per_example is not None else not self.streaming
+
+    def _reset_scores(self) -> None:
+        self._per_example: Dict[str, float] = {}
+        self._score_sum = 0.0
+        self._scored = 0
+
+    def _add_score(self, uid: str, score: float) -> None:
+        self._score_sum += score
+        self._scored += 1
+        if self._keeps_per_example():
+            self._per_example[uid] = score
+
+    def _mean_score(self) -> float:
+        return self._score_sum / self._scored if self._scored else 0.0
+
+
+def _match_masks(tokens: Sequence[Hashable]) -> Dict[Hashable, int]:
+    """Map each distinct token to the bitmask of its positions in ``tokens``."""
+
+    masks: Dict[Hashable, int] = {}
+    for position, token in enumerate(tokens):
+        masks[token] = masks.get(token, 0) | (1 << position)
+    return masks
+
+
+def _lcs_from_masks(masks: Dict[Hashable, int], length: int, other: Sequence[Hashable]) -> int:
+    """LCS length of ``other`` and the ``length``-token sequence encoded by ``masks``."""
+
+    if not length:
         return 0
-    lengths = [[0] * (len(hypothesis) + 1) for _ in range(len(reference) + 1)]
-    for i, ref_token in enumerate(reference, start=1):
-        for j, hyp_token in enumerate(hypothesis, start=1):
-            if ref_token == hyp_token:
-                lengths[i][j] = lengths[i - 1][j - 1] + 1
-            else:
-                lengths[i][j] = max(lengths[i - 1][j], lengths[i][j - 1])
-    return lengths[-1][-1]
+    mask = (1 << length) - 1
+    row = mask
+    for token in other:
+        match = masks.get(token)
+        if match is None:
+            continue
+        carry = row & match
+        row = ((row + carry) | (row - carry)) & mask
+    return length - bin(row).count("1")
+
+
+def _lcs_length(reference: Sequence[Hashable], hypothesis: Sequence[Hashable]) -> int:
+    """Length of the longest common subsequence using bit-parallel dynamic programming.
+
+    Implements the Allison-Dix/Hyyrö recurrence: the shorter sequence is encoded
+    as one match bitmask per distinct token, and each token of the longer sequence
+    updates a single row bit vector (a Python int) with a handful of word-level
+    operations, so time is O(n * m / wordsize) and memory O(m).
+    """
+
+    if len(reference) < len(hypothesis):
+        reference, hypothesis = hypothesis, reference
+    return _lcs_from_masks(_match_masks(hypothesis), len(hypothesis), reference)
+
+
+def _lcs_lengths(pairs: Iterable[Tuple[Sequence[Hashable], Sequence[Hashable]]]) -> List[int]:
+    """LCS lengths for many (reference, hypothesis) pairs, encoding each distinct reference once.
+
+    The bit vector runs over the reference, so its match bitmasks are built once
+    per distinct reference in the batch and reused for every hypothesis scored
+    against it (repeated gold answers are common in QA and classification-style
+    generation sets).
+    """
+
+    encoded: Dict[Tuple[Hashable, ...], Dict[Hashable, int]] = {}
+    lengths: List[int] = []
+    for reference, hypothesis in pairs:
+        key = tuple(reference)
+        masks = encoded.get(key)
+        if masks is None:
+            masks = encoded[key] = _match_masks(reference)
+        lengths.append(_lcs_from_masks(masks, len(reference), hypothesis))
+    return lengths
 
 
 @METRIC_REGISTRY.register("rouge-l")
-class RougeLMetric(Metric):
+class RougeLMetric(_TokenizedMetric):
     """Compute ROUGE-L F1 scores averaged across examples."""
 
-    def compute(
-        self,
-        *,
-        examples: Sequence[Example],
-        responses: Sequence[ModelResponse],
-    ) -> MetricResult:
-        per_example: Dict[str, float] = {}
-        for example, response in zip(examples, responses):
-            reference_tokens = _tokenize(str(example.expected_output))
-            hypothesis_tokens = _tokenize(str(response.output))
-            if not reference_tokens and not hypothesis_tokens:
-                score = 1.0
-            else:
-                lcs = _lcs_length(reference_tokens, hypothesis_tokens)
-                precision = lcs / len(hypothesis_tokens) if hypothesis_tokens else 0.0
-                recall = lcs / len(reference_tokens) if reference_tokens else 0.0
-                score = 0.0
-                if precision + recall > 0:
-                    score = (2 * precision * recall) / (precision + recall)
-            per_example[example.uid] = score
-
-        value = sum(per_example.values()) / len(per_example) if per_example else 0.0
-        details = {"per_example": per_example}
-        return MetricResult(name=self.name, value=value, details=details)
+    _FLUSH_SIZE = 1024
 
+    def reset(self) -> None:
+        self._reset_scores()
+        self._pending: List[Tuple[str, List[int], List[int]]] = []
 
-def _modified_precision(candidate: list[str], reference: list[str], n: int) -> float:
-    if len(candidate) < n:
-        return 0.0
-    candidate_counts = Counter(tuple(candidate[i : i + n]) for i in range(len(candidate) - n + 1))
-    reference_counts = Counter(tuple(reference[i : i + n]) for i in range(len(reference) - n + 1))
-    clipped = {
-        ngram: min(count, reference_counts.get(ngram, 0)) for ngram, count in candidate_counts.items()
-    }
-    numerator = sum(clipped.values())
-    denominator = sum(candidate_counts.values())
-    if not denominator:
-        return 0.0
-    return numerator / denominator
+    def update(self, example: Example, response: ModelResponse) -> None:
+        pair = self._pair()
+        reference_tokens, hypothesis_tokens = pair.reference, pair.hypothesis
+        if not reference_tokens and not hypothesis_tokens:
+            self._add_score(example.uid, 1.0)
+            return
+        if self._keeps_per_example():
+            # Keep the slot so per-example scores stay in arrival order.
+            self._per_example[example.uid] = 0.0
+        self._pending.append((example.uid, reference_tokens, hypothesis_tokens))
+        if len(self._pending) >= self._FLUSH_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        pending, self._pending = self._pending, []
+        lengths = _lcs_lengths((reference, hypothesis) for _uid, reference, hypothesis in pending)
+        for (uid, reference_tokens, hypothesis_tokens), lcs in zip(pending, lengths):
+            precision = lcs / len(hypothesis_tokens) if hypothesis_tokens else 0.0
+            recall = lcs / len(reference_tokens) if reference_tokens else 0.0
+            score = 0.0
+            if precision + recall > 0:
+                score = (2 * precision * recall) / (precision + recall)
+            self._add_score(uid, score)
+
+    def finalize(self) -> MetricResult:
+        self._flush()
+        details = {"per_example": dict(self._per_example)} if self._keeps_per_example() else {}
+        return MetricResult(name=self.name, value=self._mean_score(), details=details)
+
+    def current_value(self) -> float:
+        self._flush()
+        return self._mean_score()
+
+
+# Token ids are packed into one int per n-gram, ``_NGRAM_SHIFT`` bits per token.
+_NGRAM_SHIFT = 32
+
+
+def _ngram_counts(tokens: Sequence[int], max_n: int) -> List[Dict[int, int]]:
+    """Count every n-gram up to ``max_n`` in one pass, keyed by packed token ids."""
+
+    counts: List[Dict[int, int]] = [{} for _ in range(max_n)]
+    length = len(tokens)
+    for start in range(length):
+        key = 0
+        for order in range(min(max_n, length - start)):
+            key = (key << _NGRAM_SHIFT) | tokens[start + order]
+            table = counts[order]
+            table[key] = table.get(key, 0) + 1
+    return counts
+
+
+def _clipped_matches(
+    candidate: List[Dict[int, int]],
+    references: Sequence[List[Dict[int, int]]],
+) -> List[int]:
+    """Per-order candidate n-gram matches, clipped by the maximum reference count."""
+
+    matches: List[int] = []
+    for order, table in enumerate(candidate):
+        total = 0
+        for key, count in table.items():
+            limit = max(reference[order].get(key, 0) for reference in references)
+            if limit:
+                total += count if count < limit else limit
+        matches.append(total)
+    return matches
+
+
+def _closest_reference_length(candidate_len: int, reference_lengths: Sequence[int]) -> int:
+    return min(reference_lengths, key=lambda length: (abs(length - candidate_len), length))
 
 
 def _brevity_penalty(candidate_len: int, reference_len: int) -> float:
@@ -82,88 +219,121 @@ def _brevity_penalty(candidate_len: int, reference_len: int) -> float:
 
 
 @METRIC_REGISTRY.register("bleu")
-class BleuMetric(Metric):
-    """Compute corpus-level BLEU with smoothing to avoid zero scores."""
+class BleuMetric(_TokenizedMetric):
+    """Compute BLEU with smoothing to avoid zero scores.
 
-    def __init__(self, *, max_n: int = 4, smoothing: float = 1e-9, name: str | None = None) -> None:
-        super().__init__(name=name)
-        self.max_n = max(1, max_n)
-        self.smoothing = smoothing
+    In ``corpus`` mode (the default) clipped n-gram matches, candidate n-gram
+    totals and lengths are summed over the whole corpus and combined once, as in
+    the original BLEU definition. ``sentence`` mode averages per-example scores.
+    When ``expected_output`` is a list, every entry is used as a reference. Set
+    ``sentence_scores`` to also score sentences in corpus mode; the scores are
+    listed in the details subject to ``per_example``.
+    """
 
-    def compute(
+    def __init__(
         self,
         *,
-        examples: Sequence[Example],
-        responses: Sequence[ModelResponse],
-    ) -> MetricResult:
-        per_example: Dict[str, float] = {}
-        for example, response in zip(examples, responses):
-            reference_tokens = _tokenize(str(example.expected_output))
-            candidate_tokens = _tokenize(str(response.output))
-            if not candidate_tokens:
-                per_example[example.uid] = 0.0
-                continue
-
-            precisions: list[float] = []
-            for n in range(1, self.max_n + 1):
-                precision = _modified_precision(candidate_tokens, reference_tokens, n)
-                if precision <= 0:
-                    precision = self.smoothing
-                precisions.append(precision)
-
-            geo_mean = math.exp(sum(math.log(p) for p in precisions) / len(precisions))
-            bp = _brevity_penalty(len(candidate_tokens), len(reference_tokens))
-            per_example[example.uid] = bp * geo_mean
-
-        value = sum(per_example.values()) / len(per_example) if per_example else 0.0
-        details = {"per_example": per_example, "max_n": self.max_n}
+        max_n: int = 4,
+        smoothing: float = 1e-9,
+        mode: str = "corpus",
+        sentence_scores: bool = False,
+        tokenizer: TokenizerSpec = "whitespace",
+        per_example: bool | None = None,
+        name: str | None = None,
+    ) -> None:
+        if mode not in {"corpus", "sentence"}:
+            raise ValueError(f"Unsupported BLEU mode '{mode}'. Use 'corpus' or 'sentence'.")
+        self.max_n = max(1, max_n)
+        self.smoothing = smoothing
+        self.mode = mode
+        self.sentence_scores = sentence_scores or mode == "sentence"
+        super().__init__(tokenizer=tokenizer, per_example=per_example, name=name)
+
+    def reset(self) -> None:
+        self._reset_scores()
+        self._matches = [0] * self.max_n
+        self._totals = [0] * self.max_n
+        self._candidate_length = 0
+        self._reference_length = 0
+
+    def update(self, example: Example, response: ModelResponse) -> None:
+        pair = self._pair()
+        candidate_tokens = pair.hypothesis
+        candidate_len = len(candidate_tokens)
+        reference_len = _closest_reference_length(candidate_len, [len(tokens) for tokens in pair.references])
+        self._candidate_length += candidate_len
+        self._reference_length += reference_len
+        if not candidate_tokens:
+            if self.sentence_scores:
+                self._add_score(example.uid, 0.0)
+            return
+
+        matches = _clipped_matches(
+            _ngram_counts(candidate_tokens, self.max_n),
+            [_ngram_counts(tokens, self.max_n) for tokens in pair.references],
+        )
+        totals = [max(candidate_len - order, 0) for order in range(self.max_n)]
+        for order in range(self.max_n):
+            self._matches[order] += matches[order]
+            self._totals[order] += totals[order]
+        if self.sentence_scores:
+            self._add_score(example.uid, self._score(matches, totals, candidate_len, reference_len))
+
+    def _precisions(self, matches: Sequence[int], totals: Sequence[int]) -> List[float]:
+        return [
+            matched / total if matched and total else self.smoothing for matched, total in zip(matches, totals)
+        ]
+
+    def _score(self, matches: Sequence[int], totals: Sequence[int], candidate_len: int, reference_len: int) -> float:
+        precisions = self._precisions(matches, totals)
+        geo_mean = math.exp(sum(math.log(p) for p in precisions) / len(precisions))
+        return _brevity_penalty(candidate_len, reference_len) * geo_mean
+
+    def current_value(self) -> float:
+        if self.mode == "sentence":
+            return self._mean_score()
+        return self._score(self._matches, self._totals, self._candidate_length, self._reference_length)
+
+    def finalize(self) -> MetricResult:
+        details: Dict[str, object] = {"max_n": self.max_n, "mode": self.mode}
+        value = self.current_value()
+        if self.mode == "corpus":
+            details.update(
+                precisions=self._precisions(self._matches, self._totals),
+                brevity_penalty=_brevity_penalty(self._candidate_length, self._reference_length),
+                hypothesis_length=self._candidate_length,
+                reference_length=self._reference_length,
+            )
+        if self.sentence_scores and self._keeps_per_example():
+            details["per_example"] = dict(self._per_example)
         return MetricResult(name=self.name, value=value, details=details)
 
 
 @METRIC_REGISTRY.register("context-precision")
-class ContextPrecisionMetric(Metric):
+class ContextPrecisionMetric(_TokenizedMetric):
     """Approximate hallucination checks by measuring context token overlap."""
 
-    def compute(
-        self,
-        *,
-        examples: Sequence[Example],
-        responses: Sequence[ModelResponse],
-    ) -> MetricResult:
-        per_example: Dict[str, float] = {}
-        for example, response in zip(examples, responses):
-            predicted_tokens = _tokenize(str(response.output))
-            if not predicted_tokens:
-                per_example[example.uid] = 0.0
-                continue
-
-            context_texts: list[str] = []
-            metadata = response.metadata or {}
-            retrieved = metadata.get("retrieved_documents")
-            if isinstance(retrieved, list):
-                for entry in retrieved:
-                    if isinstance(entry, dict):
-                        text = entry.get("text")
-                        if isinstance(text, str):
-                            context_texts.append(text)
-
-            if not context_texts and example.metadata:
-                references = example.metadata.get("reference_contexts")
-                if isinstance(references, list):
-                    context_texts.extend(str(item) for item in references)
-
-            if not context_texts:
-                per_example[example.uid] = 0.0
-                continue
-
-            context_tokens = set(_tokenize(" ".join(context_texts)))
-            if not context_tokens:
-                per_example[example.uid] = 0.0
-                continue
-
-            hits = sum(1 for token in predicted_tokens if token in context_tokens)
-            per_example[example.uid] = hits / len(predicted_tokens)
-
-        value = sum(per_example.values()) / len(per_example) if per_example else 0.0
-        details = {"per_example": per_example}
-        return MetricResult(name=self.name, value=value, details=details)
+    def reset(self) -> None:
+        self._reset_scores()
+
+    def update(self, example: Example, response: ModelResponse) -> None:
+        pair = self._pair()
+        predicted_tokens = pair.hypothesis
+        if not predicted_tokens:
+            self._add_score(example.uid, 0.0)
+            return
+
+        context_tokens = pair.contexts
+        if not context_tokens:
+            self._add_score(example.uid, 0.0)
+            return
+
+        hits = sum(1 for token in predicted_tokens if token in context_tokens)
+        self._add_score(example.uid, hits / len(predicted_tokens))
+
+    def finalize(self) -> MetricResult:
+        details = {"per_example": dict(self._per_example)} if self._keeps_per_example() else {}
+        return MetricResult(name=self.name, value=self._mean_score(), details=details)
+
+    def current_value(self) -> float:
+        return self._mean_score()
@@ -0,0 +1,187 @@
+"""Run-scoped tokenization shared by the generation metrics."""
+
+from __future__ import annotations
+
+import json
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Mapping, Tuple
+
+from eval_agent.metrics.base import SharedState
+from eval_agent.registry import TOKENIZER_REGISTRY
+from eval_agent.types import Example, ModelResponse
+
+
+class Tokenizer(ABC):
+    """Split text into string tokens."""
+
+    @abstractmethod
+    def tokenize(self, text: str) -> List[str]:
+        """Return the tokens of ``text``."""
+
+
+@TOKENIZER_REGISTRY.register("whitespace")
+class WhitespaceTokenizer(Tokenizer):
+    """Lower-cased whitespace tokenization (the historical default)."""
+
+    def tokenize(self, text: str) -> List[str]:
+        return [token for token in text.lower().split() if token]
+
+
+@TOKENIZER_REGISTRY.register("regex")
+class RegexTokenizer(Tokenizer):
+    """Tokens are the matches of ``pattern`` (word characters by default)."""
+
+    def __init__(self, *, pattern: str = r"\w+", lowercase: bool = True) -> None:
+        self.lowercase = lowercase
+        self._pattern = re.compile(pattern)
+
+    def tokenize(self, text: str) -> List[str]:
+        return self._pattern.findall(text.lower() if self.lowercase else text)
+
+
+@TOKENIZER_REGISTRY.register("subword")
+class SubwordTokenizer(Tokenizer):
+    """Subword tokens from a Hugging Face ``tokenizers`` model.
+
+    Load the model from a serialized ``tokenizer.json`` via ``path`` or by hub
+    ``name``. Requires the optional ``tokenizers`` package.
+    """
+
+    def __init__(self, *, path: str | None = None, name: str | None = None, lowercase: bool = False) -> None:
+        try:
+            from tokenizers import Tokenizer as HFTokenizer
+        except ImportError as exc:
+            raise ImportError("The 'subword' tokenizer requires the 'tokenizers' package") from exc
+        if path:
+            self._tokenizer = HFTokenizer.from_file(path)
+        elif name:
+            self._tokenizer = HFTokenizer.from_pretrained(name)
+        else:
+            raise ValueError("The 'subword' tokenizer needs either a 'path' or a 'name'")
+        self.lowercase = lowercase
+
+    def tokenize(self, text: str) -> List[str]:
+        encoding = self._tokenizer.encode(text.lower() if self.lowercase else text, add_special_tokens=False)
+        return list(encoding.tokens)
+
+
+TokenizerSpec = str | Mapping[str, Any]
+
+
+def _parse_spec(spec: TokenizerSpec) -> Tuple[str, Dict[str, Any]]:
+    if isinstance(spec, str):
+        return spec, {}
+    parameters = dict(spec)
+    return parameters.pop("type", "whitespace"), parameters
+
+
+def token_state_key(spec: TokenizerSpec) -> Hashable:
+    """Key under which metrics using the same tokenizer share a :class:`TokenCache`."""
+
+    kind, parameters = _parse_spec(spec)
+    return ("tokens", kind, json.dumps(parameters, sort_keys=True))
+
+
+def token_state_factory(spec: TokenizerSpec) -> Callable[[], "TokenCache"]:
+    kind, parameters = _parse_spec(spec)
+    return lambda: TokenCache(TOKENIZER_REGISTRY.create(kind, **parameters))
+
+
+@dataclass
+class TokenizedPair:
+    """Interned token ids for the current example/response pair.
+
+    ``references`` holds one id list per reference when ``expected_output`` is a
+    list of alternatives, otherwise just ``[reference]``.
+    """
+
+    reference: List[int]
+    hypothesis: List[int]
+    references: List[List[int]]
+    _contexts: Callable[[], FrozenSet[int] | None] = field(repr=False)
+    _context_ids: FrozenSet[int] | None = field(default=None, init=False, repr=False)
+    _context_loaded: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def contexts(self) -> FrozenSet[int] | None:
+        """Distinct token ids across the retrieved (or reference) contexts, if any.
+
+        Computed on first access so metrics that ignore contexts do not pay for them.
+        """
+
+        if not self._context_loaded:
+            self._context_ids = self._contexts()
+            self._context_loaded = True
+        return self._context_ids
+
+
+def _context_texts(example: Example, response: ModelResponse) -> List[str]:
+    texts: List[str] = []
+    retrieved = (response.metadata or {}).get("retrieved_documents")
+    if isinstance(retrieved, list):
+        for entry in retrieved:
+            if isinstance(entry, dict):
+                text = entry.get("text")
+                if isinstance(text, str):
+                    texts.append(text)
+
+    if not texts and example.metadata:
+        references = example.metadata.get("reference_contexts")
+        if isinstance(references, list):
+            texts.extend(str(item) for item in references)
+    return texts
+
+
+class TokenCache(SharedState):
+    """Tokenize each pair once and intern tokens to integer ids for every metric.
+
+    Context passages repeat across examples (they come from the same corpus), so
+    their token id sets are memoised by text.
+    """
+
+    _CONTEXT_MEMO_SIZE = 65536
+
+    def __init__(self, tokenizer: Tokenizer) -> None:
+        self.tokenizer = tokenizer
+        self.vocabulary: Dict[str, int] = {}
+        self.current: TokenizedPair | None = None
+        self._context_memo: Dict[str, FrozenSet[int]] = {}
+
+    def encode(self, text: str) -> List[int]:
+        vocabulary = self.vocabulary
+        ids = []
+        for token in self.tokenizer.tokenize(text):
+            token_id = vocabulary.get(token)
+            if token_id is None:
+                token_id = vocabulary[token] = len(vocabulary)
+            ids.append(token_id)
+        return ids
+
+    def update(self, example: Example, response: ModelResponse) -> None:
+        expected = example.expected_output
+        reference = self.encode(str(expected))
+        if isinstance(expected, (list, tuple)) and expected:
+            references = [self.encode(str(item)) for item in expected]
+        else:
+            references = [reference]
+        self.current = TokenizedPair(
+            reference=reference,
+            hypothesis=self.encode(str(response.output)),
+            references=references,
+            _contexts=lambda: self._encode_contexts(_context_texts(example, response)),
+        )
+
+    def _encode_contexts(self, texts: List[str]) -> FrozenSet[int] | None:
+        if not texts:
+            return None
+        combined: set[int] = set()
+        for text in texts:
+            ids = self._context_memo.get(text)
+            if ids is None:
+                if len(self._context_memo) >= self._CONTEXT_MEMO_SIZE:
+                    self._context_memo.clear()
+                ids = self._context_memo[text] = frozenset(self.encode(text))
+            combined.update(ids)
+        return frozenset(combined)
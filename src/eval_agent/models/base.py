@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable, List, Sequence
+from typing import Any, Dict, Iterable, List, Sequence
 
 from eval_agent.types import Example, ModelResponse
 
@@ -25,3 +25,29 @@ class ModelAdapter(ABC):
         """Hook for preparing the model before evaluation."""
 
         _ = examples
+
+    def cache_fingerprint(self) -> str | None:
+        """Identify state outside the configuration that determines predictions.
+
+        The prediction cache keys entries by model type and parameters; adapters
+        whose outputs also depend on external artifacts return a digest of them.
+        """
+
+        return None
+
+    def cache_key_fields(self, example: Example) -> Any:
+        """Return the parts of ``example`` a response depends on, for prediction cache keys.
+
+        Defaults to the inputs; adapters whose output or metadata also reflect the
+        example ``uid`` or ``metadata`` include them.
+        """
+
+        return example.inputs
+
+    def statistics(self) -> Dict[str, Any]:
+        """Return adapter-specific figures (e.g. index build time) to report with the run."""
+
+        return {}
+
+    def close(self) -> None:
+        """Hook for releasing resources (connections, threads) once evaluation ends."""
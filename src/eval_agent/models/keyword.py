@@ -2,13 +2,84 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Sequence
+from collections import deque
+from typing import Dict, Iterable, List, Sequence, Tuple
 
 from eval_agent.models.base import ModelAdapter
 from eval_agent.registry import MODEL_REGISTRY
 from eval_agent.types import Example, ModelResponse
 
 
+_NO_MATCH = -1
+
+
+class _KeywordAutomaton:
+    """Aho-Corasick automaton reporting the best-ranked keyword found in a text.
+
+    Every keyword carries a rank (lower wins). Each state stores the best rank
+    among the keywords ending there, including those reachable through failure
+    links, so a single pass over the text finds the winning keyword no matter
+    where in the text it occurs.
+    """
+
+    def __init__(self, keywords: Sequence[str]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._best: List[int] = [_NO_MATCH]
+        self._always = _NO_MATCH
+
+        for rank, keyword in enumerate(keywords):
+            if not keyword:
+                # The empty string occurs in every text.
+                if self._always == _NO_MATCH:
+                    self._always = rank
+                continue
+            state = 0
+            for char in keyword:
+                following = self._goto[state].get(char)
+                if following is None:
+                    following = len(self._goto)
+                    self._goto[state][char] = following
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._best.append(_NO_MATCH)
+                state = following
+            if self._best[state] == _NO_MATCH:
+                self._best[state] = rank
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            inherited = self._best[self._fail[state]]
+            if inherited != _NO_MATCH and (self._best[state] == _NO_MATCH or inherited < self._best[state]):
+                self._best[state] = inherited
+            for char, following in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[following] = self._goto[fallback].get(char, 0)
+                queue.append(following)
+
+    def search(self, text: str) -> int:
+        """Return the lowest rank of any keyword occurring in ``text``, or -1."""
+
+        goto, fail, best = self._goto, self._fail, self._best
+        found = self._always
+        if found == 0:
+            return found
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            rank = best[state]
+            if rank != _NO_MATCH and (found == _NO_MATCH or rank < found):
+                found = rank
+                if found == 0:
+                    break
+        return found
+
+
 @MODEL_REGISTRY.register("keyword-matching")
 class KeywordMatchingModel(ModelAdapter):
     """A lightweight rule-based classifier.
@@ -45,6 +116,15 @@ class KeywordMatchingModel(ModelAdapter):
         self.default_label = default_label
         self.priority = list(priority or ("positive", "negative"))
 
+        # Keywords are ranked by category priority, then by their order within the
+        # category, which reproduces the first-match semantics in a single scan.
+        self._ranked: List[Tuple[str, str]] = []
+        for category in self.priority:
+            keywords = self.positive_keywords if category == "positive" else self.negative_keywords
+            label = "positive" if category == "positive" else "negative"
+            self._ranked.extend((label, keyword) for keyword in keywords)
+        self._automaton = _KeywordAutomaton([keyword for _label, keyword in self._ranked])
+
     def _normalize(self, text: str) -> str:
         return text if self.case_sensitive else text.lower()
 
@@ -54,16 +134,9 @@ class KeywordMatchingModel(ModelAdapter):
         match_label: str | None = None
         matched_keyword: str | None = None
 
-        for category in self.priority:
-            keywords = self.positive_keywords if category == "positive" else self.negative_keywords
-            label = "positive" if category == "positive" else "negative"
-            for keyword in keywords:
-                if keyword in normalized:
-                    match_label = label
-                    matched_keyword = keyword
-                    break
-            if match_label is not None:
-                break
+        rank = self._automaton.search(normalized)
+        if rank != _NO_MATCH:
+            match_label, matched_keyword = self._ranked[rank]
 
         output = match_label if match_label is not None else self.default_label
         metadata = {
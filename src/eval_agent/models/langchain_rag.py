@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
-import math
+import logging
 import re
+import time
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Sequence
 
+import numpy as np
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
@@ -17,9 +22,12 @@ from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import RunnableLambda, RunnablePassthrough
 
 from eval_agent.models.base import ModelAdapter
+from eval_agent.models.vector_index import IndexCache, IndexSettings, file_digest
 from eval_agent.registry import MODEL_REGISTRY
 from eval_agent.types import Example, ModelResponse
 
+logger = logging.getLogger(__name__)
+
 
 def _load_documents(path: Path) -> List[Document]:
     if not path.exists():
@@ -152,6 +160,9 @@ class LangChainRagModel(ModelAdapter):
         prompt_template: str | None = None,
         default_response: str = "I'm not sure.",
         batch_size: int | None = None,
+        index: Dict[str, Any] | None = None,
+        index_cache: bool = True,
+        index_cache_dir: str | Path | None = None,
         name: str | None = None,
     ) -> None:
         super().__init__(name=name)
@@ -164,16 +175,32 @@ class LangChainRagModel(ModelAdapter):
         )
         self.default_response = default_response
         self.batch_size = batch_size
+        self.index_settings = IndexSettings.from_config(index)
+        self.index_cache = index_cache
+        self.index_cache_dir = Path(index_cache_dir) if index_cache_dir else self.documents_path.parent / ".faiss_cache"
 
         self._vectorstore: FAISS | None = None
+        self._embeddings: BagOfWordsEmbeddings | None = None
+        self._index_statistics: Dict[str, Any] = {}
+        self._corpus_digest: str | None = None
         self._pipeline = None
         self._generator_chain = None
 
+    def cache_fingerprint(self) -> str:
+        if self._corpus_digest is None:
+            self._corpus_digest = file_digest(self.documents_path)
+        return self._corpus_digest
+
+    def cache_key_fields(self, example: Example) -> Any:
+        # ``context_recall`` and ``matched_context_ids`` are derived from the expected context ids.
+        context_ids = example.metadata.get("context_ids") if example.metadata else None
+        return {"inputs": example.inputs, "context_ids": context_ids}
+
     def warmup(self, examples: Iterable[Example] | None = None) -> None:
         _ = examples
-        documents = _load_documents(self.documents_path)
         embeddings = BagOfWordsEmbeddings(dimension=self.embedding_size)
-        self._vectorstore = FAISS.from_documents(documents, embeddings)
+        self._vectorstore = self._build_vectorstore(embeddings)
+        self._embeddings = embeddings
 
         prompt = PromptTemplate.from_template(self.prompt_template)
         llm = ContextualAnswerLLM(default_response=self.default_response)
@@ -183,38 +210,99 @@ class LangChainRagModel(ModelAdapter):
         retrieval_step = RunnableLambda(self._retrieve_documents)
         self._pipeline = retrieval_step | RunnablePassthrough.assign(answer=self._generator_chain)
 
+    def _build_vectorstore(self, embeddings: BagOfWordsEmbeddings) -> FAISS:
+        settings = self.index_settings
+        cache = None
+        if self.index_cache:
+            cache_settings = {
+                "embedding": type(embeddings).__name__,
+                "dimension": embeddings.dimension,
+                "index": settings.build_parameters(),
+            }
+            cache = IndexCache(
+                self.index_cache_dir,
+                corpus_path=self.documents_path,
+                settings=cache_settings,
+                corpus_digest=self.cache_fingerprint(),
+            )
+
+        cached = cache.load() if cache is not None else None
+        if cached is not None:
+            index, documents = cached
+            settings.configure(index)
+            build_seconds = None
+            logger.info("Loaded FAISS index for %s from %s", self.documents_path, cache.path)
+        else:
+            started = time.perf_counter()
+            documents = _load_documents(self.documents_path)
+            matrix = embeddings.embed_matrix([document.page_content for document in documents])
+            index = settings.build(matrix)
+            build_seconds = time.perf_counter() - started
+            if cache is not None:
+                cache.save(index, documents)
+
+        self._index_statistics = {
+            "type": settings.type,
+            "documents": int(index.ntotal),
+            "build_seconds": build_seconds,
+            "memory_bytes": settings.memory_bytes(index),
+            "from_cache": cached is not None,
+        }
+        logger.info(
+            "FAISS %s index over %d documents: %s, ~%.1f MiB",
+            settings.type,
+            index.ntotal,
+            "loaded from cache" if build_seconds is None else f"built in {build_seconds:.2f}s",
+            self._index_statistics["memory_bytes"] / (1024 * 1024),
+        )
+
+        ids = [str(position) for position in range(len(documents))]
+        return FAISS(
+            embeddings,
+            index,
+            InMemoryDocstore(dict(zip(ids, documents))),
+            dict(enumerate(ids)),
+        )
+
+    def statistics(self) -> Dict[str, Any]:
+        return {"index": dict(self._index_statistics)} if self._index_statistics else {}
+
     def _retrieve_documents(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        if self._vectorstore is None:
+        question = str(inputs.get("question") or inputs.get("text") or "").strip()
+        return self._retrieve_batch([question])[0]
+
+    def _retrieve_batch(self, questions: Sequence[str]) -> List[Dict[str, Any]]:
+        """Embed ``questions`` as one matrix and run a single k-NN search for all of them."""
+
+        if self._vectorstore is None or self._embeddings is None:
             raise RuntimeError("The LangChain RAG model must be warmed up before predicting")
 
-        question = str(inputs.get("question") or inputs.get("text") or "").strip()
-        documents: List[Document] = []
-        scores: List[float] = []
-        if hasattr(self._vectorstore, "similarity_search_with_score"):
-            docs_with_scores = self._vectorstore.similarity_search_with_score(
-                question,
-                k=self.retriever_top_k,
-            )
-            for doc, distance in docs_with_scores:
-                documents.append(doc)
-                distance_value = float(distance)
-                similarity = 1.0 / (1.0 + max(distance_value, 0.0))
-                scores.append(similarity)
-        else:
-            docs_with_scores = self._vectorstore.similarity_search_with_relevance_scores(
-                question,
-                k=self.retriever_top_k,
+        vectorstore = self._vectorstore
+        queries = self._embeddings.embed_matrix(questions)
+        distances, positions = vectorstore.index.search(queries, self.retriever_top_k)
+
+        retrieved: List[Dict[str, Any]] = []
+        for question, row_distances, row_positions in zip(questions, distances, positions):
+            documents: List[Document] = []
+            scores: List[float] = []
+            for distance, position in zip(row_distances.tolist(), row_positions.tolist()):
+                if position == -1:
+                    # FAISS pads with -1 when fewer than k neighbours exist.
+                    continue
+                document = vectorstore.docstore.search(vectorstore.index_to_docstore_id[position])
+                if not isinstance(document, Document):
+                    raise ValueError(f"Could not find document for index position {position}")
+                documents.append(document)
+                scores.append(1.0 / (1.0 + max(float(distance), 0.0)))
+            retrieved.append(
+                {
+                    "question": question,
+                    "documents": documents,
+                    "scores": scores,
+                    "context": self._combine_documents(documents),
+                }
             )
-            for doc, relevance in docs_with_scores:
-                documents.append(doc)
-                scores.append(float(relevance))
-        context = self._combine_documents(documents)
-        return {
-            "question": question,
-            "documents": documents,
-            "scores": scores,
-            "context": context,
-        }
+        return retrieved
 
     def _combine_documents(self, documents: Sequence[Document]) -> str:
         if not documents:
@@ -277,24 +365,70 @@ class LangChainRagModel(ModelAdapter):
 
         metadata = self._build_metadata(example, documents, scores)
         return ModelResponse(uid=example.uid, output=answer, metadata=metadata)
+
+    def predict_batch(self, examples: Sequence[Example]) -> List[ModelResponse]:
+        if not examples:
+            return []
+        if self._generator_chain is None:
+            raise RuntimeError("The LangChain RAG model must be warmed up before predicting")
+
+        questions = [self._extract_question(example).strip() for example in examples]
+        retrieved = self._retrieve_batch(questions)
+        answers = self._generator_chain.batch(
+            [{"question": item["question"], "context": item["context"]} for item in retrieved]
+        )
+
+        responses: List[ModelResponse] = []
+        for example, item, answer in zip(examples, retrieved, answers):
+            metadata = self._build_metadata(example, item["documents"], item["scores"])
+            responses.append(ModelResponse(uid=example.uid, output=answer, metadata=metadata))
+        return responses
+
+
 class BagOfWordsEmbeddings(Embeddings):
-    """Deterministic hashing-based embeddings for small synthetic corpora."""
+    """Deterministic hashing-based embeddings for small synthetic corpora.
+
+    Tokens are bucketed with a BLAKE2b digest rather than the builtin
+    ``hash()``, which is salted per process, so vectors (and the indexes built
+    from them) are identical across runs and worker processes.
+    """
+
+    _TOKEN_PATTERN = re.compile(r"\w+")
+    _BLOCK_SIZE = 4096
 
     def __init__(self, *, dimension: int = 256) -> None:
         self.dimension = max(32, dimension)
 
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
-        return [self._embed(text) for text in texts]
+        return self.embed_matrix(texts).tolist()
 
     def embed_query(self, text: str) -> List[float]:
-        return self._embed(text)
-
-    def _embed(self, text: str) -> List[float]:
-        tokens = re.findall(r"\w+", text.lower())
-        vector = [0.0] * self.dimension
-        for token in tokens:
-            index = hash(token) % self.dimension
-            vector[index] += 1.0
-        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
-        return [value / norm for value in vector]
-
+        return self.embed_matrix([text])[0].tolist()
+
+    def embed_matrix(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed ``texts`` into an L2-normalised ``float32`` matrix, one row per text."""
+
+        matrix = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for start in range(0, len(texts), self._BLOCK_SIZE):
+            block = texts[start : start + self._BLOCK_SIZE]
+            rows: List[int] = []
+            columns: List[int] = []
+            for row, text in enumerate(block):
+                buckets = [_token_bucket(token, self.dimension) for token in self._TOKEN_PATTERN.findall(text.lower())]
+                rows.extend([row] * len(buckets))
+                columns.extend(buckets)
+            flat = np.asarray(rows, dtype=np.int64) * self.dimension + np.asarray(columns, dtype=np.int64)
+            counts = np.bincount(flat, minlength=len(block) * self.dimension)
+            matrix[start : start + len(block)] = counts.reshape(len(block), self.dimension)
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        return matrix
+
+
+@functools.lru_cache(maxsize=65536)
+def _token_bucket(token: str, dimension: int) -> int:
+    # Bounded memo: large corpora have long-tailed vocabularies, most of which are seen once.
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") % dimension
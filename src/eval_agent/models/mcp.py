@@ -6,16 +6,19 @@ import asyncio
 import json
 import logging
 import os
+import threading
 from contextlib import asynccontextmanager
-from datetime import timedelta
-from typing import Any, AsyncContextManager, Callable, Iterable, Optional
+from typing import Any, AsyncContextManager, AsyncIterator, Awaitable, Callable, Iterable, List, Sequence
 
+import anyio
+import httpx
 from mcp import McpError
 import mcp.types as mcp_types
 from mcp.client.session import ClientSession
 from mcp.client.sse import sse_client
 
 from eval_agent.models.base import ModelAdapter
+from eval_agent.models.resilience import CircuitBreaker, RetryBudget, RetryPolicy
 from eval_agent.registry import MODEL_REGISTRY
 from eval_agent.types import Example, ModelResponse
 
@@ -23,6 +26,26 @@ logger = logging.getLogger(__name__)
 
 SessionFactory = Callable[[], AsyncContextManager[ClientSession]]
 
+# Errors that indicate the underlying connection is unusable, as opposed to an
+# error reported by the server over a healthy connection (``McpError``).
+_TRANSPORT_ERRORS: tuple[type[BaseException], ...] = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    httpx.TransportError,
+    ConnectionError,
+)
+
+# ``McpError`` codes meaning the request timed out rather than being rejected: the
+# Python SDK reports HTTP 408, the TypeScript SDK -32001.
+_TIMEOUT_CODES = frozenset({408, -32001})
+
+
+def _is_timeout(exc: BaseException) -> bool:
+    if isinstance(exc, McpError):
+        return exc.error.code in _TIMEOUT_CODES
+    return isinstance(exc, asyncio.TimeoutError)
+
 
 def _to_json_serialisable(value: Any) -> Any:
     """Ensure complex values are converted into JSON-friendly structures."""
@@ -36,6 +59,152 @@ def _to_json_serialisable(value: Any) -> Any:
     return json.loads(json.dumps(value, default=str))
 
 
+class MCPCallError(RuntimeError):
+    """Raised when an MCP tool call for an example fails for good."""
+
+    def __init__(self, message: str, *, attempts: int | None = None) -> None:
+        super().__init__(message)
+        self.attempts = attempts
+
+
+class _EventLoopThread:
+    """Long-lived event loop running on a daemon thread.
+
+    Coroutines are submitted from any thread and the caller blocks on the result,
+    so sessions opened on the loop survive between synchronous ``predict`` calls.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._serve, name="mcp-event-loop", daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coroutine: Awaitable[Any]) -> Any:
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class _TokenBucket:
+    """Token-bucket rate limiter: ``rate`` tokens per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
+class _PooledSession:
+    """An initialized ``ClientSession`` kept open by a dedicated holder task.
+
+    The transport context managers rely on cancel scopes that must be entered and
+    exited from the same task, so a holder task owns the session for its whole
+    lifetime while request coroutines borrow it.
+    """
+
+    def __init__(self, opener: Callable[[], AsyncContextManager[ClientSession]]) -> None:
+        self._opener = opener
+        self._closing = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.session: ClientSession | None = None
+        self.alive = False
+
+    async def open(self) -> None:
+        ready: asyncio.Future[ClientSession] = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._hold(ready))
+        self.session = await ready
+        self.alive = True
+
+    async def _hold(self, ready: asyncio.Future[ClientSession]) -> None:
+        try:
+            async with self._opener() as session:
+                ready.set_result(session)
+                await self._closing.wait()
+        except Exception as exc:
+            if not ready.done():
+                ready.set_exception(exc)
+            else:
+                logger.debug("MCP session closed with error: %s", exc)
+        finally:
+            self.alive = False
+
+    async def close(self) -> None:
+        self.alive = False
+        self._closing.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class _SessionPool:
+    """Bounded pool of initialized MCP sessions reused across requests."""
+
+    def __init__(self, opener: Callable[[], AsyncContextManager[ClientSession]], *, size: int) -> None:
+        self._opener = opener
+        self._idle: List[_PooledSession] = []
+        self._slots = asyncio.Semaphore(max(1, size))
+        self._closed = False
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[ClientSession]:
+        async with self._slots:
+            pooled = await self._checkout()
+            try:
+                yield pooled.session  # type: ignore[misc]
+            except _TRANSPORT_ERRORS:
+                await pooled.close()
+                raise
+            except BaseException:
+                self._checkin(pooled)
+                raise
+            else:
+                self._checkin(pooled)
+
+    async def _checkout(self) -> _PooledSession:
+        if self._closed:
+            raise RuntimeError("MCP session pool is closed")
+        while self._idle:
+            pooled = self._idle.pop()
+            if pooled.alive:
+                return pooled
+            await pooled.close()
+        pooled = _PooledSession(self._opener)
+        await pooled.open()
+        return pooled
+
+    def _checkin(self, pooled: _PooledSession) -> None:
+        if self._closed or not pooled.alive:
+            asyncio.get_running_loop().create_task(pooled.close())
+            return
+        self._idle.append(pooled)
+
+    async def close(self) -> None:
+        self._closed = True
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(pooled.close() for pooled in idle), return_exceptions=True)
+
+
 @MODEL_REGISTRY.register("mcp")
 class MCPModelAdapter(ModelAdapter):
     """Model adapter that connects to an MCP server via the SSE transport."""
@@ -52,6 +221,14 @@ class MCPModelAdapter(ModelAdapter):
         http_timeout: float = 10.0,
         sse_read_timeout: float = 300.0,
         request_timeout: float | None = None,
+        max_concurrency: int = 8,
+        max_sessions: int | None = None,
+        rate_limit: float | None = None,
+        rate_burst: int | None = None,
+        batch_size: int | None = None,
+        retry: dict[str, Any] | None = None,
+        circuit_breaker: dict[str, Any] | None = None,
+        on_error: str = "record",
         session_factory: SessionFactory | None = None,
         name: str | None = None,
     ) -> None:
@@ -62,6 +239,8 @@ class MCPModelAdapter(ModelAdapter):
             raise ValueError("'model_id' must be provided for the MCP adapter")
         if transport.lower() != "sse":
             raise ValueError("Only the 'sse' transport is currently supported")
+        if on_error not in {"raise", "record"}:
+            raise ValueError("'on_error' must be either 'raise' or 'record'")
 
         self.endpoint = endpoint
         self.model_id = model_id
@@ -69,9 +248,26 @@ class MCPModelAdapter(ModelAdapter):
         self.http_timeout = float(http_timeout)
         self.sse_read_timeout = float(sse_read_timeout)
         self.request_timeout = float(request_timeout) if request_timeout is not None else None
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_sessions = max(1, int(max_sessions)) if max_sessions is not None else self.max_concurrency
+        self.rate_limit = float(rate_limit) if rate_limit else None
+        self.rate_burst = int(rate_burst) if rate_burst else self.max_concurrency
+        self.batch_size = batch_size
+        self.retry_policy = RetryPolicy.from_config(retry)
+        self.on_error = on_error
+        self._retry_budget = RetryBudget(
+            ratio=self.retry_policy.budget_ratio,
+            minimum=self.retry_policy.min_budget,
+        )
+        self._circuit_breaker = CircuitBreaker.from_config(circuit_breaker)
         self._custom_session_factory = session_factory
         self._server_info: dict[str, Any] | None = None
         self._ready = False
+        self._loop_thread: _EventLoopThread | None = None
+        self._pool: _SessionPool | None = None
+        self._in_flight: asyncio.Semaphore | None = None
+        self._rate_limiter: _TokenBucket | None = None
+        self._lifecycle_lock = threading.Lock()
 
         self._headers = self._build_headers(auth, headers)
 
@@ -97,11 +293,65 @@ class MCPModelAdapter(ModelAdapter):
         except Exception as exc:  # pragma: no cover - defensive guardrail
             raise RuntimeError(f"Unexpected MCP failure for example {example.uid}") from exc
 
+    def predict_batch(self, examples: Sequence[Example]) -> List[ModelResponse]:
+        """Issue the tool calls for ``examples`` concurrently, returning responses in order.
+
+        Concurrency is bounded by ``max_concurrency`` and, when ``rate_limit`` is
+        set, requests are paced by a token bucket shared with ``predict``.
+        """
+
+        if not examples:
+            return []
+        if not self._ready:
+            self._ensure_ready()
+
+        try:
+            return self._run(self._predict_batch_async(examples))
+        except RuntimeError:
+            raise
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            raise RuntimeError("Unexpected MCP failure during batch prediction") from exc
+
+    def close(self) -> None:
+        """Close pooled sessions and stop the background event loop."""
+
+        with self._lifecycle_lock:
+            loop_thread, self._loop_thread = self._loop_thread, None
+            pool, self._pool = self._pool, None
+            self._in_flight = None
+            self._rate_limiter = None
+            self._ready = False
+        if loop_thread is None:
+            return
+        try:
+            if pool is not None:
+                loop_thread.run(pool.close())
+        finally:
+            loop_thread.stop()
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
     def _run(self, coroutine: Any) -> Any:
-        return asyncio.run(coroutine)
+        with self._lifecycle_lock:
+            if self._loop_thread is None:
+                self._loop_thread = _EventLoopThread()
+            loop_thread = self._loop_thread
+        return loop_thread.run(coroutine)
+
+    def _session_pool(self) -> _SessionPool:
+        # Only called from coroutines running on the background loop.
+        if self._pool is None:
+            self._pool = _SessionPool(self._session, size=self.max_sessions)
+        return self._pool
+
+    def _limits(self) -> tuple[asyncio.Semaphore, _TokenBucket | None]:
+        # Only called from coroutines running on the background loop.
+        if self._in_flight is None:
+            self._in_flight = asyncio.Semaphore(self.max_concurrency)
+            if self.rate_limit:
+                self._rate_limiter = _TokenBucket(self.rate_limit, self.rate_burst)
+        return self._in_flight, self._rate_limiter
 
     def _ensure_ready(self) -> None:
         try:
@@ -110,7 +360,7 @@ class MCPModelAdapter(ModelAdapter):
             raise
 
     async def _warmup_async(self) -> None:
-        async with self._session() as session:
+        async with self._session_pool().acquire() as session:
             try:
                 tools_result = await session.list_tools()
             except McpError as exc:  # pragma: no cover - network/transport errors
@@ -127,23 +377,103 @@ class MCPModelAdapter(ModelAdapter):
     async def _predict_async(self, example: Example) -> ModelResponse:
         arguments = self._format_arguments(example)
 
-        async with self._session() as session:
-            try:
-                result = await session.call_tool(self.model_id, arguments)
-            except McpError as exc:
-                message = f"MCP tool call failed for example {example.uid}: {exc}"
+        try:
+            result = await self._call_tool(example, arguments)
+            if result.isError:
+                message = self._format_error_message(result)
                 logger.error(message)
-                raise RuntimeError(message) from exc
-
-        if result.isError:
-            message = self._format_error_message(result)
-            logger.error(message)
-            raise RuntimeError(message)
+                raise MCPCallError(message)
+        except MCPCallError as exc:
+            if self.on_error == "raise":
+                raise
+            return self._failure_response(example, exc)
 
         output, metadata = self._parse_result(result)
         metadata.setdefault("example_uid", example.uid)
         return ModelResponse(uid=example.uid, output=output, metadata=metadata)
 
+    def _failure_response(self, example: Example, exc: MCPCallError) -> ModelResponse:
+        cause = exc.__cause__
+        error: dict[str, Any] = {
+            "type": type(cause).__name__ if cause is not None else "ToolError",
+            "message": str(exc),
+        }
+        if exc.attempts is not None:
+            error["attempts"] = exc.attempts
+        metadata = {"tool": self.model_id, "example_uid": example.uid, "error": error}
+        return ModelResponse(uid=example.uid, output=None, metadata=metadata)
+
+    async def _predict_batch_async(self, examples: Sequence[Example]) -> List[ModelResponse]:
+        tasks = [asyncio.create_task(self._predict_async(example)) for example in examples]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _call_tool(self, example: Example, arguments: dict[str, Any]) -> mcp_types.CallToolResult:
+        policy = self.retry_policy
+        breaker = self._circuit_breaker
+        self._retry_budget.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            await breaker.wait_until_ready()
+            try:
+                result = await self._call_tool_once(arguments)
+            except (*_TRANSPORT_ERRORS, asyncio.TimeoutError, McpError) as exc:
+                if isinstance(exc, McpError) and not _is_timeout(exc):
+                    # The server answered, so the endpoint itself is healthy.
+                    breaker.record_success()
+                    message = f"MCP tool call failed for example {example.uid}: {exc}"
+                    logger.error(message)
+                    raise MCPCallError(message, attempts=attempt) from exc
+                # Broken sessions have already been discarded by the pool, so a
+                # retry runs on a freshly initialized one.
+                breaker.record_failure()
+                if attempt >= policy.max_attempts or not self._retry_budget.try_spend():
+                    message = self._failure_message(example, exc)
+                    logger.error(message)
+                    raise MCPCallError(message, attempts=attempt) from exc
+                delay = policy.backoff(attempt)
+                logger.warning(
+                    "MCP call for example %s failed (%s); retrying in %.2fs (attempt %d/%d)",
+                    example.uid,
+                    exc,
+                    delay,
+                    attempt + 1,
+                    policy.max_attempts,
+                )
+                await asyncio.sleep(delay)
+            except BaseException:
+                breaker.release()
+                raise
+            else:
+                breaker.record_success()
+                return result
+
+    def _failure_message(self, example: Example, exc: BaseException) -> str:
+        if _is_timeout(exc):
+            return f"MCP tool call timed out after {self.request_timeout}s for example {example.uid}"
+        return f"MCP transport failed for example {example.uid}: {exc}"
+
+    async def _call_tool_once(self, arguments: dict[str, Any]) -> mcp_types.CallToolResult:
+        in_flight, rate_limiter = self._limits()
+        async with in_flight:
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            async with self._session_pool().acquire() as session:
+                call = session.call_tool(self.model_id, arguments)
+                if self.request_timeout:
+                    return await asyncio.wait_for(call, timeout=self.request_timeout)
+                return await call
+
+    def cache_key_fields(self, example: Example) -> Any:
+        # The tool receives the uid and example metadata, and responses echo the uid.
+        return {"uid": example.uid, "inputs": example.inputs, "metadata": example.metadata}
+
     def _format_arguments(self, example: Example) -> dict[str, Any]:
         input_text = self._render_example_text(example)
         message = mcp_types.SamplingMessage(
@@ -288,8 +618,6 @@ class MCPModelAdapter(ModelAdapter):
     @asynccontextmanager
     async def _sse_session(self) -> AsyncIterator[ClientSession]:
         headers = self._headers or None
-        timeout_delta: Optional[timedelta]
-        timeout_delta = timedelta(seconds=self.request_timeout) if self.request_timeout else None
 
         async with sse_client(
             self.endpoint,
@@ -297,5 +625,7 @@ class MCPModelAdapter(ModelAdapter):
             timeout=self.http_timeout,
             sse_read_timeout=self.sse_read_timeout,
         ) as (read_stream, write_stream):
-            async with ClientSession(read_stream, write_stream, read_timeout_seconds=timeout_delta) as session:
+            # ``request_timeout`` is enforced by ``_call_tool_once`` alone; a session read
+            # timeout would race it and surface as an ``McpError`` instead.
+            async with ClientSession(read_stream, write_stream) as session:
                 yield session
@@ -0,0 +1,134 @@
+"""Retry and circuit-breaking policies for adapters that call remote services."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter, bounded by a shared retry budget.
+
+    ``max_attempts`` counts the initial call. The budget allows roughly
+    ``budget_ratio`` retries per request and at most ``min_budget`` retries in a
+    burst, so a failing endpoint cannot multiply the load by ``max_attempts``.
+    """
+
+    max_attempts: int = 3
+    initial_delay: float = 0.2
+    max_delay: float = 10.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    budget_ratio: float = 0.2
+    min_budget: float = 10.0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any] | None) -> "RetryPolicy":
+        policy = cls(**(config or {}))
+        policy.max_attempts = max(1, int(policy.max_attempts))
+        return policy
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay before retry number ``attempt`` (1-based)."""
+
+        delay = min(self.max_delay, self.initial_delay * (self.multiplier ** (attempt - 1)))
+        return random.uniform(0.0, delay) if self.jitter else delay
+
+
+class RetryBudget:
+    """Token budget that caps retries as a fraction of overall requests.
+
+    Each request deposits ``ratio`` tokens and each retry spends one. The balance
+    starts full and never exceeds ``capacity``, so a long healthy stretch cannot
+    bank an unbounded burst of retries for the next outage.
+    """
+
+    def __init__(self, *, ratio: float, minimum: float) -> None:
+        self.ratio = max(0.0, ratio)
+        self.capacity = max(0.0, minimum)
+        self._balance = self.capacity
+
+    def record_request(self) -> None:
+        self._balance = min(self._balance + self.ratio, self.capacity)
+
+    def try_spend(self) -> bool:
+        if self._balance >= 1.0:
+            self._balance -= 1.0
+            return True
+        return False
+
+
+class CircuitBreaker:
+    """Pause dispatch after repeated failures until the endpoint recovers.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and callers
+    wait ``reset_timeout`` seconds. A single probe call is then let through
+    (half-open): success closes the circuit, failure re-opens it. The breaker is
+    meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = float(reset_timeout)
+        self._clock = clock
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._changed: asyncio.Event | None = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any] | None) -> "CircuitBreaker":
+        return cls(**(config or {}))
+
+    async def wait_until_ready(self) -> None:
+        """Block while the circuit is open or a half-open probe is in flight."""
+
+        while True:
+            if self.state == "closed":
+                return
+            if self.state == "open":
+                remaining = self._opened_at + self.reset_timeout - self._clock()
+                if remaining <= 0:
+                    self._transition("half-open")
+                    return
+                await asyncio.sleep(remaining)
+                continue
+            await self._event().wait()
+
+    def record_success(self) -> None:
+        self._failures = 0
+        if self.state != "closed":
+            self._transition("closed")
+
+    def release(self) -> None:
+        """Abandon a half-open probe without a verdict so another caller can probe."""
+
+        if self.state == "half-open":
+            self._transition("open")
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == "half-open" or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+            self._transition("open")
+
+    def _event(self) -> asyncio.Event:
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        return self._changed
+
+    def _transition(self, state: str) -> None:
+        self.state = state
+        if self._changed is not None:
+            self._changed.set()
+        self._changed = None
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
+from itertools import islice
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, List, Sequence
 
 import joblib
 
@@ -24,6 +26,7 @@ class SklearnPipelineModel(ModelAdapter):
         probability_field: str = "probabilities",
         name: str | None = None,
         warmup_examples: int = 0,
+        batch_size: int | None = None,
     ) -> None:
         super().__init__(name=name)
         self.artifact_path = Path(artifact_path)
@@ -33,18 +36,29 @@ class SklearnPipelineModel(ModelAdapter):
         self.label_mapping = {str(key): value for key, value in (label_mapping or {}).items()}
         self.probability_field = probability_field
         self.warmup_examples = warmup_examples
+        self.batch_size = batch_size
         self._classes: list[str] | None = None
+        self._artifact_digest: str | None = None
         classes = getattr(self.pipeline, "classes_", None)
         if classes is not None:
             self._classes = [self._map_label(label) for label in classes]
 
+    def cache_fingerprint(self) -> str:
+        if self._artifact_digest is None:
+            digest = hashlib.sha256()
+            with self.artifact_path.open("rb") as handle:
+                for block in iter(lambda: handle.read(1 << 20), b""):
+                    digest.update(block)
+            self._artifact_digest = digest.hexdigest()
+        return self._artifact_digest
+
     def _map_label(self, label: Any) -> Any:
         return self.label_mapping.get(str(label), label)
 
     def warmup(self, examples: Iterable[Example] | None = None) -> None:
         if not self.warmup_examples:
             return
-        iterable = list(examples or [])[: self.warmup_examples]
+        iterable = list(islice(examples or [], self.warmup_examples))
         if not iterable:
             return
         texts = [example.text() for example in iterable]
@@ -58,22 +72,43 @@ class SklearnPipelineModel(ModelAdapter):
                 pass
 
     def predict(self, example: Example) -> ModelResponse:
-        text = example.text()
-        raw_output = self.pipeline.predict([text])[0]
-        mapped_output = self._map_label(raw_output)
+        return self.predict_batch([example])[0]
 
-        metadata: dict[str, Any] = {"model_name": self.name, "artifact_path": str(self.artifact_path)}
-        if hasattr(self.pipeline, "predict_proba"):
-            try:
-                probabilities = self.pipeline.predict_proba([text])[0]
-                classes = self._classes or getattr(self.pipeline, "classes_", None)
-                if classes is not None:
-                    metadata[self.probability_field] = {
-                        str(self._map_label(label)): float(prob)
-                        for label, prob in zip(classes, probabilities)
-                    }
-            except Exception:
-                # Ignore probability errors for estimators that do not implement it.
-                pass
+    def predict_batch(self, examples: Sequence[Example]) -> List[ModelResponse]:
+        if not examples:
+            return []
+        texts = [example.text() for example in examples]
+
+        # A single predict_proba call runs the feature transform once for the whole
+        # chunk; predicted labels are the argmax over the same probabilities.
+        probabilities = self._predict_proba(texts)
+        raw_classes = getattr(self.pipeline, "classes_", None)
+        if probabilities is not None and raw_classes is not None:
+            raw_outputs = [raw_classes[index] for index in probabilities.argmax(axis=1)]
+        else:
+            raw_outputs = list(self.pipeline.predict(texts))
+
+        classes = self._classes or raw_classes
+        probability_labels = (
+            [str(self._map_label(label)) for label in classes] if classes is not None else None
+        )
+        probability_rows = probabilities.tolist() if probabilities is not None else None
+
+        responses: List[ModelResponse] = []
+        for index, (example, raw_output) in enumerate(zip(examples, raw_outputs)):
+            metadata: dict[str, Any] = {"model_name": self.name, "artifact_path": str(self.artifact_path)}
+            if probability_rows is not None and probability_labels is not None:
+                metadata[self.probability_field] = dict(zip(probability_labels, probability_rows[index]))
+            responses.append(
+                ModelResponse(uid=example.uid, output=self._map_label(raw_output), metadata=metadata)
+            )
+        return responses
 
-        return ModelResponse(uid=example.uid, output=mapped_output, metadata=metadata)
+    def _predict_proba(self, texts: List[str]) -> Any:
+        if not hasattr(self.pipeline, "predict_proba"):
+            return None
+        try:
+            return self.pipeline.predict_proba(texts)
+        except Exception:
+            # Ignore probability errors for estimators that do not implement it.
+            return None
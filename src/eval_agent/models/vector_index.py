@@ -0,0 +1,200 @@
+"""On-disk cache of FAISS indexes built for retrieval adapters."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import faiss
+import numpy as np
+from langchain_core.documents import Document
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes so stale entries are ignored.
+_FORMAT_VERSION = 1
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 of a file's contents, read in blocks."""
+
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+_INDEX_TYPES = ("flat", "ivf-flat", "ivf-pq", "hnsw")
+
+
+@dataclass
+class IndexSettings:
+    """FAISS index configuration for retrieval adapters.
+
+    ``flat`` is exact search. ``ivf-flat`` and ``ivf-pq`` partition the vectors
+    into ``nlist`` k-means cells trained on up to ``training_sample_size``
+    vectors and scan ``nprobe`` cells per query; ``ivf-pq`` additionally
+    compresses vectors into ``pq_m`` sub-quantizer codes of ``pq_nbits`` bits.
+    ``hnsw`` builds a graph with ``hnsw_m`` links per node and explores
+    ``ef_search`` candidates per query. ``nlist`` defaults to ``4 * sqrt(n)``.
+    """
+
+    type: str = "flat"
+    nlist: int | None = None
+    nprobe: int = 8
+    pq_m: int = 16
+    pq_nbits: int = 8
+    hnsw_m: int = 32
+    ef_construction: int = 40
+    ef_search: int = 64
+    training_sample_size: int = 100_000
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any] | None) -> "IndexSettings":
+        settings = cls(**(config or {}))
+        settings.type = settings.type.lower()
+        if settings.type not in _INDEX_TYPES:
+            raise ValueError(f"Unsupported index type '{settings.type}'. Use one of: {', '.join(_INDEX_TYPES)}")
+        return settings
+
+    def build_parameters(self) -> Dict[str, Any]:
+        """Parameters that determine the stored index (query-time knobs excluded)."""
+
+        if self.type == "flat":
+            return {"type": self.type}
+        if self.type == "hnsw":
+            return {"type": self.type, "hnsw_m": self.hnsw_m, "ef_construction": self.ef_construction}
+        parameters: Dict[str, Any] = {
+            "type": self.type,
+            "nlist": self.nlist,
+            "training_sample_size": self.training_sample_size,
+        }
+        if self.type == "ivf-pq":
+            parameters.update(pq_m=self.pq_m, pq_nbits=self.pq_nbits)
+        return parameters
+
+    def build(self, vectors: np.ndarray) -> Any:
+        """Create, train and fill an index with ``vectors``."""
+
+        count, dimension = vectors.shape
+        if self.type == "flat":
+            index = faiss.IndexFlatL2(dimension)
+        elif self.type == "hnsw":
+            index = faiss.IndexHNSWFlat(dimension, self.hnsw_m)
+            index.hnsw.efConstruction = self.ef_construction
+        else:
+            sample = vectors
+            if count > self.training_sample_size:
+                rows = np.random.default_rng(0).choice(count, size=self.training_sample_size, replace=False)
+                sample = vectors[np.sort(rows)]
+            # k-means needs at least as many training points as centroids.
+            trainable = max(len(sample), 1)
+            nlist = max(1, min(self.nlist or int(4 * math.sqrt(count)), trainable))
+            quantizer = faiss.IndexFlatL2(dimension)
+            if self.type == "ivf-flat":
+                index = faiss.IndexIVFFlat(quantizer, dimension, nlist)
+            else:
+                if dimension % self.pq_m:
+                    raise ValueError(f"pq_m ({self.pq_m}) must divide the embedding dimension ({dimension})")
+                nbits = max(1, min(self.pq_nbits, int(math.log2(max(trainable, 2)))))
+                index = faiss.IndexIVFPQ(quantizer, dimension, nlist, self.pq_m, nbits)
+            index.train(sample)
+        if count:
+            index.add(vectors)
+        self.configure(index)
+        return index
+
+    def configure(self, index: Any) -> None:
+        """Apply query-time parameters to a built or loaded index."""
+
+        if self.type in {"ivf-flat", "ivf-pq"}:
+            faiss.extract_index_ivf(index).nprobe = self.nprobe
+        elif self.type == "hnsw":
+            index.hnsw.efSearch = self.ef_search
+
+    def memory_bytes(self, index: Any) -> int:
+        """Approximate resident size of ``index``'s vectors, codes and structures."""
+
+        count, dimension = index.ntotal, index.d
+        if self.type == "flat":
+            return count * dimension * 4
+        if self.type == "hnsw":
+            # Level 0 holds 2*M neighbours per node; upper levels add about one more
+            # on average, plus the per-node level and offset bookkeeping.
+            links = 2 * self.hnsw_m + 1
+            return count * (dimension * 4 + links * 4 + 12)
+        ivf = faiss.extract_index_ivf(index)
+        centroids = ivf.nlist * dimension * 4
+        if self.type == "ivf-flat":
+            return centroids + count * (dimension * 4 + 8)
+        pq = faiss.downcast_index(index).pq
+        codebooks = pq.M * (1 << pq.nbits) * pq.dsub * 4
+        return centroids + codebooks + count * (pq.code_size + 8)
+
+
+class IndexCache:
+    """Persist a FAISS index together with the documents it was built from.
+
+    Each entry lives in its own directory named after a digest of the corpus
+    contents and the ``settings`` that shaped the vectors (embedding type,
+    dimension, index parameters), so editing the corpus or the configuration
+    misses the cache instead of serving a stale index. Index files are memory
+    mapped on load where FAISS supports it. Pass ``corpus_digest`` when the
+    corpus was already hashed to avoid reading it again.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        corpus_path: Path,
+        settings: Dict[str, Any],
+        corpus_digest: str | None = None,
+    ) -> None:
+        corpus = corpus_digest if corpus_digest is not None else file_digest(corpus_path)
+        key = hashlib.sha256(
+            json.dumps(
+                {"version": _FORMAT_VERSION, "corpus": corpus, "settings": settings},
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+        self.path = directory / f"{corpus_path.stem}-{key[:24]}"
+        self._index_path = self.path / "index.faiss"
+        self._documents_path = self.path / "documents.json"
+
+    def load(self) -> Tuple[Any, List[Document]] | None:
+        if not (self._index_path.exists() and self._documents_path.exists()):
+            return None
+        try:
+            index = faiss.read_index(str(self._index_path), faiss.IO_FLAG_MMAP)
+        except RuntimeError:
+            # Not every index type can be memory mapped.
+            index = faiss.read_index(str(self._index_path))
+        with self._documents_path.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        documents = [Document(page_content=text, metadata=metadata) for text, metadata in payload]
+        if len(documents) != index.ntotal:
+            logger.warning("Ignoring inconsistent FAISS index cache at %s", self.path)
+            return None
+        return index, documents
+
+    def save(self, index: Any, documents: List[Document]) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        # Write under temporary names and rename, so concurrent readers never see
+        # a partially written entry. The index goes last as it marks completion.
+        documents_tmp = self._documents_path.with_suffix(f".json.{os.getpid()}.tmp")
+        with documents_tmp.open("w", encoding="utf-8") as handle:
+            json.dump([[document.page_content, document.metadata] for document in documents], handle)
+        documents_tmp.replace(self._documents_path)
+
+        index_tmp = self._index_path.with_suffix(f".faiss.{os.getpid()}.tmp")
+        faiss.write_index(index, str(index_tmp))
+        index_tmp.replace(self._index_path)
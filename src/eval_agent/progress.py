@@ -0,0 +1,108 @@
+"""Rate-limited progress reporting for evaluation runs."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Sequence
+
+from eval_agent.metrics.base import MetricSuite
+from eval_agent.types import MetricResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ProgressEvent:
+    """Snapshot of a run in flight.
+
+    ``total`` and ``eta`` are ``None`` when the dataset size is unknown (streaming).
+    ``metrics`` maps metric names to their values over the examples seen so far.
+    """
+
+    name: str
+    processed: int
+    failed: int
+    total: int | None
+    elapsed: float
+    throughput: float
+    eta: float | None
+    metrics: Dict[str, float] = field(default_factory=dict)
+    done: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+class ProgressReporter:
+    """Count processed examples and emit a :class:`ProgressEvent` at most every ``interval`` seconds.
+
+    ``advance`` is called once per example from the evaluation loop and only
+    compares the clock against the next deadline; partial metric values are read
+    from the metrics' running aggregates (no per-example details are built) and
+    only when an event is actually emitted. Errors raised by the callback are
+    logged and never interrupt the run.
+    """
+
+    def __init__(
+        self,
+        callback: ProgressCallback,
+        *,
+        name: str,
+        metrics: MetricSuite,
+        total: int | None = None,
+        interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.callback = callback
+        self.name = name
+        self.metrics = metrics
+        self.total = total
+        self.interval = max(0.0, interval)
+        self.processed = 0
+        self.failed = 0
+        self._clock = clock
+        self._started = clock()
+        self._deadline = self._started + self.interval
+
+    def advance(self, *, failed: bool = False) -> None:
+        self.processed += 1
+        if failed:
+            self.failed += 1
+        if self._clock() >= self._deadline:
+            self.emit()
+
+    def emit(self, *, done: bool = False, results: Sequence[MetricResult] | None = None) -> None:
+        """Send an event now; ``results`` reuses already finalized metrics."""
+
+        now = self._clock()
+        self._deadline = now + self.interval
+        elapsed = now - self._started
+        throughput = self.processed / elapsed if elapsed > 0 else 0.0
+        eta: float | None = None
+        if self.total is not None:
+            remaining = max(0, self.total - self.processed)
+            eta = remaining / throughput if throughput > 0 else (0.0 if not remaining else None)
+        if results is not None:
+            metrics = {result.name: result.value for result in results}
+        else:
+            metrics = self.metrics.current_values() if self.processed else {}
+        event = ProgressEvent(
+            name=self.name,
+            processed=self.processed,
+            failed=self.failed,
+            total=self.total,
+            elapsed=elapsed,
+            throughput=throughput,
+            eta=eta,
+            metrics=metrics,
+            done=done,
+        )
+        try:
+            self.callback(event)
+        except Exception:  # noqa: BLE001 - progress must never fail the run
+            logger.exception("Progress callback for '%s' failed", self.name)
@@ -50,3 +50,5 @@ MODEL_REGISTRY = Registry(name="model")
 DATASET_REGISTRY = Registry(name="dataset")
 METRIC_REGISTRY = Registry(name="metric")
 TASK_REGISTRY = Registry(name="task")
+EXECUTOR_REGISTRY = Registry(name="executor")
+TOKENIZER_REGISTRY = Registry(name="tokenizer")
@@ -2,20 +2,39 @@
 
 from __future__ import annotations
 
-import json
+import glob
 import logging
-from dataclasses import dataclass
+import threading
+import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Sequence
+from typing import Any, Dict, List, Sequence
 
-from eval_agent.config import EvaluationConfig, MetricConfig
-from eval_agent.registry import DATASET_REGISTRY, METRIC_REGISTRY, MODEL_REGISTRY, TASK_REGISTRY
+from eval_agent.cache import PredictionCache, content_digest, model_namespace
+from eval_agent.config import ConcurrencyConfig, EvaluationConfig, MetricConfig
+from eval_agent.datasets.base import Dataset
+from eval_agent.execution import Executor
+from eval_agent.metrics.base import Metric, MetricSuite
+from eval_agent.models.base import ModelAdapter
+from eval_agent.progress import ProgressCallback, ProgressReporter
+from eval_agent.registry import (
+    DATASET_REGISTRY,
+    EXECUTOR_REGISTRY,
+    METRIC_REGISTRY,
+    MODEL_REGISTRY,
+    TASK_REGISTRY,
+)
 from eval_agent.types import MetricResult, PredictionRecord
+from eval_agent.writers import ResponseCheckpoint, ResultWriter, open_result_writer
 
 logger = logging.getLogger(__name__)
 
 
+class RunCancelled(Exception):
+    """Raised when an evaluation stops because its cancellation event was set."""
+
+
 @dataclass
 class EvaluationResult:
     name: str
@@ -25,6 +44,7 @@ class EvaluationResult:
     started_at: datetime
     completed_at: datetime
     output_path: Path | None = None
+    statistics: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self, *, include_predictions: bool = True) -> dict:
         payload = {
@@ -34,6 +54,7 @@ class EvaluationResult:
             "completed_at": self.completed_at.isoformat(),
             "metrics": [metric.to_dict() for metric in self.metrics],
             "output_path": str(self.output_path) if self.output_path else None,
+            "statistics": self.statistics,
         }
         if include_predictions:
             payload["predictions"] = [prediction.to_dict() for prediction in self.predictions]
@@ -43,8 +64,20 @@ class EvaluationResult:
 class EvaluationAgent:
     """Orchestrates dataset loading, model execution, and metric computation."""
 
-    def __init__(self, config: EvaluationConfig) -> None:
+    def __init__(
+        self,
+        config: EvaluationConfig,
+        *,
+        resume: bool = False,
+        cancel_event: threading.Event | None = None,
+        progress: ProgressCallback | None = None,
+        progress_interval: float = 1.0,
+    ) -> None:
         self.config = config
+        self.resume = resume
+        self.cancel_event = cancel_event
+        self.progress = progress
+        self.progress_interval = progress_interval
 
     def run(self) -> EvaluationResult:
         logger.info("Starting evaluation for config '%s'", self.config.name)
@@ -53,29 +86,95 @@ class EvaluationAgent:
             **self.config.dataset.parameters,
         )
         model = MODEL_REGISTRY.create(self.config.model.type, **self.config.model.parameters)
-        task = TASK_REGISTRY.create(self.config.task, dataset, model)
-        task.warmup(dataset.examples())
+        cache: PredictionCache | None = None
+        try:
+            cache = self._open_cache(model)
+            result = self._evaluate(dataset, model, cache)
+        finally:
+            if cache is not None:
+                cache.close()
+            model.close()
 
-        metric_instances = self._build_metrics(self.config.metrics)
+        logger.info("Completed evaluation for config '%s'", self.config.name)
+        return result
+
+    def _evaluate(
+        self,
+        dataset: Dataset,
+        model: ModelAdapter,
+        cache: PredictionCache | None,
+    ) -> EvaluationResult:
+        executor = self._build_executor(self.config.concurrency)
+        checkpoint = self._build_checkpoint(model)
+        completed = checkpoint.load() if checkpoint is not None and self.resume else {}
+        if completed:
+            logger.info("Resuming '%s' with %d completed example(s)", self.config.name, len(completed))
+        task = TASK_REGISTRY.create(
+            self.config.task,
+            dataset,
+            model,
+            executor=executor,
+            cache=cache,
+            completed=completed,
+        )
+        streaming = self.config.streaming
+        task.warmup(dataset.iter_examples() if streaming else dataset.examples())
+
+        metric_suite = MetricSuite(self._build_metrics(self.config.metrics), streaming=streaming)
 
         start_time = datetime.now(timezone.utc)
-        responses = task.run()
+        writer = self._open_writer(start_time)
+        predictions: List[PredictionRecord] = []
+        failed_examples = 0
+        examples = dataset.iter_examples() if streaming else dataset.examples()
+        reporter = self._build_reporter(metric_suite, total=None if streaming else len(examples))
+        if checkpoint is not None:
+            checkpoint.open(resume=bool(completed))
+        cancel_event = self.cancel_event
+        try:
+            for example, response in task.iter_predictions(examples):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise RunCancelled(f"Evaluation '{self.config.name}' was cancelled")
+                failed = "error" in response.metadata
+                if failed:
+                    # Recorded failures have no real output; they only count towards ``failed_examples``.
+                    failed_examples += 1
+                else:
+                    metric_suite.update(example, response)
+                    if checkpoint is not None and example.uid not in completed:
+                        checkpoint.write(response)
+                record = PredictionRecord(
+                    uid=example.uid,
+                    inputs=example.inputs,
+                    expected_output=example.expected_output,
+                    predicted_output=response.output,
+                    metadata=response.metadata,
+                )
+                if writer is not None:
+                    writer.write(record)
+                if not streaming:
+                    predictions.append(record)
+                if reporter is not None:
+                    reporter.advance(failed=failed)
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            if checkpoint is not None:
+                checkpoint.close()
+            raise
         completed_time = datetime.now(timezone.utc)
 
-        metrics: List[MetricResult] = []
-        for metric in metric_instances:
-            metrics.append(metric.compute(examples=dataset.examples(), responses=responses))
-
-        predictions = [
-            PredictionRecord(
-                uid=example.uid,
-                inputs=example.inputs,
-                expected_output=example.expected_output,
-                predicted_output=response.output,
-                metadata=response.metadata,
-            )
-            for example, response in zip(dataset.examples(), responses)
-        ]
+        statistics: Dict[str, Any] = {"failed_examples": failed_examples}
+        if cache is not None:
+            statistics["cache"] = cache.statistics()
+        if completed:
+            statistics["resumed_examples"] = len(completed)
+        model_statistics = model.statistics()
+        if model_statistics:
+            statistics["model"] = model_statistics
+        metrics: List[MetricResult] = metric_suite.finalize()
+        if reporter is not None:
+            reporter.emit(done=True, results=metrics)
 
         result = EvaluationResult(
             name=self.config.name,
@@ -84,15 +183,97 @@ class EvaluationAgent:
             predictions=predictions,
             started_at=start_time,
             completed_at=completed_time,
+            statistics=statistics,
         )
+        if failed_examples:
+            logger.warning(
+                "%d example(s) failed during evaluation for config '%s'; see prediction metadata for details",
+                failed_examples,
+                self.config.name,
+            )
 
-        output_path = self._persist_results(result)
-        result.output_path = output_path
-
-        logger.info("Completed evaluation for config '%s'", self.config.name)
+        if writer is not None:
+            summary = result.to_dict(include_predictions=False)
+            result.output_path = writer.close(summary, completed_at=completed_time)
+        if checkpoint is not None:
+            checkpoint.discard()
         return result
 
-    def _build_metrics(self, configs: Sequence[MetricConfig]):
+    def _build_executor(self, config: ConcurrencyConfig) -> Executor:
+        return EXECUTOR_REGISTRY.create(
+            config.mode,
+            workers=config.workers,
+            chunk_size=config.chunk_size,
+        )
+
+    def _build_reporter(self, metric_suite: MetricSuite, *, total: int | None) -> ProgressReporter | None:
+        if self.progress is None:
+            return None
+        return ProgressReporter(
+            self.progress,
+            name=self.config.name,
+            metrics=metric_suite,
+            total=total,
+            interval=self.progress_interval,
+        )
+
+    def _build_checkpoint(self, model: ModelAdapter) -> ResponseCheckpoint | None:
+        output = self.config.output
+        if not output.directory or output.checkpoint_every <= 0:
+            return None
+        fingerprint = content_digest(
+            {
+                "model": model_namespace(
+                    self.config.model.type,
+                    self.config.model.parameters,
+                    model.cache_fingerprint(),
+                ),
+                "dataset": {"type": self.config.dataset.type, "parameters": self.config.dataset.parameters},
+            }
+        )
+        return ResponseCheckpoint(
+            self._checkpoint_path(output.directory),
+            fingerprint=fingerprint,
+            flush_every=output.checkpoint_every,
+        )
+
+    def _checkpoint_path(self, directory: Path) -> Path:
+        """Return the log to resume from, or a fresh one unique to this run.
+
+        Each run writes its own ``.<name>.<timestamp>-<id>.checkpoint.jsonl`` so
+        concurrent runs of one configuration never share a log; ``--resume``
+        continues the most recently written one.
+        """
+
+        name = self.config.name
+        if self.resume and directory.exists():
+            existing = sorted(
+                directory.glob(f".{glob.escape(name)}.*.checkpoint.jsonl"),
+                key=lambda path: path.stat().st_mtime,
+            )
+            if existing:
+                return existing[-1]
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        return directory / f".{name}.{timestamp}-{uuid.uuid4().hex[:8]}.checkpoint.jsonl"
+
+    def _open_cache(self, model: ModelAdapter) -> PredictionCache | None:
+        config = self.config.cache
+        if not config.enabled:
+            return None
+        path = config.path or self.config.output.directory / "prediction_cache.sqlite"
+        namespace = model_namespace(
+            self.config.model.type,
+            self.config.model.parameters,
+            model.cache_fingerprint(),
+        )
+        return PredictionCache(
+            path,
+            namespace=namespace,
+            max_bytes=int(config.max_size_mb * 1024 * 1024),
+            key_fields=model.cache_key_fields,
+        )
+
+    def _build_metrics(self, configs: Sequence[MetricConfig]) -> List[Metric]:
         return [
             METRIC_REGISTRY.create(
                 config.type,
@@ -102,14 +283,15 @@ class EvaluationAgent:
             for config in configs
         ]
 
-    def _persist_results(self, result: EvaluationResult) -> Path | None:
-        output_dir = self.config.output.directory
-        if not output_dir:
+    def _open_writer(self, started_at: datetime) -> ResultWriter | None:
+        output = self.config.output
+        if not output.directory:
             return None
-        output_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = result.completed_at.strftime("%Y%m%dT%H%M%S")
-        file_path = output_dir / f"{self.config.name}_{timestamp}.json"
-        payload = result.to_dict(include_predictions=self.config.output.save_predictions)
-        with file_path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
-        return file_path
+        return open_result_writer(
+            output.format,
+            output.directory,
+            name=self.config.name,
+            task=self.config.task,
+            started_at=started_at,
+            save_predictions=output.save_predictions,
+        )
@@ -3,19 +3,55 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable, Sequence
+from collections import deque
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Mapping, Sequence, Tuple
 
+from eval_agent.cache import PredictionCache
 from eval_agent.datasets.base import Dataset
+from eval_agent.execution import Executor, SerialExecutor
 from eval_agent.models.base import ModelAdapter
 from eval_agent.types import Example, ModelResponse
 
 
+def _chunked(examples: Iterable[Example], size: int) -> Iterator[List[Example]]:
+    iterator = iter(examples)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class _BatchPredictor:
+    """Picklable callable that skips the model for chunks fully served from the cache."""
+
+    def __init__(self, model: ModelAdapter) -> None:
+        self.model = model
+
+    def __call__(self, examples: List[Example]) -> List[ModelResponse]:
+        if not examples:
+            return []
+        return self.model.predict_batch(examples)
+
+
 class Task(ABC):
     """Base class for evaluation tasks."""
 
-    def __init__(self, dataset: Dataset, model: ModelAdapter) -> None:
+    def __init__(
+        self,
+        dataset: Dataset,
+        model: ModelAdapter,
+        *,
+        executor: Executor | None = None,
+        cache: PredictionCache | None = None,
+        completed: Mapping[str, ModelResponse] | None = None,
+    ) -> None:
         self.dataset = dataset
         self.model = model
+        self.executor = executor or SerialExecutor()
+        self.cache = cache
+        self.completed = completed or {}
 
     @abstractmethod
     def run(self) -> Sequence[ModelResponse]:
@@ -23,3 +59,48 @@ class Task(ABC):
 
     def warmup(self, examples: Iterable[Example] | None = None) -> None:
         self.model.warmup(examples)
+
+    def iter_predictions(self, examples: Iterable[Example]) -> Iterator[Tuple[Example, ModelResponse]]:
+        """Lazily dispatch ``examples`` through the executor and yield them with their responses.
+
+        Pairs are yielded in input order. Only the chunks currently in flight are
+        held in memory, so arbitrarily large datasets can be streamed. Responses
+        already ``completed`` by an interrupted attempt are reused by uid, the rest
+        are looked up in the prediction cache when one is configured, and only the
+        remaining misses reach the model; fresh responses are written back.
+        """
+
+        cache = self.cache
+        in_flight: Deque[Tuple[List[Example], List[ModelResponse | None]]] = deque()
+
+        def _track(chunks: Iterable[List[Example]]) -> Iterator[List[Example]]:
+            for chunk in chunks:
+                cached = self._lookup(chunk)
+                in_flight.append((chunk, cached))
+                yield [example for example, response in zip(chunk, cached) if response is None]
+
+        chunks = _track(_chunked(examples, self._chunk_size()))
+        for computed in self.executor.map(_BatchPredictor(self.model), chunks):
+            chunk, cached = in_flight.popleft()
+            if cache is not None and computed:
+                misses = [example for example, response in zip(chunk, cached) if response is None]
+                cache.put_many(misses, computed)
+            fresh = iter(computed)
+            for example, response in zip(chunk, cached):
+                yield example, response if response is not None else next(fresh)
+
+    def _lookup(self, chunk: List[Example]) -> List[ModelResponse | None]:
+        found: List[ModelResponse | None] = [self.completed.get(example.uid) for example in chunk]
+        if self.cache is None:
+            return found
+        missing = [index for index, response in enumerate(found) if response is None]
+        if missing:
+            for index, response in zip(missing, self.cache.get_many([chunk[index] for index in missing])):
+                found[index] = response
+        return found
+
+    def _chunk_size(self) -> int:
+        batch_size = getattr(self.model, "batch_size", None)
+        if isinstance(batch_size, int) and batch_size > 1:
+            return batch_size
+        return self.executor.chunk_size
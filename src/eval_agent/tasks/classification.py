@@ -14,7 +14,4 @@ class TextClassificationTask(Task):
     """Run text classification evaluations using the provided dataset and model."""
 
     def run(self) -> List[ModelResponse]:
-        responses: List[ModelResponse] = []
-        for example in self.dataset:
-            responses.append(self.model.predict(example))
-        return responses
+        return [response for _example, response in self.iter_predictions(self.dataset)]
@@ -6,7 +6,7 @@ from typing import List
 
 from eval_agent.registry import TASK_REGISTRY
 from eval_agent.tasks.base import Task
-from eval_agent.types import Example, ModelResponse
+from eval_agent.types import ModelResponse
 
 
 @TASK_REGISTRY.register("retrieval-qa")
@@ -14,19 +14,4 @@ class RetrievalQuestionAnsweringTask(Task):
     """Execute retrieval + generation models over question answering datasets."""
 
     def run(self) -> List[ModelResponse]:
-        batch_size = getattr(self.model, "batch_size", None)
-        if not isinstance(batch_size, int) or batch_size <= 1:
-            return [self.model.predict(example) for example in self.dataset]
-
-        responses: List[ModelResponse] = []
-        batch: list[Example] = []
-        for example in self.dataset:
-            batch.append(example)
-            if len(batch) >= batch_size:
-                responses.extend(self.model.predict_batch(batch))
-                batch = []
-
-        if batch:
-            responses.extend(self.model.predict_batch(batch))
-
-        return responses
+        return [response for _example, response in self.iter_predictions(self.dataset)]
@@ -0,0 +1,417 @@
+"""Incremental writers for evaluation results."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, Mapping, TextIO, Union
+
+from eval_agent.types import ModelResponse, PredictionRecord
+
+
+class StreamingJsonWriter:
+    """Write a run payload incrementally so predictions never accumulate in memory.
+
+    The header fields are written when the writer is opened, each prediction is
+    appended as soon as it is produced, and the remaining summary fields (metrics,
+    timestamps) are written on ``close``. The file is written under a temporary
+    name and renamed into place once complete, so readers never observe a
+    truncated payload.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        name: str,
+        task: str,
+        started_at: datetime,
+        save_predictions: bool = True,
+    ) -> None:
+        self.directory = directory
+        self.name = name
+        self.save_predictions = save_predictions
+        self._count = 0
+
+        directory.mkdir(parents=True, exist_ok=True)
+        timestamp = started_at.strftime("%Y%m%dT%H%M%S")
+        self._partial_path = directory / f".{name}_{timestamp}.json.partial"
+        self._handle: TextIO | None = self._partial_path.open("w", encoding="utf-8")
+        header = {"name": name, "task": task, "started_at": started_at.isoformat()}
+        self._handle.write(json.dumps(header)[:-1])
+        if save_predictions:
+            self._handle.write(', "predictions": [')
+
+    def write(self, record: PredictionRecord) -> None:
+        if self._handle is None:
+            raise RuntimeError("Cannot write to a closed result writer")
+        if not self.save_predictions:
+            return
+        separator = ",\n" if self._count else "\n"
+        self._handle.write(separator + json.dumps(record.to_dict()))
+        self._count += 1
+
+    def close(self, summary: Dict[str, Any], *, completed_at: datetime) -> Path:
+        """Write the trailing summary fields and move the file into place."""
+
+        if self._handle is None:
+            raise RuntimeError("Result writer is already closed")
+        if self.save_predictions:
+            self._handle.write("\n]")
+        trailer = {key: value for key, value in summary.items() if key not in {"name", "task", "started_at"}}
+        for key, value in trailer.items():
+            self._handle.write(f", {json.dumps(key)}: {json.dumps(value)}")
+        self._handle.write("}\n")
+        self._handle.close()
+        self._handle = None
+
+        timestamp = completed_at.strftime("%Y%m%dT%H%M%S")
+        file_path = self.directory / f"{self.name}_{timestamp}.json"
+        self._partial_path.replace(file_path)
+        return file_path
+
+    def abort(self) -> None:
+        """Discard the partially written payload."""
+
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._partial_path.unlink(missing_ok=True)
+
+
+_COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+OUTPUT_FORMATS = {"json": None, "jsonl": None, "jsonl.gz": "gzip", "jsonl.zst": "zstd"}
+
+
+def _open_text(path: Path, mode: str, compression: str | None) -> TextIO:
+    """Open ``path`` for text I/O (``"r"`` or ``"w"``) through the given compression."""
+
+    if compression is None:
+        return path.open(mode, encoding="utf-8")
+    if compression == "gzip":
+        # A moderate level: most of the size win at a fraction of level 9's cost.
+        return gzip.open(path, f"{mode}t", encoding="utf-8", compresslevel=6)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ImportError("The 'jsonl.zst' output format requires the 'zstandard' package") from exc
+        if mode == "w":
+            stream = zstandard.ZstdCompressor(level=3).stream_writer(path.open("wb"), closefd=True)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(path.open("rb"), closefd=True)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    raise ValueError(f"Unsupported compression '{compression}'")
+
+
+class JsonlResultWriter:
+    """Stream predictions as JSON lines, optionally compressed, next to a small manifest.
+
+    Predictions go to ``{name}_{timestamp}.predictions.jsonl[.gz|.zst]``, one
+    object per line. On ``close`` the manifest ``{name}_{timestamp}.json`` is
+    written with the run summary (metrics, statistics, timestamps) and the name
+    of the predictions file; the manifest is the run's output path. Both files
+    are written under temporary names and renamed into place, manifest last.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        name: str,
+        task: str,
+        started_at: datetime,
+        save_predictions: bool = True,
+        compression: str | None = None,
+    ) -> None:
+        self.directory = directory
+        self.name = name
+        self.save_predictions = save_predictions
+        self.compression = compression
+        self._count = 0
+        self._suffix = ".jsonl" + _COMPRESSION_SUFFIXES[compression]
+
+        directory.mkdir(parents=True, exist_ok=True)
+        timestamp = started_at.strftime("%Y%m%dT%H%M%S")
+        self._partial_path = directory / f".{name}_{timestamp}.predictions{self._suffix}.partial"
+        self._handle: TextIO | None = None
+        if save_predictions:
+            self._handle = _open_text(self._partial_path, "w", compression)
+        self._closed = False
+
+    def write(self, record: PredictionRecord) -> None:
+        if self._closed:
+            raise RuntimeError("Cannot write to a closed result writer")
+        if self._handle is None:
+            return
+        self._handle.write(json.dumps(record.to_dict()) + "\n")
+        self._count += 1
+
+    def close(self, summary: Dict[str, Any], *, completed_at: datetime) -> Path:
+        """Finish the predictions file, write the manifest and return its path."""
+
+        if self._closed:
+            raise RuntimeError("Result writer is already closed")
+        self._closed = True
+        timestamp = completed_at.strftime("%Y%m%dT%H%M%S")
+        manifest = {key: value for key, value in summary.items() if key != "predictions"}
+        manifest["format"] = "jsonl" + _COMPRESSION_SUFFIXES[self.compression]
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+            predictions_path = self.directory / f"{self.name}_{timestamp}.predictions{self._suffix}"
+            self._partial_path.replace(predictions_path)
+            manifest["predictions_file"] = predictions_path.name
+            manifest["prediction_count"] = self._count
+
+        manifest_path = self.directory / f"{self.name}_{timestamp}.json"
+        partial_manifest = self.directory / f".{manifest_path.name}.partial"
+        partial_manifest.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        partial_manifest.replace(manifest_path)
+        return manifest_path
+
+    def abort(self) -> None:
+        """Discard the partially written predictions."""
+
+        self._closed = True
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._partial_path.unlink(missing_ok=True)
+
+
+ResultWriter = Union[StreamingJsonWriter, JsonlResultWriter]
+
+
+def open_result_writer(
+    output_format: str,
+    directory: Path,
+    *,
+    name: str,
+    task: str,
+    started_at: datetime,
+    save_predictions: bool = True,
+) -> ResultWriter:
+    """Create the incremental writer for an ``OutputConfig.format``."""
+
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format '{output_format}'. Use one of: {', '.join(OUTPUT_FORMATS)}")
+    if output_format == "json":
+        return StreamingJsonWriter(
+            directory, name=name, task=task, started_at=started_at, save_predictions=save_predictions
+        )
+    return JsonlResultWriter(
+        directory,
+        name=name,
+        task=task,
+        started_at=started_at,
+        save_predictions=save_predictions,
+        compression=OUTPUT_FORMATS[output_format],
+    )
+
+
+def _compression_for(path: Path) -> str | None:
+    for compression, suffix in _COMPRESSION_SUFFIXES.items():
+        if suffix and path.name.endswith(suffix):
+            return compression
+    return None
+
+
+def iter_saved_predictions(path: str | Path | None) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the predictions saved at a run's output path, in any output format.
+
+    ``path`` is either a JSON result file or a JSON lines manifest. Files written
+    row by row are read one line at a time; only older indented JSON files are
+    parsed whole. Missing or unreadable files yield nothing.
+    """
+
+    if not path:
+        return
+    candidate = Path(path)
+    if not candidate.exists():
+        return
+    with candidate.open("r", encoding="utf-8") as handle:
+        if handle.readline().rstrip().endswith('"predictions": ['):
+            # Layout of StreamingJsonWriter: one prediction per line.
+            for line in handle:
+                line = line.strip()
+                if line.startswith("]"):
+                    return
+                if line:
+                    yield json.loads(line.rstrip(","))
+            return
+        handle.seek(0)
+        try:
+            payload = json.load(handle)
+        except json.JSONDecodeError:
+            return
+    if not isinstance(payload, dict):
+        return
+    predictions = payload.get("predictions")
+    if isinstance(predictions, list):
+        yield from predictions
+        return
+    predictions_file = payload.get("predictions_file")
+    if not predictions_file:
+        return
+    predictions_path = candidate.parent / predictions_file
+    if not predictions_path.exists():
+        return
+    with _open_text(predictions_path, "r", _compression_for(predictions_path)) as stream:
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+class ResponseCheckpoint:
+    """Append-only JSONL log of completed responses used to resume interrupted runs.
+
+    The first line records a fingerprint of the model and dataset configuration;
+    every following line holds one response. Lines are buffered and flushed every
+    ``flush_every`` responses, so at most that many predictions are lost when a
+    run dies. A trailing partial line left by a crash is ignored on load.
+    """
+
+    def __init__(self, path: Path, *, fingerprint: str, flush_every: int = 100) -> None:
+        self.path = path
+        self.fingerprint = fingerprint
+        self.flush_every = max(1, flush_every)
+        self._handle: TextIO | None = None
+        self._pending = 0
+        self._responses: CheckpointedResponses | None = None
+
+    def load(self) -> "CheckpointedResponses":
+        """Index the responses recorded by a previous attempt, keyed by uid."""
+
+        responses = CheckpointedResponses(self.path)
+        if responses.fingerprint is not None and responses.fingerprint != self.fingerprint:
+            responses.close()
+            raise ValueError(
+                f"Checkpoint {self.path} was written for a different model or dataset configuration; "
+                "delete it or run without resuming"
+            )
+        self._responses = responses
+        return responses
+
+    def open(self, *, resume: bool) -> None:
+        """Start appending, continuing the existing log when ``resume`` is set."""
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self.path.exists():
+            self._truncate_partial_line()
+            self._handle = self.path.open("a", encoding="utf-8")
+        else:
+            self._handle = self.path.open("w", encoding="utf-8")
+            self._handle.write(json.dumps({"fingerprint": self.fingerprint}) + "\n")
+            self._handle.flush()
+
+    def write(self, response: ModelResponse) -> None:
+        if self._handle is None:
+            raise RuntimeError("Checkpoint is not open")
+        record = {"uid": response.uid, "output": response.output, "metadata": response.metadata}
+        self._handle.write(json.dumps(record) + "\n")
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._handle is not None and self._pending:
+            self._handle.flush()
+            self._pending = 0
+
+    def close(self) -> None:
+        """Flush outstanding responses and keep the log for a later resume."""
+
+        if self._handle is not None:
+            self.flush()
+            self._handle.close()
+            self._handle = None
+        if self._responses is not None:
+            self._responses.close()
+
+    def discard(self) -> None:
+        """Remove the log once the run has completed."""
+
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if self._responses is not None:
+            self._responses.close()
+        self.path.unlink(missing_ok=True)
+
+    def _truncate_partial_line(self) -> None:
+        with self.path.open("rb+") as handle:
+            size = handle.seek(0, 2)
+            position = size
+            while position > 0:
+                start = max(0, position - 65536)
+                handle.seek(start)
+                newline = handle.read(position - start).rfind(b"\n")
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position < size:
+                handle.truncate(position)
+
+
+class CheckpointedResponses(Mapping[str, ModelResponse]):
+    """Read-only view of the responses stored in a checkpoint log.
+
+    Only the byte offset of each record is kept in memory; a response is decoded
+    from disk when it is looked up, so resuming a streaming run does not load
+    every previous prediction at once. Records appended after the view was
+    created are not visible through it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.fingerprint: str | None = None
+        self._offsets: Dict[str, int] = {}
+        self._handle: BinaryIO | None = None
+        self._lock = threading.Lock()
+        if not path.exists():
+            return
+        self._handle = path.open("rb")
+        header = self._handle.readline()
+        if not header.strip():
+            return
+        self.fingerprint = json.loads(header).get("fingerprint")
+        while True:
+            offset = self._handle.tell()
+            line = self._handle.readline()
+            if not line.endswith(b"\n"):
+                break
+            try:
+                uid = json.loads(line)["uid"]
+            except json.JSONDecodeError:
+                break
+            self._offsets[uid] = offset
+
+    def __getitem__(self, uid: str) -> ModelResponse:
+        offset = self._offsets[uid]
+        if self._handle is None:
+            raise RuntimeError("Checkpoint view is closed")
+        with self._lock:
+            self._handle.seek(offset)
+            data = json.loads(self._handle.readline())
+        return ModelResponse(uid=data["uid"], output=data["output"], metadata=data["metadata"])
+
+    def __contains__(self, uid: object) -> bool:
+        return uid in self._offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
@@ -0,0 +1,238 @@
+"""Tests for the FastAPI service and its job queue."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from eval_agent import EvaluationAgent, RunCancelled, load_config
+from eval_agent.api.jobs import Job, JobQueue
+from eval_agent.api.storage import RunStore
+
+ROOT = Path(__file__).resolve().parents[1]
+# ``eval_agent.api`` re-exports the FastAPI instance under the module's name.
+app_module = importlib.import_module("eval_agent.api.app")
+
+
+def _wait_for(predicate, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for condition")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    store = RunStore(tmp_path / "evaluations.db")
+    store.initialize()
+    jobs = JobQueue(app_module._execute_job, workers=2, per_config_limit=1)
+    monkeypatch.setattr(app_module, "store", store)
+    monkeypatch.setattr(app_module, "jobs", jobs)
+    with TestClient(app_module.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def keyword_config(tmp_path: Path) -> Path:
+    payload = json.loads((ROOT / "configs" / "sentiment_keyword.json").read_text(encoding="utf-8"))
+    payload["dataset"]["parameters"]["path"] = str(ROOT / "data" / "sentiment_eval.jsonl")
+    payload["output"]["directory"] = str(tmp_path / "runs")
+    path = tmp_path / "keyword.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def test_create_run_enqueues_job(client: TestClient, keyword_config: Path) -> None:
+    response = client.post("/api/runs", json={"config": str(keyword_config)})
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] in {"queued", "running", "succeeded"}
+
+    _wait_for(lambda: client.get(f"/api/jobs/{job['id']}").json()["status"] == "succeeded")
+    finished = client.get(f"/api/jobs/{job['id']}").json()
+    assert finished["run_id"] is not None
+    assert finished["started_at"] and finished["finished_at"]
+
+    run = client.get(f"/api/runs/{finished['run_id']}").json()
+    assert run["name"] == "sentiment-keyword-baseline"
+    assert run["prediction_count"] == 6 and "predictions" not in run
+    listing = client.get("/api/runs", params={"config_name": str(keyword_config)}).json()
+    assert [item["id"] for item in listing["items"]] == [finished["run_id"]] and listing["next_cursor"] is None
+    assert client.get("/api/runs", params={"cursor": "bogus"}).status_code == 400
+
+    series = client.get("/api/metrics/accuracy/series", params={"window": 3}).json()
+    assert series["series"][0]["points"][0]["run_id"] == finished["run_id"]
+    assert series["series"][0]["points"][0]["rolling_mean"] == 1.0
+    summary = client.get("/api/metrics/accuracy/summary", params={"percentiles": [25, 75]}).json()
+    assert summary["groups"][0]["percentiles"] == {"p25": 1.0, "p75": 1.0}
+    assert client.get("/api/metrics/accuracy/summary", params={"percentiles": [101]}).status_code == 400
+    assert [item["id"] for item in client.get("/api/jobs", params={"status": "succeeded"}).json()] == [job["id"]]
+
+    assert client.post(f"/api/jobs/{job['id']}/cancel").status_code == 409
+    assert client.get("/api/jobs/missing").status_code == 404
+    assert client.post("/api/runs", json={"config": "missing.json"}).status_code == 404
+
+
+def _record_keyword_run(tmp_path: Path, output_format: str = "json", **overrides) -> int:
+    config = load_config(ROOT / "configs" / "sentiment_keyword.json")
+    config.output.directory = tmp_path / "runs"
+    config.output.format = output_format
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    result = EvaluationAgent(config).run()
+    return app_module.store.record_run(config_name="keyword", config_path=Path("keyword.json"), result=result)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_predictions_endpoint_paginates_and_filters(client: TestClient, tmp_path: Path, streaming: bool) -> None:
+    run_id = _record_keyword_run(tmp_path, streaming=streaming)
+    url = f"/api/runs/{run_id}/predictions"
+
+    uids = []
+    cursor = None
+    while True:
+        params = {"limit": 4, **({"cursor": cursor} if cursor else {})}
+        page = client.get(url, params=params).json()
+        uids.extend(item["uid"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    lines = (ROOT / "data" / "sentiment_eval.jsonl").read_text(encoding="utf-8").splitlines()
+    expected = [str(json.loads(line)["id"]) for line in lines if line]
+    assert uids == expected
+
+    by_gold = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "sort": "gold", "order": "desc", **({"cursor": cursor} if cursor else {})}
+        page = client.get(url, params=params).json()
+        by_gold.extend((item["expected_output"], item["uid"]) for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    positions = {uid: index for index, uid in enumerate(expected)}
+    assert by_gold == sorted(by_gold, key=lambda pair: (pair[0], positions[pair[1]]), reverse=True)
+
+    positives = client.get(url, params={"gold": "positive"}).json()["items"]
+    assert positives and all(item["expected_output"] == "positive" for item in positives)
+    assert client.get(url, params={"misclassified": True}).json()["items"] == []
+    assert [item["uid"] for item in client.get(url, params={"uid": expected[2]}).json()["items"]] == [expected[2]]
+
+    assert client.get(url, params={"sort": "metadata"}).status_code == 400
+    assert client.get(url, params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/api/runs/999/predictions").status_code == 404
+
+
+@pytest.mark.parametrize("output_format", ["json", "jsonl.gz"])
+def test_initialize_imports_legacy_predictions(client: TestClient, tmp_path: Path, output_format: str) -> None:
+    run_id = _record_keyword_run(tmp_path, output_format, streaming=True)
+    # Simulate a database written before predictions were stored in it.
+    with sqlite3.connect(app_module.store.path) as connection:
+        connection.execute("DELETE FROM predictions")
+        connection.execute("PRAGMA user_version = 0")
+
+    app_module.store.initialize()
+    assert client.get(f"/api/runs/{run_id}").json()["prediction_count"] == 6
+
+
+def test_diff_runs_reports_regressions(client: TestClient, tmp_path: Path) -> None:
+    baseline_id = _record_keyword_run(tmp_path)
+    config = load_config(ROOT / "configs" / "sentiment_keyword.json")
+    config.output.directory = tmp_path / "runs"
+    config.model.parameters["positive_keywords"] = []
+    candidate_id = app_module.store.record_run(
+        config_name="keyword", config_path=Path("keyword.json"), result=EvaluationAgent(config).run()
+    )
+    positives = client.get(f"/api/runs/{baseline_id}/predictions", params={"gold": "positive"}).json()["items"]
+
+    diff = client.get(f"/api/runs/{candidate_id}/diff/{baseline_id}", params={"kind": "regressed", "limit": 1}).json()
+    assert diff["counts"] == {"shared": 6, "changed": len(positives), "fixed": 0, "regressed": len(positives)}
+    assert len(diff["items"]) == 1 and diff["next_cursor"]
+    entry = diff["items"][0]
+    assert entry["uid"] == positives[0]["uid"]
+    assert entry["baseline_correct"] and not entry["correct"]
+    assert entry["baseline_output"] == "positive" and entry["predicted_output"] == "neutral"
+
+    rest = client.get(
+        f"/api/runs/{candidate_id}/diff/{baseline_id}",
+        params={"kind": "regressed", "cursor": diff["next_cursor"]},
+    ).json()
+    assert [item["uid"] for item in rest["items"]] == [item["uid"] for item in positives[1:]]
+    assert client.get(f"/api/runs/{candidate_id}/diff/{baseline_id}", params={"kind": "fixed"}).json()["items"] == []
+    assert client.get(f"/api/runs/{candidate_id}/diff/999").status_code == 404
+
+
+def test_job_events_stream_until_finished(client: TestClient, keyword_config: Path) -> None:
+    job = client.post("/api/runs", json={"config": str(keyword_config)}).json()
+
+    updates = []
+    with client.stream("GET", f"/api/jobs/{job['id']}/events") as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        for line in response.iter_lines():
+            if line.startswith("data: "):
+                updates.append(json.loads(line[len("data: ") :]))
+
+    final = updates[-1]
+    assert final["status"] == "succeeded" and final["run_id"] is not None
+    assert final["progress"]["done"] and final["progress"]["processed"] == 6
+    assert final["progress"]["metrics"]["accuracy"] == 1.0
+    assert client.get("/api/jobs/missing/events").status_code == 404
+
+
+def test_job_events_stop_when_client_disconnects(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _Request:
+        checks = 0
+
+        async def is_disconnected(self) -> bool:
+            self.checks += 1
+            return self.checks > 2
+
+    monkeypatch.setattr(app_module, "EVENT_POLL_INTERVAL", 0.01)
+    job = Job(id="idle", config_name="a", config_path=Path("a.json"))
+
+    async def collect() -> list:
+        return [event async for event in app_module._job_events(job, _Request())]
+
+    events = asyncio.run(asyncio.wait_for(collect(), timeout=5.0))
+    # The initial state is sent, then the idle stream ends instead of waiting for a heartbeat.
+    assert len(events) == 1 and events[0].startswith("event: job")
+
+
+def test_job_queue_limits_and_cancellation() -> None:
+    started = {"a": threading.Event(), "b": threading.Event()}
+
+    def execute(job: Job) -> int:
+        started[job.config_name].set()
+        job.cancel_event.wait(10.0)
+        raise RunCancelled(job.id)
+
+    queue = JobQueue(execute, workers=4, per_config_limit=1)
+    try:
+        first = queue.submit(config_name="a", config_path=Path("a.json"))
+        second = queue.submit(config_name="a", config_path=Path("a.json"))
+        other = queue.submit(config_name="b", config_path=Path("b.json"))
+        assert started["a"].wait(5.0) and started["b"].wait(5.0)
+
+        # The second job for "a" waits behind the per-config limit.
+        assert first.status == "running" and other.status == "running"
+        assert second.status == "queued"
+
+        queue.cancel(second.id)
+        assert second.status == "cancelled" and second.started_at is None
+
+        queue.cancel(first.id)
+        _wait_for(lambda: first.finished)
+        assert first.status == "cancelled"
+        assert [job.id for job in queue.list("running")] == [other.id]
+    finally:
+        queue.shutdown()
+    assert other.status == "cancelled"
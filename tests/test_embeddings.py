@@ -0,0 +1,44 @@
+"""Tests for the hashing bag-of-words embeddings."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from eval_agent.models.langchain_rag import BagOfWordsEmbeddings
+
+
+def test_embed_matrix_is_normalised_and_matches_single_queries() -> None:
+    embeddings = BagOfWordsEmbeddings(dimension=64)
+    texts = ["The cat sat on the mat", "", "cat cat CAT"]
+
+    matrix = embeddings.embed_matrix(texts)
+
+    assert matrix.dtype == np.float32
+    assert matrix.shape == (3, 64)
+    np.testing.assert_allclose(np.linalg.norm(matrix, axis=1), [1.0, 0.0, 1.0], rtol=1e-6)
+    assert np.count_nonzero(matrix[2]) == 1
+    for row, text in zip(matrix, texts):
+        np.testing.assert_allclose(row, embeddings.embed_query(text))
+
+
+def test_embeddings_are_stable_across_processes() -> None:
+    script = (
+        "import json; from eval_agent.models.langchain_rag import BagOfWordsEmbeddings; "
+        "print(json.dumps(BagOfWordsEmbeddings(dimension=32).embed_query('stable hashing across runs')))"
+    )
+    python_path = os.pathsep.join(
+        filter(None, [str(Path(__file__).resolve().parents[1] / "src"), os.environ.get("PYTHONPATH")])
+    )
+    vectors = []
+    for seed in ("1", "2"):
+        env = {**os.environ, "PYTHONHASHSEED": seed, "PYTHONPATH": python_path}
+        output = subprocess.run([sys.executable, "-c", script], env=env, check=True, capture_output=True, text=True)
+        vectors.append(json.loads(output.stdout))
+
+    assert vectors[0] == vectors[1]
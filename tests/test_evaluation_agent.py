@@ -3,9 +3,17 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
 
-from eval_agent import EvaluationAgent, load_config
+import pytest
+
+from eval_agent import EvaluationAgent, RunCancelled, load_config
+from eval_agent.config import CacheConfig, ConcurrencyConfig
+from eval_agent.metrics.generation import BleuMetric, ContextPrecisionMetric, RougeLMetric
+from eval_agent.models.keyword import KeywordMatchingModel
+from eval_agent.types import ModelResponse
+from eval_agent.writers import iter_saved_predictions
 
 
 def test_keyword_model_evaluation(tmp_path: Path) -> None:
@@ -47,6 +55,7 @@ def test_langchain_rag_evaluation(tmp_path: Path) -> None:
     config_path = Path(__file__).resolve().parents[1] / "configs" / "rag_langchain.json"
     config = load_config(config_path)
     config.output.directory = tmp_path
+    config.model.parameters["index_cache_dir"] = str(tmp_path / "index_cache")
 
     agent = EvaluationAgent(config)
     result = agent.run()
@@ -73,3 +82,221 @@ def test_langchain_rag_evaluation(tmp_path: Path) -> None:
     saved_payload = json.loads(result.output_path.read_text(encoding="utf-8"))
     assert saved_payload["name"] == "langchain-rag-demo"
     assert len(saved_payload.get("predictions", [])) == 3
+
+
+@pytest.mark.parametrize("mode", ["thread", "process", "asyncio"])
+def test_concurrent_execution_preserves_order(tmp_path: Path, mode: str) -> None:
+    config_path = Path(__file__).resolve().parents[1] / "configs" / "sentiment_keyword.json"
+    config = load_config(config_path)
+    config.output.directory = tmp_path
+    serial_result = EvaluationAgent(config).run()
+
+    config.concurrency = ConcurrencyConfig(mode=mode, workers=3, chunk_size=2)
+    result = EvaluationAgent(config).run()
+
+    assert [p.uid for p in result.predictions] == [p.uid for p in serial_result.predictions]
+    assert [p.predicted_output for p in result.predictions] == [
+        p.predicted_output for p in serial_result.predictions
+    ]
+    assert [m.to_dict() for m in result.metrics] == [m.to_dict() for m in serial_result.metrics]
+
+
+def test_streaming_evaluation_matches_buffered(tmp_path: Path) -> None:
+    config_path = Path(__file__).resolve().parents[1] / "configs" / "sentiment_keyword.json"
+    config = load_config(config_path)
+    config.output.directory = tmp_path / "buffered"
+    buffered = EvaluationAgent(config).run()
+
+    config.output.directory = tmp_path / "streaming"
+    config.streaming = True
+    streamed = EvaluationAgent(config).run()
+
+    assert streamed.predictions == []
+    assert [m.to_dict() for m in streamed.metrics] == [m.to_dict() for m in buffered.metrics]
+
+    assert streamed.output_path is not None
+    assert list(streamed.output_path.parent.iterdir()) == [streamed.output_path]
+    saved_payload = json.loads(streamed.output_path.read_text(encoding="utf-8"))
+    assert saved_payload["name"] == "sentiment-keyword-baseline"
+    assert saved_payload["metrics"] == [m.to_dict() for m in buffered.metrics]
+    assert saved_payload["predictions"] == [p.to_dict() for p in buffered.predictions]
+
+
+@pytest.mark.parametrize("output_format", ["json", "jsonl", "jsonl.gz", "jsonl.zst"])
+def test_output_formats_round_trip(tmp_path: Path, output_format: str) -> None:
+    if output_format == "jsonl.zst":
+        pytest.importorskip("zstandard")
+    config_path = Path(__file__).resolve().parents[1] / "configs" / "sentiment_keyword.json"
+    config = load_config(config_path)
+    config.output.directory = tmp_path
+    config.output.format = output_format
+    result = EvaluationAgent(config).run()
+
+    assert result.output_path is not None and result.output_path.suffix == ".json"
+    assert not any(path.name.startswith(".") for path in tmp_path.iterdir())
+    payload = json.loads(result.output_path.read_text(encoding="utf-8"))
+    assert payload["metrics"] == [m.to_dict() for m in result.metrics]
+    if output_format != "json":
+        assert "predictions" not in payload and payload["prediction_count"] == 6
+        assert (tmp_path / payload["predictions_file"]).name.endswith(output_format)
+    assert list(iter_saved_predictions(result.output_path)) == [p.to_dict() for p in result.predictions]
+
+    config.output.format = "parquet"
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        EvaluationAgent(config).run()
+
+
+@pytest.mark.parametrize("mode", ["serial", "thread"])
+def test_prediction_cache_serves_repeat_runs(tmp_path: Path, mode: str) -> None:
+    config_path = Path(__file__).resolve().parents[1] / "configs" / "sentiment_keyword.json"
+    config = load_config(config_path)
+    config.output.directory = tmp_path
+    config.concurrency = ConcurrencyConfig(mode=mode, workers=2, chunk_size=4)
+    config.cache = CacheConfig(enabled=True, path=tmp_path / "cache.sqlite")
+
+    first = EvaluationAgent(config).run()
+    second = EvaluationAgent(config).run()
+
+    assert first.statistics["cache"] == {"hits": 0, "misses": 6}
+    assert second.statistics["cache"] == {"hits": 6, "misses": 0}
+    assert [p.to_dict() for p in second.predictions] == [p.to_dict() for p in first.predictions]
+    assert [m.to_dict() for m in second.metrics] == [m.to_dict() for m in first.metrics]
+
+    config.model.parameters = {**config.model.parameters, "case_sensitive": True}
+    third = EvaluationAgent(config).run()
+    assert third.statistics["cache"] == {"hits": 0, "misses": 6}
+
+
+def test_resume_skips_checkpointed_examples(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config_path = Path(__file__).resolve().parents[1] / "configs" / "sentiment_keyword.json"
+    config = load_config(config_path)
+    config.output.directory = tmp_path / "baseline"
+    baseline = EvaluationAgent(config).run()
+
+    config.output.directory = tmp_path / "resumed"
+    config.output.checkpoint_every = 1
+    original_predict = KeywordMatchingModel.predict
+    calls: list[str] = []
+
+    def flaky_predict(self: KeywordMatchingModel, example):  # type: ignore[no-untyped-def]
+        calls.append(example.uid)
+        if len(calls) == 4:
+            raise RuntimeError("simulated crash")
+        return original_predict(self, example)
+
+    monkeypatch.setattr(KeywordMatchingModel, "predict", flaky_predict)
+    with pytest.raises(RuntimeError):
+        EvaluationAgent(config).run()
+    (checkpoint_path,) = (tmp_path / "resumed").glob(f".{config.name}.*.checkpoint.jsonl")
+    assert len(checkpoint_path.read_text(encoding="utf-8").splitlines()) == 1 + 3
+
+    def counting_predict(self: KeywordMatchingModel, example):  # type: ignore[no-untyped-def]
+        calls.append(example.uid)
+        return original_predict(self, example)
+
+    calls.clear()
+    monkeypatch.setattr(KeywordMatchingModel, "predict", counting_predict)
+    resumed = EvaluationAgent(config, resume=True).run()
+
+    assert len(calls) == 3
+    assert resumed.statistics["resumed_examples"] == 3
+    assert [p.to_dict() for p in resumed.predictions] == [p.to_dict() for p in baseline.predictions]
+    assert [m.to_dict() for m in resumed.metrics] == [m.to_dict() for m in baseline.metrics]
+    assert not checkpoint_path.exists()
+
+
+def test_recorded_failures_do_not_affect_metrics(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config_path = Path(__file__).resolve().parents[1] / "configs" / "sentiment_keyword.json"
+    config = load_config(config_path)
+    config.output.directory = tmp_path
+    baseline = EvaluationAgent(config).run()
+    original_predict = KeywordMatchingModel.predict
+
+    def failing_predict(self: KeywordMatchingModel, example):  # type: ignore[no-untyped-def]
+        if example.uid == baseline.predictions[0].uid:
+            return ModelResponse(uid=example.uid, output=None, metadata={"error": {"type": "TimeoutError"}})
+        return original_predict(self, example)
+
+    monkeypatch.setattr(KeywordMatchingModel, "predict", failing_predict)
+    result = EvaluationAgent(config).run()
+
+    assert result.statistics["failed_examples"] == 1
+    assert result.predictions[0].predicted_output is None
+    metrics = {metric.name: metric for metric in result.metrics}
+    assert metrics["accuracy"].details["total"] == 5
+    assert "None" not in metrics["confusion_matrix"].details["labels"]
+    assert {name: metric.value for name, metric in metrics.items()} == {
+        metric.name: metric.value for metric in baseline.metrics
+    }
+
+
+def test_cancelled_run_keeps_checkpoint(tmp_path: Path) -> None:
+    config_path = Path(__file__).resolve().parents[1] / "configs" / "sentiment_keyword.json"
+    config = load_config(config_path)
+    config.output.directory = tmp_path
+    cancel_event = threading.Event()
+    cancel_event.set()
+
+    with pytest.raises(RunCancelled):
+        EvaluationAgent(config, cancel_event=cancel_event).run()
+    assert not list(tmp_path.glob(f".{config.name}.*.checkpoint.jsonl"))
+
+    config.output.checkpoint_every = 10
+    for _ in range(2):
+        with pytest.raises(RunCancelled):
+            EvaluationAgent(config, cancel_event=cancel_event).run()
+
+    # Each run keeps its own log, so concurrent runs of one config never interleave.
+    assert len(list(tmp_path.glob(f".{config.name}.*.checkpoint.jsonl"))) == 2
+    assert not list(tmp_path.glob(f"{config.name}_*.json"))
+
+
+def test_progress_events_report_partial_metrics(tmp_path: Path) -> None:
+    config_path = Path(__file__).resolve().parents[1] / "configs" / "sentiment_keyword.json"
+    config = load_config(config_path)
+    config.output.directory = tmp_path
+    events = []
+
+    EvaluationAgent(config, progress=events.append, progress_interval=0.0).run()
+
+    assert [event.processed for event in events] == [1, 2, 3, 4, 5, 6, 6]
+    assert all(event.total == 6 for event in events)
+    assert events[-1].done and not any(event.done for event in events[:-1])
+    assert events[-1].eta == 0.0
+    assert events[-1].metrics["accuracy"] == 1.0
+    assert set(events[0].metrics) == {metric.name for metric in config.metrics}
+
+
+def test_partial_progress_does_not_finalize_metrics(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config_path = Path(__file__).resolve().parents[1] / "configs" / "rag_langchain.json"
+    config = load_config(config_path)
+    config.output.directory = tmp_path
+    config.model.parameters["index_cache"] = False
+    finalized: list[str] = []
+    for metric_class in (RougeLMetric, BleuMetric, ContextPrecisionMetric):
+        original = metric_class.finalize
+
+        def counting_finalize(self, original=original):  # type: ignore[no-untyped-def]
+            finalized.append(self.name)
+            return original(self)
+
+        monkeypatch.setattr(metric_class, "finalize", counting_finalize)
+    events = []
+
+    result = EvaluationAgent(config, progress=events.append, progress_interval=0.0).run()
+
+    assert len(events) == 4 and len(finalized) == 3
+    assert events[1].metrics["rouge_l"] == 1.0
+    assert events[-1].metrics == {metric.name: metric.value for metric in result.metrics}
+
+
+def test_progress_events_are_rate_limited(tmp_path: Path) -> None:
+    config_path = Path(__file__).resolve().parents[1] / "configs" / "sentiment_keyword.json"
+    config = load_config(config_path)
+    config.output.directory = tmp_path
+    events = []
+
+    EvaluationAgent(config, progress=events.append, progress_interval=3600.0).run()
+
+    assert len(events) == 1
+    assert events[0].done and events[0].processed == 6
@@ -0,0 +1,55 @@
+"""Tests for the keyword matching model."""
+
+from __future__ import annotations
+
+import random
+
+from eval_agent.models.keyword import KeywordMatchingModel
+from eval_agent.types import Example
+
+
+def _reference(model: KeywordMatchingModel, text: str) -> tuple[str | None, str | None]:
+    normalized = text if model.case_sensitive else text.lower()
+    for category in model.priority:
+        keywords = model.positive_keywords if category == "positive" else model.negative_keywords
+        label = "positive" if category == "positive" else "negative"
+        for keyword in keywords:
+            if keyword in normalized:
+                return label, keyword
+    return None, None
+
+
+def test_keyword_model_priority_and_first_match() -> None:
+    model = KeywordMatchingModel(
+        positive_keywords=["great", "good"],
+        negative_keywords=["not good", "bad"],
+        priority=["negative", "positive"],
+    )
+
+    response = model.predict(Example(uid="1", inputs={"text": "Good food, NOT GOOD service"}, expected_output=None))
+    assert response.output == "negative"
+    assert response.metadata["matched_keyword"] == "not good"
+
+    response = model.predict(Example(uid="2", inputs={"text": "good, then great"}, expected_output=None))
+    assert response.output == "positive"
+    assert response.metadata["matched_keyword"] == "great"
+
+    response = model.predict(Example(uid="3", inputs={"text": "meh"}, expected_output=None))
+    assert response.output == "neutral"
+    assert response.metadata["matched_keyword"] is None
+
+
+def test_keyword_model_matches_substring_scan() -> None:
+    rng = random.Random(7)
+    alphabet = "abc "
+    for _ in range(200):
+        positive = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 4))) for _ in range(rng.randint(0, 6))]
+        negative = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(0, 6))]
+        model = KeywordMatchingModel(
+            positive_keywords=positive,
+            negative_keywords=negative,
+            priority=rng.choice([None, ["negative", "positive"], ["positive"]]),
+        )
+        text = "".join(rng.choice(alphabet + "AB") for _ in range(rng.randint(0, 30)))
+        response = model.predict(Example(uid="x", inputs={"text": text}, expected_output=None))
+        assert (response.metadata["matched_category"], response.metadata["matched_keyword"]) == _reference(model, text)
@@ -0,0 +1,149 @@
+"""Tests for the LangChain RAG adapter."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+import eval_agent.models.langchain_rag as langchain_rag
+from eval_agent.cache import PredictionCache, model_namespace
+from eval_agent.models.langchain_rag import LangChainRagModel
+from eval_agent.types import Example
+
+CORPUS = Path(__file__).resolve().parents[1] / "data" / "rag_corpus.jsonl"
+
+
+def _question(text: str) -> Example:
+    return Example(uid="q", inputs={"question": text}, expected_output=None)
+
+
+def test_index_cache_reused_and_invalidated(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    corpus = tmp_path / "corpus.jsonl"
+    shutil.copy(CORPUS, corpus)
+    loads: list[Path] = []
+    original_load = langchain_rag._load_documents
+
+    def counting_load(path: Path):  # type: ignore[no-untyped-def]
+        loads.append(path)
+        return original_load(path)
+
+    monkeypatch.setattr(langchain_rag, "_load_documents", counting_load)
+
+    def build() -> LangChainRagModel:
+        model = LangChainRagModel(documents_path=corpus, embedding_size=64, retriever_top_k=1)
+        model.warmup()
+        return model
+
+    first = build().predict(_question("What is LangChain used for?"))
+    second = build().predict(_question("What is LangChain used for?"))
+    assert len(loads) == 1
+    assert second.output == first.output
+    assert second.metadata["retrieved_documents"] == first.metadata["retrieved_documents"]
+    assert len(list((tmp_path / ".faiss_cache").iterdir())) == 1
+
+    with corpus.open("a", encoding="utf-8") as handle:
+        handle.write('{"id": "doc-new", "text": "Caches must be invalidated when the corpus changes."}\n')
+    response = build().predict(_question("When must caches be invalidated?"))
+    assert len(loads) == 2
+    assert response.metadata["retrieved_documents"][0]["id"] == "doc-new"
+
+
+def test_prediction_cache_keys_cover_corpus_and_expected_contexts(tmp_path: Path) -> None:
+    corpus = tmp_path / "corpus.jsonl"
+    shutil.copy(CORPUS, corpus)
+    parameters = {"documents_path": str(corpus), "embedding_size": 64}
+    model = LangChainRagModel(**parameters, index_cache=False)
+    namespace = model_namespace("langchain-rag", parameters, model.cache_fingerprint())
+    tuned = {**parameters, "batch_size": 32, "index_cache": False}
+    assert model_namespace("langchain-rag", tuned, model.cache_fingerprint()) == namespace
+
+    model.warmup()
+    cache = PredictionCache(
+        tmp_path / "cache.sqlite", namespace=namespace, max_bytes=1 << 20, key_fields=model.cache_key_fields
+    )
+    inputs = {"question": "What is LangChain used for?"}
+    first = Example(uid="a", inputs=inputs, expected_output=None, metadata={"context_ids": ["doc-1"]})
+    second = Example(uid="b", inputs=inputs, expected_output=None, metadata={"context_ids": ["doc-2"]})
+    try:
+        cache.put_many([first], model.predict_batch([first]))
+        hit, miss = cache.get_many([first, second])
+    finally:
+        cache.close()
+    assert hit is not None and miss is None
+
+    with corpus.open("a", encoding="utf-8") as handle:
+        handle.write('{"id": "doc-new", "text": "Caches must be invalidated when the corpus changes."}\n')
+    assert LangChainRagModel(**parameters).cache_fingerprint() != model.cache_fingerprint()
+
+
+def test_predict_batch_matches_single_predictions() -> None:
+    model = LangChainRagModel(documents_path=CORPUS, embedding_size=64, retriever_top_k=2, index_cache=False)
+    model.warmup()
+    questions = [
+        "What is LangChain used for?",
+        "Why do we need vector stores when building RAG systems?",
+        "How does retrieval-augmented generation ground outputs?",
+    ]
+    examples = [
+        Example(uid=str(idx), inputs={"question": text}, expected_output=None) for idx, text in enumerate(questions)
+    ]
+
+    batched = model.predict_batch(examples)
+    single = [model.predict(example) for example in examples]
+
+    assert [(response.output, response.metadata) for response in batched] == [
+        (response.output, response.metadata) for response in single
+    ]
+    for text, response in zip(questions, batched):
+        expected = model._vectorstore.similarity_search_with_score(text, k=2)
+        retrieved_ids = [item["id"] for item in response.metadata["retrieved_documents"]]
+        assert retrieved_ids == [document.metadata["id"] for document, _distance in expected]
+
+
+def _synthetic_text(idx: int) -> str:
+    return f"entry {idx} topic{idx % 17} term{idx * 7 % 23} word{idx}"
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        {"type": "flat"},
+        {"type": "ivf-flat", "nlist": 8, "nprobe": 8},
+        {"type": "ivf-pq", "nlist": 4, "nprobe": 4, "pq_m": 8, "training_sample_size": 150},
+        {"type": "hnsw", "hnsw_m": 8, "ef_search": 32},
+    ],
+)
+def test_index_types_retrieve_and_round_trip_through_cache(tmp_path: Path, index: dict) -> None:
+    corpus = tmp_path / "corpus.jsonl"
+    with corpus.open("w", encoding="utf-8") as handle:
+        for idx in range(200):
+            handle.write(f'{{"id": "doc{idx}", "text": "{_synthetic_text(idx)}"}}\n')
+
+    def build() -> LangChainRagModel:
+        model = LangChainRagModel(documents_path=corpus, embedding_size=256, retriever_top_k=3, index=index)
+        model.warmup()
+        return model
+
+    first = build()
+    statistics = first.statistics()["index"]
+    assert statistics["type"] == index["type"]
+    assert statistics["documents"] == 200
+    assert statistics["build_seconds"] is not None
+    assert statistics["memory_bytes"] > 0
+
+    examples = [
+        Example(uid=str(idx), inputs={"question": _synthetic_text(idx)}, expected_output=None) for idx in range(0, 200, 20)
+    ]
+    responses = first.predict_batch(examples)
+    assert all(len(response.metadata["retrieved_documents"]) == 3 for response in responses)
+    if index["type"] != "ivf-pq":
+        assert [response.metadata["retrieved_documents"][0]["id"] for response in responses] == [
+            f"doc{idx}" for idx in range(0, 200, 20)
+        ]
+
+    second = build()
+    assert second.statistics()["index"]["from_cache"] is True
+    repeated = second.predict_batch(examples)
+    assert [response.metadata for response in repeated] == [response.metadata for response in responses]
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import Any, Callable
 
 import pytest
 from mcp import McpError
 import mcp.types as mcp_types
 from mcp.client.session import SUPPORTED_PROTOCOL_VERSIONS
 
+from eval_agent.execution import ProcessExecutor
 from eval_agent.models.mcp import MCPModelAdapter
+from eval_agent.models.resilience import RetryBudget
+from eval_agent.tasks.base import _BatchPredictor
 from eval_agent.types import Example
 
 
@@ -27,6 +32,13 @@ class FakeSessionFactory:
         self.tool_name = tool_name
         self.call_tool_result = call_tool_result
         self.side_effect = side_effect
+        self.transport_failures = 0
+        self.delay = 0.0
+        self.responder: Callable[[dict[str, Any]], mcp_types.CallToolResult] | None = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.opened_sessions = 0
+        self.closed_sessions = 0
         self.initialize_calls = 0
         self.list_tools_calls = 0
         self.call_tool_calls = 0
@@ -56,12 +68,28 @@ class FakeSessionFactory:
                 factory.call_tool_calls += 1
                 factory.last_tool_name = name
                 factory.last_arguments = arguments
+                if factory.transport_failures:
+                    factory.transport_failures -= 1
+                    raise ConnectionResetError("connection dropped")
                 if factory.side_effect is not None:
                     raise factory.side_effect
+                factory.in_flight += 1
+                factory.max_in_flight = max(factory.max_in_flight, factory.in_flight)
+                try:
+                    if factory.delay:
+                        await asyncio.sleep(factory.delay)
+                finally:
+                    factory.in_flight -= 1
+                if factory.responder is not None:
+                    return factory.responder(arguments)
                 return factory.call_tool_result
 
+        factory.opened_sessions += 1
         session = _Session()
-        yield session
+        try:
+            yield session
+        finally:
+            factory.closed_sessions += 1
 
 
 def _text_result(text: str, *, structured: dict[str, Any] | None = None, is_error: bool = False) -> mcp_types.CallToolResult:
@@ -91,7 +119,7 @@ def test_mcp_adapter_warmup_and_predict() -> None:
 
     response = adapter.predict(_example("I absolutely loved it."))
 
-    assert factory.initialize_calls == 2  # warmup + predict sessions
+    assert factory.initialize_calls == 1  # the warmup session is reused
     assert factory.call_tool_calls == 1
     assert factory.last_tool_name == "sentiment-classifier"
 
@@ -105,6 +133,7 @@ def test_mcp_adapter_warmup_and_predict() -> None:
     assert response.metadata["structured"] == {"score": 0.94}
     assert response.metadata["tool"] == "sentiment-classifier"
     assert response.metadata["server_info"]["name"] == "stub-server"
+    adapter.close()
 
 
 def test_mcp_adapter_predict_triggers_warmup() -> None:
@@ -124,6 +153,7 @@ def test_mcp_adapter_predict_triggers_warmup() -> None:
     # Warmup should have been performed automatically.
     assert factory.list_tools_calls == 1
     assert factory.call_tool_calls == 1
+    adapter.close()
 
 
 def test_mcp_adapter_raises_on_server_error() -> None:
@@ -134,11 +164,13 @@ def test_mcp_adapter_raises_on_server_error() -> None:
     adapter = MCPModelAdapter(
         endpoint="http://stub",
         model_id="demo-tool",
+        on_error="raise",
         session_factory=factory,
     )
 
     with pytest.raises(RuntimeError) as excinfo:
         adapter.predict(_example("bad input"))
+    adapter.close()
 
     message = str(excinfo.value)
     assert "returned an error" in message
@@ -155,11 +187,13 @@ def test_mcp_adapter_wraps_transport_errors() -> None:
     adapter = MCPModelAdapter(
         endpoint="http://stub",
         model_id="demo-tool",
+        on_error="raise",
         session_factory=factory,
     )
 
     with pytest.raises(RuntimeError) as excinfo:
         adapter.predict(_example("hello"))
+    adapter.close()
 
     assert "MCP tool call failed" in str(excinfo.value)
 
@@ -179,3 +213,262 @@ def test_mcp_adapter_auth_env(monkeypatch: pytest.MonkeyPatch) -> None:
     )
 
     assert adapter._headers["Authorization"] == "Bearer secret-token"
+
+
+def test_mcp_adapter_reuses_session_and_closes_cleanly() -> None:
+    factory = FakeSessionFactory(
+        tool_name="demo-tool",
+        call_tool_result=_text_result("ok"),
+    )
+    adapter = MCPModelAdapter(
+        endpoint="http://stub",
+        model_id="demo-tool",
+        session_factory=factory,
+    )
+
+    for idx in range(5):
+        adapter.predict(Example(uid=str(idx), inputs={"text": "hi"}, expected_output="ok"))
+
+    assert factory.opened_sessions == 1
+    assert factory.initialize_calls == 1
+    assert factory.call_tool_calls == 5
+
+    adapter.close()
+    assert factory.closed_sessions == 1
+
+
+def test_mcp_adapter_reconnects_after_transport_failure() -> None:
+    factory = FakeSessionFactory(
+        tool_name="demo-tool",
+        call_tool_result=_text_result("ok"),
+    )
+    adapter = MCPModelAdapter(
+        endpoint="http://stub",
+        model_id="demo-tool",
+        session_factory=factory,
+    )
+    adapter.warmup(None)
+
+    factory.transport_failures = 1
+    try:
+        response = adapter.predict(_example("hello"))
+    finally:
+        adapter.close()
+
+    assert response.output == "ok"
+    assert factory.call_tool_calls == 2
+    assert factory.opened_sessions == 2
+    assert factory.closed_sessions == 2
+
+
+def test_mcp_adapter_predict_batch_runs_concurrently_in_order() -> None:
+    factory = FakeSessionFactory(
+        tool_name="demo-tool",
+        call_tool_result=_text_result("unused"),
+    )
+    factory.delay = 0.05
+    factory.responder = lambda arguments: _text_result(arguments["input"]["text"].upper())
+    adapter = MCPModelAdapter(
+        endpoint="http://stub",
+        model_id="demo-tool",
+        max_concurrency=4,
+        session_factory=factory,
+    )
+    examples = [Example(uid=str(idx), inputs={"text": f"item {idx}"}, expected_output="") for idx in range(10)]
+
+    try:
+        responses = adapter.predict_batch(examples)
+    finally:
+        adapter.close()
+
+    assert [response.uid for response in responses] == [str(idx) for idx in range(10)]
+    assert [response.output for response in responses] == [f"ITEM {idx}" for idx in range(10)]
+    assert factory.max_in_flight == 4
+    assert factory.opened_sessions == 4
+
+
+def test_mcp_adapter_rate_limit_and_timeout() -> None:
+    factory = FakeSessionFactory(
+        tool_name="demo-tool",
+        call_tool_result=_text_result("ok"),
+    )
+    adapter = MCPModelAdapter(
+        endpoint="http://stub",
+        model_id="demo-tool",
+        rate_limit=20.0,
+        rate_burst=1,
+        request_timeout=0.05,
+        retry={"max_attempts": 1},
+        on_error="raise",
+        session_factory=factory,
+    )
+    examples = [Example(uid=str(idx), inputs={"text": "hi"}, expected_output="") for idx in range(5)]
+
+    try:
+        started = time.monotonic()
+        adapter.predict_batch(examples)
+        assert time.monotonic() - started >= 0.19
+
+        factory.delay = 1.0
+        with pytest.raises(RuntimeError) as excinfo:
+            adapter.predict(_example("slow"))
+        assert "timed out" in str(excinfo.value)
+    finally:
+        adapter.close()
+
+
+def test_mcp_adapter_retries_with_backoff() -> None:
+    factory = FakeSessionFactory(
+        tool_name="demo-tool",
+        call_tool_result=_text_result("ok"),
+    )
+    adapter = MCPModelAdapter(
+        endpoint="http://stub",
+        model_id="demo-tool",
+        retry={"max_attempts": 3, "initial_delay": 0.01, "jitter": False},
+        on_error="raise",
+        session_factory=factory,
+    )
+
+    factory.transport_failures = 2
+    try:
+        response = adapter.predict(_example("hello"))
+        assert response.output == "ok"
+        assert factory.call_tool_calls == 3
+
+        factory.transport_failures = 3
+        with pytest.raises(RuntimeError) as excinfo:
+            adapter.predict(_example("hello"))
+    finally:
+        adapter.close()
+
+    assert "MCP transport failed" in str(excinfo.value)
+    assert excinfo.value.attempts == 3
+
+
+def test_mcp_adapter_records_failures_without_aborting_batch() -> None:
+    factory = FakeSessionFactory(
+        tool_name="demo-tool",
+        call_tool_result=_text_result("unused"),
+    )
+
+    def responder(arguments: dict[str, Any]) -> mcp_types.CallToolResult:
+        text = arguments["input"]["text"]
+        if text == "bad":
+            raise McpError(mcp_types.ErrorData(code=mcp_types.INTERNAL_ERROR, message="boom"))
+        return _text_result(text.upper())
+
+    factory.responder = responder
+    adapter = MCPModelAdapter(
+        endpoint="http://stub",
+        model_id="demo-tool",
+        on_error="record",
+        session_factory=factory,
+    )
+    examples = [
+        Example(uid="a", inputs={"text": "good"}, expected_output=""),
+        Example(uid="b", inputs={"text": "bad"}, expected_output=""),
+        Example(uid="c", inputs={"text": "fine"}, expected_output=""),
+    ]
+
+    try:
+        responses = adapter.predict_batch(examples)
+    finally:
+        adapter.close()
+
+    assert [response.output for response in responses] == ["GOOD", None, "FINE"]
+    error = responses[1].metadata["error"]
+    assert error["type"] == "McpError"
+    assert error["attempts"] == 1
+    assert "boom" in error["message"]
+
+
+def test_mcp_adapter_retries_session_timeouts() -> None:
+    factory = FakeSessionFactory(tool_name="demo-tool", call_tool_result=_text_result("unused"))
+    timeouts = [McpError(mcp_types.ErrorData(code=408, message="Timed out while waiting for response"))]
+
+    def responder(arguments: dict[str, Any]) -> mcp_types.CallToolResult:
+        if timeouts:
+            raise timeouts.pop()
+        return _text_result("ok")
+
+    factory.responder = responder
+    adapter = MCPModelAdapter(
+        endpoint="http://stub",
+        model_id="demo-tool",
+        retry={"max_attempts": 2, "initial_delay": 0.0},
+        circuit_breaker={"failure_threshold": 5},
+        session_factory=factory,
+    )
+    try:
+        assert adapter.predict(_example("hello")).output == "ok"
+        assert factory.call_tool_calls == 2
+        assert adapter._circuit_breaker._failures == 0
+
+        timeouts.extend([McpError(mcp_types.ErrorData(code=408, message="Timed out"))] * 2)
+        failed = adapter.predict(_example("again"))
+    finally:
+        adapter.close()
+
+    # Recorded by default: one exhausted example does not abort the run.
+    assert failed.output is None
+    assert failed.metadata["error"]["attempts"] == 2
+    assert "timed out" in failed.metadata["error"]["message"]
+    assert adapter._circuit_breaker._failures == 2
+
+
+def test_process_executor_rejects_unpicklable_adapter() -> None:
+    factory = FakeSessionFactory(tool_name="demo-tool", call_tool_result=_text_result("ok"))
+    adapter = MCPModelAdapter(endpoint="http://stub", model_id="demo-tool", session_factory=factory)
+    try:
+        with pytest.raises(ValueError, match="MCPModelAdapter cannot be sent to worker processes.*'thread'"):
+            list(ProcessExecutor(workers=2).map(_BatchPredictor(adapter), [[_example("hello")]]))
+    finally:
+        adapter.close()
+
+
+def test_retry_budget_does_not_accumulate_during_healthy_traffic() -> None:
+    budget = RetryBudget(ratio=0.25, minimum=10.0)
+    for _ in range(100_000):
+        budget.record_request()
+
+    allowed = 0
+    while budget.try_spend():
+        allowed += 1
+    assert allowed == 10
+
+    for _ in range(8):
+        budget.record_request()
+    assert budget.try_spend() and budget.try_spend() and not budget.try_spend()
+
+
+def test_mcp_adapter_circuit_breaker_pauses_dispatch() -> None:
+    factory = FakeSessionFactory(
+        tool_name="demo-tool",
+        call_tool_result=_text_result("ok"),
+    )
+    adapter = MCPModelAdapter(
+        endpoint="http://stub",
+        model_id="demo-tool",
+        retry={"max_attempts": 1},
+        circuit_breaker={"failure_threshold": 2, "reset_timeout": 0.2},
+        on_error="record",
+        session_factory=factory,
+    )
+
+    factory.transport_failures = 2
+    try:
+        first = adapter.predict(_example("one"))
+        second = adapter.predict(_example("two"))
+        assert adapter._circuit_breaker.state == "open"
+
+        started = time.monotonic()
+        third = adapter.predict(_example("three"))
+        elapsed = time.monotonic() - started
+    finally:
+        adapter.close()
+
+    assert "error" in first.metadata and "error" in second.metadata
+    assert third.output == "ok"
+    assert elapsed >= 0.15
+    assert adapter._circuit_breaker.state == "closed"
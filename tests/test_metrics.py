@@ -0,0 +1,193 @@
+"""Unit tests for metric implementations."""
+
+from __future__ import annotations
+
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from eval_agent.metrics.base import MetricSuite
+from eval_agent.metrics.classification import (
+    ConfusionCounts,
+    ConfusionMatrixMetric,
+    F1ScoreMetric,
+    LabelDistributionMetric,
+    PrecisionMetric,
+    RecallMetric,
+)
+from eval_agent.metrics.generation import (
+    BleuMetric,
+    ContextPrecisionMetric,
+    RougeLMetric,
+    _lcs_length,
+    _lcs_lengths,
+)
+from eval_agent.metrics.tokenization import TokenCache
+from eval_agent.types import Example, ModelResponse
+
+
+def _pairs(labels: list[tuple[str, str]]) -> tuple[list[Example], list[ModelResponse]]:
+    examples = [Example(uid=str(idx), inputs={}, expected_output=gold) for idx, (gold, _) in enumerate(labels)]
+    responses = [ModelResponse(uid=str(idx), output=pred) for idx, (_, pred) in enumerate(labels)]
+    return examples, responses
+
+
+def test_classification_metrics_share_confusion_counts() -> None:
+    examples, responses = _pairs(
+        [("pos", "pos"), ("pos", "neg"), ("neg", "neg"), ("neu", "pos"), ("neg", "neg"), ("pos", "pos")]
+    )
+    metrics = [
+        PrecisionMetric(average="macro"),
+        RecallMetric(average="weighted"),
+        F1ScoreMetric(average="micro"),
+        ConfusionMatrixMetric(),
+        LabelDistributionMetric(),
+    ]
+    suite = MetricSuite(metrics)
+    for example, response in zip(examples, responses):
+        suite.update(example, response)
+    results = suite.finalize()
+
+    shared = {id(metric._counts) for metric in metrics}
+    assert len(shared) == 1
+    assert isinstance(metrics[0]._counts, ConfusionCounts)
+
+    standalone = [metric.compute(examples=examples, responses=responses) for metric in metrics]
+    assert [result.to_dict() for result in results] == [result.to_dict() for result in standalone]
+
+    confusion = results[3].details
+    assert confusion["labels"] == ["neg", "neu", "pos"]
+    assert confusion["matrix"] == [[2, 0, 0], [0, 0, 1], [1, 0, 2]]
+    assert results[4].details == {
+        "gold": {"neg": 2, "neu": 1, "pos": 3},
+        "predicted": {"neg": 3, "pos": 3},
+    }
+    assert results[0].details["per_label"] == {"neg": 2 / 3, "neu": 0.0, "pos": 2 / 3}
+    assert results[2].value == 4 / 6
+
+
+def _lcs_table(reference: list[str], hypothesis: list[str]) -> int:
+    lengths = [[0] * (len(hypothesis) + 1) for _ in range(len(reference) + 1)]
+    for i, ref_token in enumerate(reference, start=1):
+        for j, hyp_token in enumerate(hypothesis, start=1):
+            if ref_token == hyp_token:
+                lengths[i][j] = lengths[i - 1][j - 1] + 1
+            else:
+                lengths[i][j] = max(lengths[i - 1][j], lengths[i][j - 1])
+    return lengths[-1][-1]
+
+
+def test_bit_parallel_lcs_matches_dynamic_programming() -> None:
+    rng = random.Random(3)
+    for _ in range(500):
+        reference = [rng.choice("abcd") for _ in range(rng.randint(0, 70))]
+        hypothesis = [rng.choice("abcd") for _ in range(rng.randint(0, 70))]
+        assert _lcs_length(reference, hypothesis) == _lcs_table(reference, hypothesis)
+
+
+def test_batched_lcs_reuses_references() -> None:
+    rng = random.Random(5)
+    references = [[rng.choice("abcd") for _ in range(rng.randint(0, 70))] for _ in range(5)]
+    pairs = [
+        (rng.choice(references), [rng.choice("abcd") for _ in range(rng.randint(0, 70))]) for _ in range(200)
+    ]
+    assert _lcs_lengths(pairs) == [_lcs_table(reference, hypothesis) for reference, hypothesis in pairs]
+
+
+def test_rouge_l_scores() -> None:
+    examples, responses = _pairs([("the cat sat on the mat", "the cat on a mat"), ("", ""), ("a b", "c d")])
+    result = RougeLMetric().compute(examples=examples, responses=responses)
+
+    assert list(result.details["per_example"]) == ["0", "1", "2"]
+    assert result.details["per_example"]["0"] == 2 * (4 / 5) * (4 / 6) / (4 / 5 + 4 / 6)
+    assert result.details["per_example"]["1"] == 1.0
+    assert result.details["per_example"]["2"] == 0.0
+
+
+def test_generation_metrics_share_tokenization() -> None:
+    examples, responses = _pairs([("Paris is the capital.", "paris is the capital"), ("Blue sky", "green sky")])
+    responses[0].metadata["retrieved_documents"] = [{"text": "Paris is the capital of France"}]
+    metrics = [
+        RougeLMetric(),
+        BleuMetric(max_n=2),
+        ContextPrecisionMetric(),
+        RougeLMetric(tokenizer={"type": "regex"}, name="rouge_words"),
+    ]
+    suite = MetricSuite(metrics)
+    for example, response in zip(examples, responses):
+        suite.update(example, response)
+    results = suite.finalize()
+
+    assert metrics[0]._tokens is metrics[1]._tokens is metrics[2]._tokens
+    assert metrics[3]._tokens is not metrics[0]._tokens
+    assert isinstance(metrics[3]._tokens, TokenCache)
+
+    # Whitespace tokens keep the trailing period, regex word tokens drop it.
+    assert results[0].details["per_example"]["0"] < 1.0
+    assert results[3].details["per_example"]["0"] == 1.0
+    assert results[2].details["per_example"] == {"0": 1.0, "1": 0.0}
+
+
+def test_streaming_generation_metrics_keep_only_aggregates() -> None:
+    examples, responses = _pairs([("the cat sat", "the cat sat"), ("a b", "a c"), ("", "")])
+    responses[0].metadata["retrieved_documents"] = [{"text": "the cat sat"}]
+
+    def run(streaming: bool, **parameters) -> list:
+        metrics = [
+            RougeLMetric(**parameters),
+            BleuMetric(mode="sentence", **parameters),
+            ContextPrecisionMetric(**parameters),
+        ]
+        suite = MetricSuite(metrics, streaming=streaming)
+        for example, response in zip(examples, responses):
+            suite.update(example, response)
+        return suite.finalize()
+
+    buffered, streamed, opted_in = run(False), run(True), run(True, per_example=True)
+    assert [result.value for result in streamed] == [result.value for result in buffered]
+    assert all("per_example" not in result.details for result in streamed)
+    assert [result.details["per_example"] for result in opted_in] == [
+        result.details["per_example"] for result in buffered
+    ]
+
+
+def _reference_corpus_bleu(pairs: list[tuple[list[str], str]], max_n: int = 4) -> float:
+    matches = [0] * max_n
+    totals = [0] * max_n
+    candidate_length = reference_length = 0
+    for references, hypothesis in pairs:
+        candidate = hypothesis.lower().split()
+        tokenized = [reference.lower().split() for reference in references]
+        candidate_length += len(candidate)
+        reference_length += min((len(tokens) for tokens in tokenized), key=lambda n: (abs(n - len(candidate)), n))
+        for n in range(1, max_n + 1):
+            counts = Counter(tuple(candidate[i : i + n]) for i in range(len(candidate) - n + 1))
+            limits: Counter = Counter()
+            for tokens in tokenized:
+                limits |= Counter(tuple(tokens[i : i + n]) for i in range(len(tokens) - n + 1))
+            matches[n - 1] += sum(min(count, limits[gram]) for gram, count in counts.items())
+            totals[n - 1] += sum(counts.values())
+    log_precision = sum(math.log(m / t) for m, t in zip(matches, totals)) / max_n
+    penalty = 1.0 if candidate_length > reference_length else math.exp(1 - reference_length / candidate_length)
+    return penalty * math.exp(log_precision)
+
+
+def test_corpus_bleu_with_multiple_references() -> None:
+    pairs = [
+        (["the cat is on the mat", "there is a cat on the mat"], "the cat sat on the mat"),
+        (["a quick brown fox jumps over the lazy dog"], "the quick brown fox jumped over the lazy dog"),
+    ]
+    examples = [Example(uid=str(idx), inputs={}, expected_output=refs) for idx, (refs, _) in enumerate(pairs)]
+    responses = [ModelResponse(uid=str(idx), output=hyp) for idx, (_, hyp) in enumerate(pairs)]
+
+    corpus = BleuMetric().compute(examples=examples, responses=responses)
+    assert corpus.value == pytest.approx(_reference_corpus_bleu(pairs))
+    assert "per_example" not in corpus.details
+
+    with_scores = BleuMetric(sentence_scores=True).compute(examples=examples, responses=responses)
+    sentence = BleuMetric(mode="sentence").compute(examples=examples, responses=responses)
+    assert with_scores.value == corpus.value
+    assert with_scores.details["per_example"] == sentence.details["per_example"]
+    assert sentence.value == sum(sentence.details["per_example"].values()) / 2
@@ -0,0 +1,71 @@
+"""Tests for the scikit-learn pipeline adapter."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import joblib
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+
+from eval_agent.models.sklearn import SklearnPipelineModel
+from eval_agent.types import Example
+
+
+class CountingPipeline(Pipeline):
+    """Pipeline that records how often inference entry points are called."""
+
+    calls: dict[str, int] = {}
+
+    def predict(self, X, **params):
+        CountingPipeline.calls["predict"] = CountingPipeline.calls.get("predict", 0) + 1
+        return super().predict(X, **params)
+
+    def predict_proba(self, X, **params):
+        CountingPipeline.calls["predict_proba"] = CountingPipeline.calls.get("predict_proba", 0) + 1
+        return super().predict_proba(X, **params)
+
+
+def _train(path: Path) -> Pipeline:
+    texts = [
+        "I love this, it is fantastic",
+        "great product, works like a charm",
+        "terrible service and rude staff",
+        "the worst purchase, awful quality",
+        "it is fine, nothing special",
+        "okay product, average experience",
+    ]
+    labels = ["pos", "pos", "neg", "neg", "neu", "neu"]
+    pipeline = CountingPipeline(
+        steps=[("tfidf", TfidfVectorizer()), ("clf", LogisticRegression(max_iter=1000))]
+    )
+    pipeline.fit(texts, labels)
+    joblib.dump(pipeline, path)
+    return pipeline
+
+
+def test_predict_batch_matches_per_example_predictions(tmp_path: Path) -> None:
+    artifact = tmp_path / "pipeline.joblib"
+    reference = _train(artifact)
+    model = SklearnPipelineModel(artifact_path=artifact, label_mapping={"pos": "positive"})
+    texts = ["absolutely fantastic", "rude and awful", "fine I guess", "love it"]
+    examples = [Example(uid=str(idx), inputs={"text": text}, expected_output="") for idx, text in enumerate(texts)]
+
+    CountingPipeline.calls.clear()
+    responses = model.predict_batch(examples)
+
+    assert CountingPipeline.calls == {"predict_proba": 1}
+    assert [response.uid for response in responses] == ["0", "1", "2", "3"]
+    expected = [model._map_label(label) for label in reference.predict(texts)]
+    assert [response.output for response in responses] == expected
+
+    probabilities = reference.predict_proba(texts)
+    for response, row in zip(responses, probabilities):
+        distribution = response.metadata["probabilities"]
+        assert set(distribution) == {"positive", "neg", "neu"}
+        assert sorted(distribution.values()) == sorted(float(value) for value in row)
+
+    single = model.predict(examples[1])
+    assert single.output == responses[1].output
+    assert single.metadata == responses[1].metadata
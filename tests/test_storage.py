@@ -0,0 +1,158 @@
+"""Tests for the SQLite run store."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import replace
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from eval_agent import EvaluationAgent, load_config
+from eval_agent.api.storage import RunEntry, RunStore
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _keyword_result(tmp_path: Path):
+    config = load_config(ROOT / "configs" / "sentiment_keyword.json")
+    config.output.directory = tmp_path / "runs"
+    return EvaluationAgent(config).run()
+
+
+def test_record_runs_in_one_transaction(tmp_path: Path) -> None:
+    store = RunStore(tmp_path / "evaluations.db")
+    store.initialize()
+    result = _keyword_result(tmp_path)
+
+    run_ids = store.record_runs(
+        [
+            RunEntry("keyword", Path("keyword.json"), result),
+            RunEntry("keyword", Path("keyword.json"), result, save_predictions=False),
+        ]
+    )
+
+    assert len(set(run_ids)) == 2
+    assert [store.count_predictions(run_id) for run_id in run_ids] == [6, 0]
+    with store._pool.connection() as connection:
+        (mode,) = connection.execute("PRAGMA journal_mode").fetchone()
+    assert mode == "wal"
+    store.close()
+
+
+def test_concurrent_reads_and_writes(tmp_path: Path) -> None:
+    store = RunStore(tmp_path / "evaluations.db", pool_size=4)
+    store.initialize()
+    result = _keyword_result(tmp_path)
+    errors = []
+
+    def write() -> None:
+        try:
+            for _ in range(5):
+                store.record_run(config_name="keyword", config_path=Path("keyword.json"), result=result)
+        except Exception as exc:  # noqa: BLE001 - collected for the assertion below
+            errors.append(exc)
+
+    def read() -> None:
+        try:
+            for _ in range(20):
+                for record in store.list_runs(limit=5).items:
+                    store.list_predictions(record.id, limit=2)
+        except Exception as exc:  # noqa: BLE001 - collected for the assertion below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write) for _ in range(4)] + [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(store.list_runs(limit=100).items) == 20
+    store.close()
+
+
+def test_list_runs_pages_and_filters(tmp_path: Path) -> None:
+    store = RunStore(tmp_path / "evaluations.db")
+    store.initialize()
+    result = _keyword_result(tmp_path)
+    base = result.completed_at
+    entries = []
+    for index in range(7):
+        # Several runs share a completion time so paging must break ties by id.
+        completed_at = base + timedelta(minutes=index // 2)
+        entries.append(
+            RunEntry(
+                "even" if index % 2 == 0 else "odd",
+                Path("keyword.json"),
+                replace(result, completed_at=completed_at, predictions=[]),
+                save_predictions=False,
+            )
+        )
+    run_ids = store.record_runs(entries)
+
+    seen = []
+    cursor = None
+    while True:
+        page = store.list_runs(limit=3, cursor=cursor)
+        seen.extend(record.id for record in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert seen == sorted(run_ids, key=lambda run_id: (run_ids.index(run_id) // 2, run_id), reverse=True)
+
+    evens = store.list_runs(config_name="even").items
+    assert [record.id for record in evens] == [run_ids[6], run_ids[4], run_ids[2], run_ids[0]]
+    window = store.list_runs(
+        completed_after=base + timedelta(minutes=1),
+        completed_before=(base + timedelta(minutes=3)).replace(tzinfo=None),
+    ).items
+    assert sorted(record.id for record in window) == run_ids[2:6]
+    assert store.list_runs(task="missing").items == []
+    assert window[0].metrics[0]["name"] == "accuracy"
+    store.close()
+
+
+def test_metric_series_and_summary(tmp_path: Path) -> None:
+    store = RunStore(tmp_path / "evaluations.db")
+    store.initialize()
+    result = _keyword_result(tmp_path)
+    values = [0.5, 0.7, 0.6, 0.9]
+    entries = []
+    for index, value in enumerate(values):
+        metrics = [replace(metric, value=value) if metric.name == "accuracy" else metric for metric in result.metrics]
+        entries.append(
+            RunEntry(
+                "nightly",
+                Path("keyword.json"),
+                replace(result, metrics=metrics, completed_at=result.completed_at + timedelta(days=index)),
+                save_predictions=False,
+            )
+        )
+    entries.append(RunEntry("other", Path("keyword.json"), result, save_predictions=False))
+    store.record_runs(entries)
+
+    series = store.metric_series("accuracy", config_name="nightly", window=2)
+    assert [point.value for point in series] == values
+    assert [point.rolling_mean for point in series] == pytest.approx([0.5, 0.6, 0.65, 0.75])
+
+    (nightly,) = store.metric_summary("accuracy", config_name="nightly", percentiles=(50,))
+    assert (nightly.count, nightly.min, nightly.max, nightly.latest) == (4, 0.5, 0.9, 0.9)
+    assert nightly.mean == pytest.approx(0.675)
+    assert nightly.percentiles == {"p50": pytest.approx(0.65)}
+    assert [group.config_name for group in store.metric_summary("accuracy")] == ["nightly", "other"]
+    store.close()
+
+
+def test_initialize_extracts_legacy_metrics(tmp_path: Path) -> None:
+    store = RunStore(tmp_path / "evaluations.db")
+    store.initialize()
+    store.record_run(config_name="keyword", config_path=Path("keyword.json"), result=_keyword_result(tmp_path))
+    with store._pool.connection() as connection:
+        connection.execute("DELETE FROM run_metrics")
+        connection.execute("PRAGMA user_version = 1")
+
+    store.initialize()
+    assert [point.value for point in store.metric_series("accuracy")] == [1.0]
+    store.close()